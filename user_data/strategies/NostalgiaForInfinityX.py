@@ -4,12 +4,14 @@ import pathlib
 import rapidjson
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import talib.abstract as ta
 import pandas as pd
 from freqtrade.strategy.interface import IStrategy
-from freqtrade.strategy import merge_informative_pair, timeframe_to_minutes
+from freqtrade.strategy import timeframe_to_minutes
 from pandas import DataFrame, Series
-from functools import reduce
+from functools import reduce, lru_cache
+from collections import deque
 import math
 from typing import Optional
 from freqtrade.persistence import Trade, LocalTrade
@@ -19,6 +21,17 @@ from technical.indicators import RMI
 import time
 import warnings
 import re
+import ast
+import inspect
+import hashlib
+import operator
+import bisect
+import tracemalloc
+import csv
+import os
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 log = logging.getLogger(__name__)
 leverage_pattern = ".*(_PREMIUM|BEAR|BULL|DOWN|HALF|HEDGE|UP|[1235][SL]|-PERP|BVOL|IBVOL)/.*"
@@ -38,6 +51,24 @@ except ImportError:
 else:
   log.info("pandas_ta successfully imported")
 
+try:
+  import numba
+except ImportError:
+  numba = None
+  log.info("numba not found, the EMA/RSI banks will use TA-Lib")
+
+try:
+  import pyarrow.feather as feather
+except ImportError:
+  feather = None
+  log.info("pyarrow not found, the indicator cache is disabled")
+
+try:
+  import inotify_simple
+except ImportError:
+  inotify_simple = None
+  log.info("inotify_simple not found, the holds file will be polled")
+
 
 #############################################################################################################
 ##                NostalgiaForInfinityX by iterativ                                                        ##
@@ -159,6 +190,13 @@ class NostalgiaForInfinityX(IStrategy):
   # Do you want to use the hold feature? (with hold-trades.json)
   holdSupportEnabled = True
 
+  # Profit maximizer store: the targets are saved behind the bot loop, once no update came for the delay (at most the
+  # max delay after the first unsaved one) and on exit. Backend "json" (nfi-profit_maximizer-*.json) or "sqlite" (the
+  # custom data of the open trades in the database, live & dry-run only)
+  profit_maximizer_store_backend = "json"
+  profit_maximizer_save_delay = 1.0
+  profit_maximizer_save_max_delay = 10.0
+
   # Coin Metrics
   coin_metrics = {
     "top_traded_enabled": False,
@@ -223,6 +261,12 @@ class NostalgiaForInfinityX(IStrategy):
   # Maximizer threshold
   profit_max_threshold = 0.03
 
+  # Long mode tags
+  long_mode_tags = ["31", "32", "33", "34", "35", "36"]
+
+  # Quick mode tags
+  quick_mode_tags = ["empty", "58", "59", "60", "61", "62", "63", "64", "65"]
+
   # Rapid more tags
   rapid_mode_tags = ["66", "67", "68", "69", "70", "71", "72"]
 
@@ -235,6 +279,93 @@ class NostalgiaForInfinityX(IStrategy):
   # Run "populate_indicators()" only for new candle.
   process_only_new_candles = True
 
+  # Incremental indicators (live & dry-run only): keep the per pair indicator state and only compute the new
+  # candle(s) of the normal timeframe, falls back to a full recompute on gaps or history changes
+  incremental_indicators_enabled = False
+  # Maximum number of new candles to compute incrementally, a full recompute is done above it
+  incremental_max_new_candles = 12
+  # Minimum number of candles required for the incremental update (must cover the longest window)
+  incremental_min_candles = 600
+
+  # Lazy indicators: only compute the indicator columns read by the enabled buy conditions, their protections and
+  # the enabled sell families (plus the columns these depend on)
+  lazy_indicators_enabled = False
+
+  # On-disk cache of the analyzed dataframes (backtest & hyperopt only), keyed by the pair (and informative) data and
+  # the strategy source and settings, so the repeated runs load the indicators and signals instead of computing them
+  indicator_cache_enabled = False
+  # Maximum size of the indicator cache (MB), the least recently used entries are evicted above it
+  indicator_cache_max_size = 2048
+
+  # Evaluate the buy conditions with a compiled plan (shared sub expressions, in place boolean logic on the column
+  # arrays), same signals as the Python expressions
+  compiled_buy_conditions_enabled = True
+
+  # Sell decision tables: the "current_profit" band chains of these sell methods are compiled into a binary search on
+  # the band edges, same sell signals as the Python code
+  sell_decision_tables_enabled = True
+  sell_decision_tables_methods = [
+    "sell_over_main",
+    "sell_under_main",
+    "sell_r",
+    "sell_dec_main",
+    "sell_pump_main",
+    "sell_pivot",
+    "sell_trail",
+    "sell_recover",
+    "sell_long_mode",
+  ]
+
+  # Exit signal tables (backtest & hyperopt only): "populate_exit_trend()" evaluates these sell methods (the ones only
+  # depending on the profit and the last candle) for every candle and profit region at once, "custom_exit()" then
+  # looks up their signal instead of calling them
+  exit_signal_tables_enabled = False
+  exit_signal_tables_methods = [
+    "sell_quick_mode",
+    "sell_over_main",
+    "sell_under_main",
+    "sell_r",
+    "sell_dec_main",
+    "sell_pump_main",
+    "sell_pivot",
+  ]
+  # Exit signal memo (live & dry-run only): the same sell methods, their return memoized per pair, candle and profit
+  # region, the bot loops between two candles reusing it for the new profit
+  exit_signal_memo_enabled = False
+
+  # Tail entry signals (live & dry-run only): only evaluate the buy conditions for the new candle(s), on the last
+  # candles they look back at, the signals of the other candles are kept from the previous run
+  tail_entry_signals_enabled = False
+  # Maximum number of new candles evaluated on the tail, a full evaluation is done above it
+  tail_entry_max_new_candles = 12
+
+  # Parallel buy conditions: the compiled buy conditions are evaluated on a thread pool (numpy releases the GIL), same
+  # signals as the serial evaluation
+  parallel_buy_conditions_enabled = False
+  # Number of threads, 0 for the number of cores
+  parallel_buy_conditions_threads = 0
+
+  # Entry profiler: wall time, allocated bytes (protections vs logic) and hits per buy condition & pair, reported to
+  # "nfi-entry-profile-*.json/csv" in the user data dir (after each pair in backtests, every interval in live)
+  # The allocations are traced with "tracemalloc", which slows the whole analysis down
+  entry_profiler_enabled = False
+  # Seconds between two reports in dry-run & live
+  entry_profiler_interval = 3600
+
+  # Sell families, checked in this order in "custom_exit()"
+  sell_families_enabled = {
+    "sell_signals": True,
+    "sell_stoploss": True,
+    "sell_over_main": True,
+    "sell_under_main": True,
+    "sell_recover": True,
+    "sell_r": True,
+    "sell_trail": True,
+    "sell_dec_main": True,
+    "sell_pump_main": True,
+    "sell_pivot": True,
+  }
+
   # Exit options
   use_exit_signal = True
   exit_profit_only = False
@@ -2416,11 +2547,119 @@ class NostalgiaForInfinityX(IStrategy):
       self.insanity_dump_checks = self.config["insanity_dump_checks"]
     if "profit_max_threshold" in self.config:
       self.profit_max_threshold = self.config["profit_max_threshold"]
+    if "incremental_indicators_enabled" in self.config:
+      self.incremental_indicators_enabled = self.config["incremental_indicators_enabled"]
+    if "incremental_max_new_candles" in self.config:
+      self.incremental_max_new_candles = self.config["incremental_max_new_candles"]
+    if "incremental_min_candles" in self.config:
+      self.incremental_min_candles = self.config["incremental_min_candles"]
+    if "lazy_indicators_enabled" in self.config:
+      self.lazy_indicators_enabled = self.config["lazy_indicators_enabled"]
+    if "sell_families_enabled" in self.config:
+      self.sell_families_enabled = {**self.sell_families_enabled, **self.config["sell_families_enabled"]}
+    if "indicator_cache_enabled" in self.config:
+      self.indicator_cache_enabled = self.config["indicator_cache_enabled"]
+    if "indicator_cache_max_size" in self.config:
+      self.indicator_cache_max_size = self.config["indicator_cache_max_size"]
+    if "compiled_buy_conditions_enabled" in self.config:
+      self.compiled_buy_conditions_enabled = self.config["compiled_buy_conditions_enabled"]
+    if "sell_decision_tables_enabled" in self.config:
+      self.sell_decision_tables_enabled = self.config["sell_decision_tables_enabled"]
+    if "exit_signal_tables_enabled" in self.config:
+      self.exit_signal_tables_enabled = self.config["exit_signal_tables_enabled"]
+    if "exit_signal_memo_enabled" in self.config:
+      self.exit_signal_memo_enabled = self.config["exit_signal_memo_enabled"]
+    if "profit_maximizer_store_backend" in self.config:
+      self.profit_maximizer_store_backend = self.config["profit_maximizer_store_backend"]
+    if "profit_maximizer_save_delay" in self.config:
+      self.profit_maximizer_save_delay = self.config["profit_maximizer_save_delay"]
+    if "profit_maximizer_save_max_delay" in self.config:
+      self.profit_maximizer_save_max_delay = self.config["profit_maximizer_save_max_delay"]
+    if "tail_entry_signals_enabled" in self.config:
+      self.tail_entry_signals_enabled = self.config["tail_entry_signals_enabled"]
+    if "tail_entry_max_new_candles" in self.config:
+      self.tail_entry_max_new_candles = self.config["tail_entry_max_new_candles"]
+    if "parallel_buy_conditions_enabled" in self.config:
+      self.parallel_buy_conditions_enabled = self.config["parallel_buy_conditions_enabled"]
+    if "parallel_buy_conditions_threads" in self.config:
+      self.parallel_buy_conditions_threads = self.config["parallel_buy_conditions_threads"]
+    if "entry_profiler_enabled" in self.config:
+      self.entry_profiler_enabled = self.config["entry_profiler_enabled"]
+    if "entry_profiler_interval" in self.config:
+      self.entry_profiler_interval = self.config["entry_profiler_interval"]
+    self.incremental_indicators = {}
+    self.needed_indicators_cache = {}
+    self.indicator_cache = None
+    self.indicator_cache_keys = {}
+    self.indicator_cache_strategy_hash = None
+    self.buy_conditions_plan = None
+    self.sell_decision_tables = None
+    self.exit_signal_tables = None
+    self.exit_signal_codes = {}
+    self.exit_signal_memo = {}
+    self.buy_conditions_executor = None
+    self.candle_snapshots = {}
+    self.trade_states = {}
+    self.pair_metadata = {}
+    self.pair_metadata_whitelist = None
+    # The stake currency facts: its BTC informative pair & the BTC/ETH stake class
+    if self.config["stake_currency"] in [
+      "USDT",
+      "BUSD",
+      "USDC",
+      "DAI",
+      "TUSD",
+      "PAX",
+      "USD",
+      "EUR",
+      "GBP",
+      "TRY",
+      "BRL",
+    ]:
+      self.btc_info_pair = f"BTC/{self.config['stake_currency']}"
+    else:
+      self.btc_info_pair = "BTC/USDT"
+    self.is_btc_stake = self.config["stake_currency"] in self.btc_stakes
+    self.entry_signals = {}
+    self.entry_signals_lookback = None
+    # The mode tags as bitmasks, for the enter tag bit tests
+    self.long_mode_bits = enter_tag_bits(" ".join(self.long_mode_tags))
+    self.quick_mode_bits = enter_tag_bits(" ".join(self.quick_mode_tags))
+    self.rapid_mode_bits = enter_tag_bits(" ".join(self.rapid_mode_tags))
+    self.half_mode_bits = enter_tag_bits(" ".join(self.half_mode_tags))
+    if (
+      self.indicator_cache_enabled
+      and feather is not None
+      and self.config["runmode"].value in ("backtest", "hyperopt")
+    ):
+      self.indicator_cache = IndicatorCache(
+        self.config["user_data_dir"] / "nfi-indicator-cache", self.indicator_cache_max_size
+      )
+    self.entry_profiler = None
+    if self.entry_profiler_enabled:
+      self.entry_profiler = EntryProfiler(
+        self.config["user_data_dir"]
+        / (
+          "nfi-entry-profile-"
+          + (self.config["bot_name"] + "-" if "bot_name" in self.config else "")
+          + self.config["exchange"]["name"]
+          + "-"
+          + self.config["stake_currency"]
+          + ("-(backtest)" if (self.config["runmode"].value == "backtest") else "")
+        ),
+        0 if self.config["runmode"].value in ("backtest", "hyperopt") else self.entry_profiler_interval,
+      )
+    self.btc_informative_cache = {}
     if self.target_profit_cache is None:
       bot_name = ""
       if "bot_name" in self.config:
         bot_name = self.config["bot_name"] + "-"
-      self.target_profit_cache = Cache(
+      backend = self.profit_maximizer_store_backend
+      if backend == "sqlite" and (
+        self.config["runmode"].value not in ("live", "dry_run") or not hasattr(Trade, "set_custom_data")
+      ):
+        backend = "json"
+      self.target_profit_cache = ProfitTargetStore(
         self.config["user_data_dir"]
         / (
           "nfi-profit_maximizer-"
@@ -2430,7 +2669,10 @@ class NostalgiaForInfinityX(IStrategy):
           + self.config["stake_currency"]
           + ("-(backtest)" if (self.config["runmode"].value == "backtest") else "")
           + ".json"
-        )
+        ),
+        backend,
+        self.profit_maximizer_save_delay,
+        self.profit_maximizer_save_max_delay,
       )
 
     # If the cached data hasn't changed, it's a no-op
@@ -2609,6 +2851,12 @@ class NostalgiaForInfinityX(IStrategy):
   def is_top_coin(self, coin_pair, row_data, top_length) -> bool:
     return coin_pair.split("/")[0] in row_data.loc["Coin #1" : f"Coin #{top_length}"].values
 
+  def bot_start(self, **kwargs) -> None:
+    if self.target_profit_cache is not None and self.target_profit_cache.backend == "sqlite":
+      self.target_profit_cache.load_custom_data()
+
+    return super().bot_start(**kwargs)
+
   def bot_loop_start(self, **kwargs) -> None:
     """
     Called at the start of the bot iteration (one loop).
@@ -2628,11 +2876,50 @@ class NostalgiaForInfinityX(IStrategy):
     if self.config["runmode"].value not in ("live", "dry_run"):
       return super().bot_loop_start(**kwargs)
 
+    # Pair metadata, rebuilt on a whitelist change (built on demand in backtest & hyperopt)
+    self.update_pair_metadata()
+
     if self.holdSupportEnabled:
       self.load_hold_trades_config()
 
     return super().bot_loop_start(**kwargs)
 
+  def get_candle_snapshot(self, pair: str) -> "CandleSnapshot":
+    # The last candles of the analyzed dataframe, built once per analysis & candle and shared by the callbacks
+    dataframe, refreshed = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+    key = (refreshed, len(dataframe), dataframe.index[-1] if len(dataframe) > 0 else None)
+    snapshot = self.candle_snapshots.get(pair)
+    if snapshot is None or snapshot.key != key:
+      snapshot = self.candle_snapshots[pair] = CandleSnapshot(key, dataframe)
+    return snapshot
+
+  def update_pair_metadata(self):
+    # The whitelisted pairs, the other ones (trades on a pair out of the whitelist) are built on demand
+    whitelist = self.dp.current_whitelist()
+    if whitelist != self.pair_metadata_whitelist:
+      self.pair_metadata = {pair: self.get_pair_metadata(pair) for pair in whitelist}
+      self.pair_metadata_whitelist = list(whitelist)
+
+  def get_pair_metadata(self, pair: str) -> "PairMetadata":
+    metadata = self.pair_metadata.get(pair)
+    if metadata is None:
+      metadata = self.pair_metadata[pair] = PairMetadata(pair)
+    return metadata
+
+  def get_trade_state(self, trade: "Trade") -> "TradeState":
+    # The facts derived from the orders & tags of the trade, rebuilt when a fill or a new order changes them
+    key = (
+      trade.pair,
+      trade.open_date_utc,
+      getattr(trade, "enter_tag", None),
+      trade.amount,
+      len(trade.orders) if hasattr(trade, "orders") else 0,
+    )
+    state = self.trade_states.get(trade.id)
+    if state is None or state.key != key:
+      state = self.trade_states[trade.id] = TradeState(key, trade)
+    return state
+
   def get_ticker_indicator(self):
     return int(self.timeframe[:-1])
 
@@ -2654,10 +2941,10 @@ class NostalgiaForInfinityX(IStrategy):
         use_mode = self.config["rebuy_mode"]
       if "use_alt_rebuys" in self.config and self.config["use_alt_rebuys"]:
         use_mode = 1
-      enter_tags = entry_tag.split()
-      if all(c in self.rapid_mode_tags for c in enter_tags):
+      enter_bits = enter_tag_bits(entry_tag)
+      if is_enter_tag_mode(enter_bits, self.rapid_mode_bits):
         use_mode = 2
-      if all(c in self.half_mode_tags for c in enter_tags):
+      if is_enter_tag_mode(enter_bits, self.half_mode_bits):
         use_mode = 5
       if 0 <= use_mode <= 5:
         return proposed_stake * self.__getattribute__(f"max_rebuy_multiplier_{use_mode}")
@@ -2689,43 +2976,36 @@ class NostalgiaForInfinityX(IStrategy):
     ):
       return None
 
-    enter_tag = "empty"
-    if hasattr(trade, "enter_tag") and trade.enter_tag is not None:
-      enter_tag = trade.enter_tag
-    enter_tags = enter_tag.split()
+    trade_state = self.get_trade_state(trade)
+    enter_bits = trade_state.enter_bits
 
-    dataframe, _ = self.dp.get_analyzed_dataframe(trade.pair, self.timeframe)
-    if len(dataframe) < 2:
+    snapshot = self.get_candle_snapshot(trade.pair)
+    if snapshot.length < 2:
       return None
-    last_candle = dataframe.iloc[-1].squeeze()
-    previous_candle = dataframe.iloc[-2].squeeze()
+    last_candle = snapshot.candles[0]
+    previous_candle = snapshot.candles[1]
 
-    count_of_entries = 0
-    if hasattr(trade, "enter_side"):
-      filled_entries = trade.select_filled_orders(trade.enter_side)
-      count_of_entries = trade.nr_of_successful_entries
-    else:
-      filled_entries = trade.select_filled_orders("buy")
-      count_of_entries = len(filled_entries)
+    count_of_entries = trade_state.count_of_entries
+    initial_entry_cost = trade_state.initial_entry_cost
 
     if count_of_entries == 0:
       return None
 
     use_mode = self.rebuy_mode
-    is_leverage = bool(re.match(leverage_pattern, trade.pair))
+    is_leverage = self.get_pair_metadata(trade.pair).is_leverage
     if (is_leverage) and ("do_not_use_leverage_rebuys" in self.config and self.config["do_not_use_leverage_rebuys"]):
       return None
 
     # if to use alternate rebuy scheme
     use_alt = False
     use_alt_2 = False
-    if (use_mode == 0) and ((filled_entries[0].cost * (self.rebuy_multi_0 + (count_of_entries * 0.005))) < min_stake):
+    if (use_mode == 0) and ((initial_entry_cost * (self.rebuy_multi_0 + (count_of_entries * 0.005))) < min_stake):
       use_alt = True
-    if (use_mode == 2) and ((filled_entries[0].cost * (self.rebuy_multi_2 + (count_of_entries * 0.005))) < min_stake):
+    if (use_mode == 2) and ((initial_entry_cost * (self.rebuy_multi_2 + (count_of_entries * 0.005))) < min_stake):
       use_alt_2 = True
-    if (use_mode == 3) and ((filled_entries[0].cost * (self.rebuy_multi_3 + (count_of_entries * 0.005))) < min_stake):
+    if (use_mode == 3) and ((initial_entry_cost * (self.rebuy_multi_3 + (count_of_entries * 0.005))) < min_stake):
       use_alt = True
-    if (use_mode == 4) and ((filled_entries[0].cost * (self.rebuy_multi_4 + (count_of_entries * 0.005))) < min_stake):
+    if (use_mode == 4) and ((initial_entry_cost * (self.rebuy_multi_4 + (count_of_entries * 0.005))) < min_stake):
       use_alt = True
 
     if "use_alt_rebuys" in self.config and self.config["use_alt_rebuys"]:
@@ -2734,9 +3014,9 @@ class NostalgiaForInfinityX(IStrategy):
     if use_alt:
       use_mode = 1
 
-    if all(c in self.rapid_mode_tags for c in enter_tags):
+    if is_enter_tag_mode(enter_bits, self.rapid_mode_bits):
       use_mode = 2
-    if all(c in self.half_mode_tags for c in enter_tags):
+    if is_enter_tag_mode(enter_bits, self.half_mode_bits):
       use_mode = 5
 
     is_rebuy = False
@@ -2868,7 +3148,7 @@ class NostalgiaForInfinityX(IStrategy):
     ):
       try:
         # This returns first order stake size
-        stake_amount = filled_entries[0].cost
+        stake_amount = initial_entry_cost
         # This then calculates current safety order size
         if use_mode == 0:
           stake_amount = stake_amount * (self.rebuy_multi_0 + (count_of_entries * 0.005))
@@ -3024,15 +3304,12 @@ class NostalgiaForInfinityX(IStrategy):
   ) -> tuple:
     is_backtest = self.dp.runmode.value == "backtest"
 
-    count_of_buys = 1
-    if hasattr(trade, "select_filled_orders"):
-      filled_buys = trade.select_filled_orders("buy")
-      count_of_buys = len(filled_buys)
+    trade_state = self.get_trade_state(trade)
     # If 2 rebuys or more
-    is_rebuy = count_of_buys > 2
-    is_leverage = bool(re.match(leverage_pattern, trade.pair))
+    is_rebuy = trade_state.count_of_buys > 2
+    is_leverage = self.get_pair_metadata(trade.pair).is_leverage
     stop_index = 0 if is_rebuy and not is_leverage else 1 if not is_rebuy and not is_leverage else 2
-    is_btc_stake = self.config["stake_currency"] in self.btc_stakes
+    is_btc_stake = self.is_btc_stake
 
     # Absolute limit, just in case...
     if (
@@ -26812,7 +27089,7 @@ class NostalgiaForInfinityX(IStrategy):
     if (0.04 > current_profit > 0.01) and (last_candle["r_14"] >= -0.1):
       return True, "sell_profit_rpd_3"
 
-    is_leverage = bool(re.match(leverage_pattern, trade.pair))
+    is_leverage = self.get_pair_metadata(trade.pair).is_leverage
     stop_index = 0 if not is_leverage else 1
     if current_profit < [-0.35, -0.35][stop_index]:
       return True, "sell_stoploss_rpd_stop_1"
@@ -26828,7 +27105,7 @@ class NostalgiaForInfinityX(IStrategy):
     last_candle,
     previous_candle_1,
   ) -> tuple:
-    is_leverage = bool(re.match(leverage_pattern, trade.pair))
+    is_leverage = self.get_pair_metadata(trade.pair).is_leverage
     stop_index = 0 if not is_leverage else 1
     if current_profit < [-0.35, -0.35][stop_index]:
       return True, "sell_stoploss_hlf_stop_1"
@@ -26866,7 +27143,7 @@ class NostalgiaForInfinityX(IStrategy):
     previous_profit,
     previous_sell_reason,
     previous_time_profit_reached,
-    enter_tags,
+    enter_bits,
   ) -> tuple:
     if self.profit_max_enabled:
       if previous_sell_reason in ["sell_stoploss_u_e_1"]:
@@ -26897,7 +27174,7 @@ class NostalgiaForInfinityX(IStrategy):
       ]:
         if current_profit < (previous_profit - 0.005):
           return True, previous_sell_reason
-      elif all(c in self.rapid_mode_tags for c in enter_tags):
+      elif is_enter_tag_mode(enter_bits, self.rapid_mode_bits):
         if current_profit < 0.01:
           if (current_profit < (previous_profit - 0.005)) or (last_candle["rsi_14"] > 90.0):
             return True, previous_sell_reason
@@ -26919,7 +27196,7 @@ class NostalgiaForInfinityX(IStrategy):
         elif 0.12 <= current_profit:
           if (current_profit < (previous_profit - 0.03)) or (last_candle["rsi_14"] > 90.0):
             return True, previous_sell_reason
-      elif all(c in self.half_mode_tags for c in enter_tags):
+      elif is_enter_tag_mode(enter_bits, self.half_mode_bits):
         if 0.001 <= current_profit < 0.01:
           if (current_profit < (previous_profit - 0.005)) or (last_candle["rsi_14"] > 90.0):
             return True, previous_sell_reason
@@ -26991,41 +27268,33 @@ class NostalgiaForInfinityX(IStrategy):
   def custom_exit(
     self, pair: str, trade: "Trade", current_time: "datetime", current_rate: float, current_profit: float, **kwargs
   ):
-    dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-    if len(dataframe) < 6:
+    self.load_sell_decision_tables()
+    snapshot = self.get_candle_snapshot(pair)
+    if snapshot.length < 6:
       return None
-    last_candle = dataframe.iloc[-1].squeeze()
-    previous_candle_1 = dataframe.iloc[-2].squeeze()
-    previous_candle_2 = dataframe.iloc[-3].squeeze()
-    previous_candle_3 = dataframe.iloc[-4].squeeze()
-    previous_candle_4 = dataframe.iloc[-5].squeeze()
-    previous_candle_5 = dataframe.iloc[-6].squeeze()
-
-    enter_tag = "empty"
-    if hasattr(trade, "enter_tag") and trade.enter_tag is not None:
-      enter_tag = trade.enter_tag
-    enter_tags = enter_tag.split()
+    (
+      last_candle,
+      previous_candle_1,
+      previous_candle_2,
+      previous_candle_3,
+      previous_candle_4,
+      previous_candle_5,
+    ) = snapshot.candles
+
+    trade_state = self.get_trade_state(trade)
+    enter_tag = trade_state.enter_tag
+    enter_bits = trade_state.enter_bits
 
     max_profit = (trade.max_rate - trade.open_rate) / trade.open_rate
     max_loss = (trade.open_rate - trade.min_rate) / trade.min_rate
 
-    if hasattr(trade, "select_filled_orders"):
-      count_of_entries = 1
-      if hasattr(trade, "enter_side"):
-        filled_entries = trade.select_filled_orders(trade.enter_side)
-        count_of_entries = trade.nr_of_successful_entries
-      else:
-        filled_entries = trade.select_filled_orders("buy")
-        count_of_entries = len(filled_entries)
-      if count_of_entries > 1:
-        initial_entry = filled_entries[0]
-        if initial_entry is not None and initial_entry.average is not None:
-          max_profit = (trade.max_rate - initial_entry.average) / initial_entry.average
-          max_loss = (initial_entry.average - trade.min_rate) / trade.min_rate
+    if trade_state.initial_entry_average is not None:
+      max_profit = (trade.max_rate - trade_state.initial_entry_average) / trade_state.initial_entry_average
+      max_loss = (trade_state.initial_entry_average - trade.min_rate) / trade.min_rate
 
     sell = False
     signal_name = None
-    is_long_mode = all(c in ["31", "32", "33", "34", "35", "36"] for c in enter_tags)
+    is_long_mode = is_enter_tag_mode(enter_bits, self.long_mode_bits)
 
     # Long mode
     if is_long_mode:
@@ -27046,25 +27315,35 @@ class NostalgiaForInfinityX(IStrategy):
 
     # Quick sell mode
     if not sell and not is_long_mode:
-      if all(c in ["empty", "58", "59", "60", "61", "62", "63", "64", "65"] for c in enter_tags):
-        sell, signal_name = self.sell_quick_mode(current_profit, max_profit, last_candle, previous_candle_1)
+      if is_enter_tag_mode(enter_bits, self.quick_mode_bits):
+        sell, signal_name = self.exit_table_signal(
+          pair,
+          "sell_quick_mode",
+          current_profit,
+          last_candle,
+          self.sell_quick_mode,
+          current_profit,
+          max_profit,
+          last_candle,
+          previous_candle_1,
+        )
 
     # Rapid sell mode
     if not sell and not is_long_mode:
-      if all(c in self.rapid_mode_tags for c in enter_tags):
+      if is_enter_tag_mode(enter_bits, self.rapid_mode_bits):
         sell, signal_name = self.sell_rapid_mode(
           trade, current_time, current_profit, max_profit, last_candle, previous_candle_1
         )
 
     # Half mode sells
     if not sell and not is_long_mode:
-      if all(c in self.half_mode_tags for c in enter_tags):
+      if is_enter_tag_mode(enter_bits, self.half_mode_bits):
         sell, signal_name = self.sell_half_mode(
           trade, current_time, current_profit, max_profit, last_candle, previous_candle_1
         )
 
     # Original sell signals
-    if not sell and not is_long_mode:
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_signals"]:
       sell, signal_name = self.sell_signals(
         current_profit,
         max_profit,
@@ -27081,49 +27360,79 @@ class NostalgiaForInfinityX(IStrategy):
       )
 
     # Stoplosses
-    if not sell and not is_long_mode:
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_stoploss"]:
       sell, signal_name = self.sell_stoploss(
         current_profit, max_profit, max_loss, last_candle, previous_candle_1, trade, current_time
       )
 
     # Over EMA200, main profit targets
-    if not sell and not is_long_mode:
-      sell, signal_name = self.sell_over_main(current_profit, last_candle)
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_over_main"]:
+      sell, signal_name = self.exit_table_signal(
+        pair, "sell_over_main", current_profit, last_candle, self.sell_over_main, current_profit, last_candle
+      )
 
     # Under EMA200, main profit targets
-    if not sell and not is_long_mode:
-      sell, signal_name = self.sell_under_main(current_profit, last_candle)
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_under_main"]:
+      sell, signal_name = self.exit_table_signal(
+        pair, "sell_under_main", current_profit, last_candle, self.sell_under_main, current_profit, last_candle
+      )
 
     # Recover
-    if not sell and not is_long_mode:
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_recover"]:
       sell, signal_name = self.sell_recover(
         current_profit, max_profit, max_loss, last_candle, previous_candle_1, trade, current_time
       )
 
     # Williams %R based sells
-    if not sell and not is_long_mode:
-      sell, signal_name = self.sell_r(
-        current_profit, max_profit, max_loss, last_candle, previous_candle_1, trade, current_time
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_r"]:
+      sell, signal_name = self.exit_table_signal(
+        pair,
+        "sell_r",
+        current_profit,
+        last_candle,
+        self.sell_r,
+        current_profit,
+        max_profit,
+        max_loss,
+        last_candle,
+        previous_candle_1,
+        trade,
+        current_time,
       )
 
     # Trailing
-    if not sell and not is_long_mode:
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_trail"]:
       sell, signal_name = self.sell_trail(
         current_profit, max_profit, max_loss, last_candle, previous_candle_1, trade, current_time
       )
 
     # The pair is descending
-    if not sell and not is_long_mode:
-      sell, signal_name = self.sell_dec_main(current_profit, last_candle)
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_dec_main"]:
+      sell, signal_name = self.exit_table_signal(
+        pair, "sell_dec_main", current_profit, last_candle, self.sell_dec_main, current_profit, last_candle
+      )
 
     # Sell logic for pumped pairs
-    if not sell and not is_long_mode:
-      sell, signal_name = self.sell_pump_main(current_profit, last_candle)
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_pump_main"]:
+      sell, signal_name = self.exit_table_signal(
+        pair, "sell_pump_main", current_profit, last_candle, self.sell_pump_main, current_profit, last_candle
+      )
 
     # Pivot points based sells
-    if not sell and not is_long_mode:
-      sell, signal_name = self.sell_pivot(
-        current_profit, max_profit, max_loss, last_candle, previous_candle_1, trade, current_time
+    if not sell and not is_long_mode and self.sell_families_enabled["sell_pivot"]:
+      sell, signal_name = self.exit_table_signal(
+        pair,
+        "sell_pivot",
+        current_profit,
+        last_candle,
+        self.sell_pivot,
+        current_profit,
+        max_profit,
+        max_loss,
+        last_candle,
+        previous_candle_1,
+        trade,
+        current_time,
       )
 
     # Profit Target Signal
@@ -27146,7 +27455,7 @@ class NostalgiaForInfinityX(IStrategy):
         previous_profit,
         previous_sell_reason,
         previous_time_profit_reached,
-        enter_tags,
+        enter_bits,
       )
       if sell_max and signal_name_max is not None:
         return f"{signal_name_max}_m ( {enter_tag})"
@@ -27204,43 +27513,47 @@ class NostalgiaForInfinityX(IStrategy):
           "sell_stoploss_hlf_stop_1",
         ]
       )
-      # and (not all(c in self.half_mode_tags for c in enter_tags))
+      # and (not is_enter_tag_mode(enter_bits, self.half_mode_bits))
     ):
       if sell and (signal_name is not None):
         return f"{signal_name} ( {enter_tag})"
 
     return None
 
-  def range_percent_change(self, dataframe: DataFrame, method, length: int) -> float:
+  def range_percent_change(self, dataframe: DataFrame, method, length: int, extrema=None) -> float:
     """
     Rolling Percentage Change Maximum across interval.
 
     :param dataframe: DataFrame The original OHLC dataframe
     :param method: High to Low / Open to Close
     :param length: int The length to look back
+    :param extrema: RollingExtrema Shared rolling max/min of the dataframe (optional)
     """
+    if extrema is None:
+      extrema = RollingExtrema(dataframe)
     if method == "HL":
-      return (dataframe["high"].rolling(length).max() - dataframe["low"].rolling(length).min()) / dataframe[
-        "low"
-      ].rolling(length).min()
+      lowest_low = extrema.min("low", length)
+      return (extrema.max("high", length) - lowest_low) / lowest_low
     elif method == "OC":
-      return (dataframe["open"].rolling(length).max() - dataframe["close"].rolling(length).min()) / dataframe[
-        "close"
-      ].rolling(length).min()
+      lowest_close = extrema.min("close", length)
+      return (extrema.max("open", length) - lowest_close) / lowest_close
     else:
       raise ValueError(f"Method {method} not defined!")
 
-  def top_percent_change(self, dataframe: DataFrame, length: int) -> float:
+  def top_percent_change(self, dataframe: DataFrame, length: int, extrema=None) -> float:
     """
     Percentage change of the current close from the range maximum Open price
 
     :param dataframe: DataFrame The original OHLC dataframe
     :param length: int The length to look back
+    :param extrema: RollingExtrema Shared rolling max/min of the dataframe (optional)
     """
     if length == 0:
       return (dataframe["open"] - dataframe["close"]) / dataframe["close"]
     else:
-      return (dataframe["open"].rolling(length).max() - dataframe["close"]) / dataframe["close"]
+      if extrema is None:
+        extrema = RollingExtrema(dataframe)
+      return (extrema.max("open", length) - dataframe["close"]) / dataframe["close"]
 
   def informative_pairs(self):
     # get access to all pairs available in whitelist.
@@ -27250,22 +27563,7 @@ class NostalgiaForInfinityX(IStrategy):
     informative_pairs.extend([(pair, self.info_timeframe_1d) for pair in pairs])
     informative_pairs.extend([(pair, self.info_timeframe_15m) for pair in pairs])
 
-    if self.config["stake_currency"] in [
-      "USDT",
-      "BUSD",
-      "USDC",
-      "DAI",
-      "TUSD",
-      "PAX",
-      "USD",
-      "EUR",
-      "GBP",
-      "TRY",
-      "BRL",
-    ]:
-      btc_info_pair = f"BTC/{self.config['stake_currency']}"
-    else:
-      btc_info_pair = "BTC/USDT"
+    btc_info_pair = self.btc_info_pair
 
     informative_pairs.append((btc_info_pair, self.timeframe))
     informative_pairs.append((btc_info_pair, self.info_timeframe_1d))
@@ -27278,6 +27576,7 @@ class NostalgiaForInfinityX(IStrategy):
     assert self.dp, "DataProvider is required for multiple timeframes."
     # Get the informative pair
     informative_1d = self.dp.get_pair_dataframe(pair=metadata["pair"], timeframe=self.info_timeframe_1d)
+    needed = self.needed_indicators(self.info_timeframe_1d)
 
     # Top traded coins
     if self.coin_metrics["top_traded_enabled"]:
@@ -27297,43 +27596,42 @@ class NostalgiaForInfinityX(IStrategy):
       informative_1d.drop(columns=column_names, inplace=True)
 
     # Pivots
-    (
-      informative_1d["pivot"],
-      informative_1d["res1"],
-      informative_1d["res2"],
-      informative_1d["res3"],
-      informative_1d["sup1"],
-      informative_1d["sup2"],
-      informative_1d["sup3"],
-    ) = pivot_points(informative_1d, mode="fibonacci")
+    if indicators_needed(needed, "pivot", "res1", "res2", "res3", "sup1", "sup2", "sup3"):
+      (
+        informative_1d["pivot"],
+        informative_1d["res1"],
+        informative_1d["res2"],
+        informative_1d["res3"],
+        informative_1d["sup1"],
+        informative_1d["sup2"],
+        informative_1d["sup3"],
+      ) = pivot_points(informative_1d, mode="fibonacci")
 
     # Smoothed Heikin-Ashi
-    informative_1d["open_sha"], informative_1d["close_sha"], informative_1d["low_sha"] = heikin_ashi(
-      informative_1d, smooth_inputs=True, smooth_outputs=False, length=10
-    )
+    if indicators_needed(needed, "open_sha", "close_sha", "low_sha"):
+      informative_1d["open_sha"], informative_1d["close_sha"], informative_1d["low_sha"] = heikin_ashi(
+        informative_1d, smooth_inputs=True, smooth_outputs=False, length=10
+      )
 
     # S/R
-    res_series = (
-      informative_1d["high"].rolling(window=5, center=True).apply(lambda row: is_resistance(row), raw=True).shift(2)
-    )
-    sup_series = (
-      informative_1d["low"].rolling(window=5, center=True).apply(lambda row: is_support(row), raw=True).shift(2)
-    )
-    informative_1d["res_level"] = Series(
-      np.where(
-        res_series,
-        np.where(informative_1d["close"] > informative_1d["open"], informative_1d["close"], informative_1d["open"]),
-        float("NaN"),
-      )
-    ).ffill()
-    informative_1d["res_hlevel"] = Series(np.where(res_series, informative_1d["high"], float("NaN"))).ffill()
-    informative_1d["sup_level"] = Series(
-      np.where(
-        sup_series,
-        np.where(informative_1d["close"] < informative_1d["open"], informative_1d["close"], informative_1d["open"]),
-        float("NaN"),
-      )
-    ).ffill()
+    if indicators_needed(needed, "res_level", "res_hlevel", "sup_level"):
+      res_series = rolling_resistance(informative_1d["high"], window=5)
+      sup_series = rolling_support(informative_1d["low"], window=5)
+      informative_1d["res_level"] = Series(
+        np.where(
+          res_series,
+          np.where(informative_1d["close"] > informative_1d["open"], informative_1d["close"], informative_1d["open"]),
+          float("NaN"),
+        )
+      ).ffill()
+      informative_1d["res_hlevel"] = Series(np.where(res_series, informative_1d["high"], float("NaN"))).ffill()
+      informative_1d["sup_level"] = Series(
+        np.where(
+          sup_series,
+          np.where(informative_1d["close"] < informative_1d["open"], informative_1d["close"], informative_1d["open"]),
+          float("NaN"),
+        )
+      ).ffill()
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] informative_1d_indicators took: {tok - tik:0.4f} seconds.")
@@ -27345,97 +27643,119 @@ class NostalgiaForInfinityX(IStrategy):
     assert self.dp, "DataProvider is required for multiple timeframes."
     # Get the informative pair
     informative_1h = self.dp.get_pair_dataframe(pair=metadata["pair"], timeframe=self.info_timeframe_1h)
+    needed = self.needed_indicators(self.info_timeframe_1h)
+
+    # Shared rolling windows
+    extrema_1h = RollingExtrema(informative_1h)
 
     # RSI
-    informative_1h["rsi_14"] = ta.RSI(informative_1h, timeperiod=14)
+    if indicators_needed(needed, "rsi_14"):
+      rsi_3, informative_1h["rsi_14"] = rsi_bank(informative_1h["close"], [3, 14])
 
     # EMAs
-    informative_1h["ema_12"] = ta.EMA(informative_1h, timeperiod=12)
-    informative_1h["ema_20"] = ta.EMA(informative_1h, timeperiod=20)
-    informative_1h["ema_25"] = ta.EMA(informative_1h, timeperiod=25)
-    informative_1h["ema_35"] = ta.EMA(informative_1h, timeperiod=35)
-    informative_1h["ema_50"] = ta.EMA(informative_1h, timeperiod=50)
-    informative_1h["ema_100"] = ta.EMA(informative_1h, timeperiod=100)
-    informative_1h["ema_200"] = ta.EMA(informative_1h, timeperiod=200)
+    if indicators_needed(needed, "ema_12", "ema_20", "ema_25", "ema_35", "ema_50", "ema_100", "ema_200"):
+      emas = ema_bank(informative_1h["close"], [12, 20, 25, 35, 50, 100, 200])
+      informative_1h["ema_12"] = emas[0]
+      informative_1h["ema_20"] = emas[1]
+      informative_1h["ema_25"] = emas[2]
+      informative_1h["ema_35"] = emas[3]
+      informative_1h["ema_50"] = emas[4]
+      informative_1h["ema_100"] = emas[5]
+      informative_1h["ema_200"] = emas[6]
 
     # SMA
-    informative_1h["sma_200"] = ta.SMA(informative_1h, timeperiod=200)
+    if indicators_needed(needed, "sma_200", "sma_200_dec_20", "sma_200_dec_24"):
+      informative_1h["sma_200"] = RollingSum(informative_1h["close"]).mean(200)
 
-    informative_1h["sma_200_dec_20"] = informative_1h["sma_200"] < informative_1h["sma_200"].shift(20)
-    informative_1h["sma_200_dec_24"] = informative_1h["sma_200"] < informative_1h["sma_200"].shift(24)
+      informative_1h["sma_200_dec_20"] = informative_1h["sma_200"] < informative_1h["sma_200"].shift(20)
+      informative_1h["sma_200_dec_24"] = informative_1h["sma_200"] < informative_1h["sma_200"].shift(24)
 
     # BB
-    bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(informative_1h), window=20, stds=2)
-    informative_1h["bb20_2_low"] = bollinger["lower"]
-    informative_1h["bb20_2_mid"] = bollinger["mid"]
-    informative_1h["bb20_2_upp"] = bollinger["upper"]
+    if indicators_needed(needed, "bb20_2_low", "bb20_2_mid", "bb20_2_upp", "bb20_width"):
+      bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(informative_1h), window=20, stds=2)
+      informative_1h["bb20_2_low"] = bollinger["lower"]
+      informative_1h["bb20_2_mid"] = bollinger["mid"]
+      informative_1h["bb20_2_upp"] = bollinger["upper"]
 
-    informative_1h["bb20_width"] = (informative_1h["bb20_2_upp"] - informative_1h["bb20_2_low"]) / informative_1h[
-      "bb20_2_mid"
-    ]
+      informative_1h["bb20_width"] = (informative_1h["bb20_2_upp"] - informative_1h["bb20_2_low"]) / informative_1h[
+        "bb20_2_mid"
+      ]
 
     # CMF
-    informative_1h["cmf"] = chaikin_money_flow(informative_1h, 20)
+    if indicators_needed(needed, "cmf"):
+      informative_1h["cmf"] = chaikin_money_flow(informative_1h, 20)
 
     # CTI
-    informative_1h["cti"] = pta.cti(informative_1h["close"], length=20)
+    if indicators_needed(needed, "cti"):
+      informative_1h["cti"] = pta.cti(informative_1h["close"], length=20)
 
     # CRSI (3, 2, 100)
-    crsi_closechange = informative_1h["close"] / informative_1h["close"].shift(1)
-    crsi_updown = np.where(crsi_closechange.gt(1), 1.0, np.where(crsi_closechange.lt(1), -1.0, 0.0))
-    informative_1h["crsi"] = (
-      ta.RSI(informative_1h["close"], timeperiod=3)
-      + ta.RSI(crsi_updown, timeperiod=2)
-      + ta.ROC(informative_1h["close"], 100)
-    ) / 3
+    if indicators_needed(needed, "crsi"):
+      crsi_closechange = informative_1h["close"] / informative_1h["close"].shift(1)
+      crsi_updown = np.where(crsi_closechange.gt(1), 1.0, np.where(crsi_closechange.lt(1), -1.0, 0.0))
+      informative_1h["crsi"] = (
+        rsi_3
+        + ta.RSI(crsi_updown, timeperiod=2)
+        + ta.ROC(informative_1h["close"], 100)
+      ) / 3
 
     # Williams %R
-    informative_1h["r_14"] = williams_r(informative_1h, period=14)
-    informative_1h["r_480"] = williams_r(informative_1h, period=480)
+    if indicators_needed(needed, "r_14", "r_480"):
+      informative_1h["r_14"] = williams_r(informative_1h, period=14, extrema=extrema_1h)
+      informative_1h["r_480"] = williams_r(informative_1h, period=480, extrema=extrema_1h)
 
     # EWO
-    informative_1h["ewo"] = ewo(informative_1h, 50, 200)
+    if indicators_needed(needed, "ewo"):
+      informative_1h["ewo"] = ewo(informative_1h, 50, 200)
 
     # ROC
-    informative_1h["roc_9"] = ta.ROC(informative_1h, timeperiod=9)
+    if indicators_needed(needed, "roc_9"):
+      informative_1h["roc_9"] = ta.ROC(informative_1h, timeperiod=9)
 
     # T3 Average
-    informative_1h["t3_avg"] = t3_average(informative_1h)
+    if indicators_needed(needed, "t3_avg"):
+      informative_1h["t3_avg"] = t3_average(informative_1h)
 
     # S/R
-    res_series = (
-      informative_1h["high"].rolling(window=5, center=True).apply(lambda row: is_resistance(row), raw=True).shift(2)
-    )
-    sup_series = (
-      informative_1h["low"].rolling(window=5, center=True).apply(lambda row: is_support(row), raw=True).shift(2)
-    )
-    informative_1h["res_level"] = Series(
-      np.where(
-        res_series,
-        np.where(informative_1h["close"] > informative_1h["open"], informative_1h["close"], informative_1h["open"]),
-        float("NaN"),
-      )
-    ).ffill()
-    informative_1h["res_hlevel"] = Series(np.where(res_series, informative_1h["high"], float("NaN"))).ffill()
-    informative_1h["sup_level"] = Series(
-      np.where(
-        sup_series,
-        np.where(informative_1h["close"] < informative_1h["open"], informative_1h["close"], informative_1h["open"]),
-        float("NaN"),
-      )
-    ).ffill()
+    if indicators_needed(needed, "res_level", "res_hlevel", "sup_level"):
+      res_series = rolling_resistance(informative_1h["high"], window=5)
+      sup_series = rolling_support(informative_1h["low"], window=5)
+      informative_1h["res_level"] = Series(
+        np.where(
+          res_series,
+          np.where(informative_1h["close"] > informative_1h["open"], informative_1h["close"], informative_1h["open"]),
+          float("NaN"),
+        )
+      ).ffill()
+      informative_1h["res_hlevel"] = Series(np.where(res_series, informative_1h["high"], float("NaN"))).ffill()
+      informative_1h["sup_level"] = Series(
+        np.where(
+          sup_series,
+          np.where(informative_1h["close"] < informative_1h["open"], informative_1h["close"], informative_1h["open"]),
+          float("NaN"),
+        )
+      ).ffill()
 
     # Pump protections
-    informative_1h["hl_pct_change_48"] = self.range_percent_change(informative_1h, "HL", 48)
-    informative_1h["hl_pct_change_36"] = self.range_percent_change(informative_1h, "HL", 36)
-    informative_1h["hl_pct_change_24"] = self.range_percent_change(informative_1h, "HL", 24)
-    informative_1h["hl_pct_change_12"] = self.range_percent_change(informative_1h, "HL", 12)
-    informative_1h["hl_pct_change_6"] = self.range_percent_change(informative_1h, "HL", 6)
+    if indicators_needed(
+      needed,
+      "hl_pct_change_48",
+      "hl_pct_change_36",
+      "hl_pct_change_24",
+      "hl_pct_change_12",
+      "hl_pct_change_6",
+    ):
+      informative_1h["hl_pct_change_48"] = self.range_percent_change(informative_1h, "HL", 48, extrema_1h)
+      informative_1h["hl_pct_change_36"] = self.range_percent_change(informative_1h, "HL", 36, extrema_1h)
+      informative_1h["hl_pct_change_24"] = self.range_percent_change(informative_1h, "HL", 24, extrema_1h)
+      informative_1h["hl_pct_change_12"] = self.range_percent_change(informative_1h, "HL", 12, extrema_1h)
+      informative_1h["hl_pct_change_6"] = self.range_percent_change(informative_1h, "HL", 6, extrema_1h)
 
     # 1h not strong downtrend
-    informative_1h["not_downtrend"] = (informative_1h["close"] > informative_1h["close"].shift(2)) | (
-      informative_1h["rsi_14"] > 50.0
-    )
+    if indicators_needed(needed, "not_downtrend"):
+      informative_1h["not_downtrend"] = (informative_1h["close"] > informative_1h["close"].shift(2)) | (
+        informative_1h["rsi_14"] > 50.0
+      )
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] informative_1h_indicators took: {tok - tik:0.4f} seconds.")
@@ -27447,65 +27767,80 @@ class NostalgiaForInfinityX(IStrategy):
     assert self.dp, "DataProvider is required for multiple timeframes."
     # Get the informative pair
     informative_15m = self.dp.get_pair_dataframe(pair=metadata["pair"], timeframe=self.info_timeframe_15m)
+    needed = self.needed_indicators(self.info_timeframe_15m)
 
     # RSI
-    informative_15m["rsi_14"] = ta.RSI(informative_15m, timeperiod=14)
+    if indicators_needed(needed, "rsi_14"):
+      rsi_3, informative_15m["rsi_14"] = rsi_bank(informative_15m["close"], [3, 14])
 
     # EMAs
-    informative_15m["ema_12"] = ta.EMA(informative_15m, timeperiod=12)
-    informative_15m["ema_16"] = ta.EMA(informative_15m, timeperiod=16)
-    informative_15m["ema_20"] = ta.EMA(informative_15m, timeperiod=20)
-    informative_15m["ema_26"] = ta.EMA(informative_15m, timeperiod=25)
-    informative_15m["ema_50"] = ta.EMA(informative_15m, timeperiod=50)
-    informative_15m["ema_100"] = ta.EMA(informative_15m, timeperiod=100)
-    informative_15m["ema_200"] = ta.EMA(informative_15m, timeperiod=200)
+    if indicators_needed(needed, "ema_12", "ema_16", "ema_20", "ema_26", "ema_50", "ema_100", "ema_200"):
+      emas = ema_bank(informative_15m["close"], [12, 16, 20, 25, 50, 100, 200])
+      informative_15m["ema_12"] = emas[0]
+      informative_15m["ema_16"] = emas[1]
+      informative_15m["ema_20"] = emas[2]
+      informative_15m["ema_26"] = emas[3]
+      informative_15m["ema_50"] = emas[4]
+      informative_15m["ema_100"] = emas[5]
+      informative_15m["ema_200"] = emas[6]
 
     # SMA
-    informative_15m["sma_15"] = ta.SMA(informative_15m, timeperiod=15)
-    informative_15m["sma_30"] = ta.SMA(informative_15m, timeperiod=30)
-    informative_15m["sma_200"] = ta.SMA(informative_15m, timeperiod=200)
+    if indicators_needed(needed, "sma_15", "sma_30", "sma_200", "sma_200_dec_20"):
+      close_sums = RollingSum(informative_15m["close"])
+      informative_15m["sma_15"] = close_sums.mean(15)
+      informative_15m["sma_30"] = close_sums.mean(30)
+      informative_15m["sma_200"] = close_sums.mean(200)
 
-    informative_15m["sma_200_dec_20"] = informative_15m["sma_200"] < informative_15m["sma_200"].shift(20)
+      informative_15m["sma_200_dec_20"] = informative_15m["sma_200"] < informative_15m["sma_200"].shift(20)
 
     # BB
-    bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(informative_15m), window=20, stds=2)
-    informative_15m["bb20_2_low"] = bollinger["lower"]
-    informative_15m["bb20_2_mid"] = bollinger["mid"]
-    informative_15m["bb20_2_upp"] = bollinger["upper"]
+    if indicators_needed(needed, "bb20_2_low", "bb20_2_mid", "bb20_2_upp"):
+      bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(informative_15m), window=20, stds=2)
+      informative_15m["bb20_2_low"] = bollinger["lower"]
+      informative_15m["bb20_2_mid"] = bollinger["mid"]
+      informative_15m["bb20_2_upp"] = bollinger["upper"]
 
     # BB 40 - STD2
-    bb_40_std2 = qtpylib.bollinger_bands(informative_15m["close"], window=40, stds=2)
-    informative_15m["bb40_2_low"] = bb_40_std2["lower"]
-    informative_15m["bb40_2_mid"] = bb_40_std2["mid"]
-    informative_15m["bb40_2_delta"] = (bb_40_std2["mid"] - informative_15m["bb40_2_low"]).abs()
-    informative_15m["closedelta"] = (informative_15m["close"] - informative_15m["close"].shift()).abs()
-    informative_15m["tail"] = (informative_15m["close"] - informative_15m["bb40_2_low"]).abs()
+    if indicators_needed(needed, "bb40_2_low", "bb40_2_mid", "bb40_2_delta", "closedelta", "tail"):
+      bb_40_std2 = qtpylib.bollinger_bands(informative_15m["close"], window=40, stds=2)
+      informative_15m["bb40_2_low"] = bb_40_std2["lower"]
+      informative_15m["bb40_2_mid"] = bb_40_std2["mid"]
+      informative_15m["bb40_2_delta"] = (bb_40_std2["mid"] - informative_15m["bb40_2_low"]).abs()
+      informative_15m["closedelta"] = (informative_15m["close"] - informative_15m["close"].shift()).abs()
+      informative_15m["tail"] = (informative_15m["close"] - informative_15m["bb40_2_low"]).abs()
 
     # CMF
-    informative_15m["cmf"] = chaikin_money_flow(informative_15m, 20)
+    if indicators_needed(needed, "cmf"):
+      informative_15m["cmf"] = chaikin_money_flow(informative_15m, 20)
 
     # CTI
-    informative_15m["cti"] = pta.cti(informative_15m["close"], length=20)
+    if indicators_needed(needed, "cti"):
+      informative_15m["cti"] = pta.cti(informative_15m["close"], length=20)
 
     # Williams %R
-    informative_15m["r_14"] = williams_r(informative_15m, period=14)
-    informative_15m["r_64"] = williams_r(informative_15m, period=64)
-    informative_15m["r_96"] = williams_r(informative_15m, period=96)
+    if indicators_needed(needed, "r_14", "r_64", "r_96"):
+      extrema_15m = RollingExtrema(informative_15m)
+      informative_15m["r_14"] = williams_r(informative_15m, period=14, extrema=extrema_15m)
+      informative_15m["r_64"] = williams_r(informative_15m, period=64, extrema=extrema_15m)
+      informative_15m["r_96"] = williams_r(informative_15m, period=96, extrema=extrema_15m)
 
     # EWO
-    informative_15m["ewo"] = ewo(informative_15m, 50, 200)
+    if indicators_needed(needed, "ewo"):
+      informative_15m["ewo"] = ewo(informative_15m, 50, 200)
 
     # CCI
-    informative_15m["cci"] = ta.CCI(informative_15m, source="hlc3", timeperiod=20)
+    if indicators_needed(needed, "cci"):
+      informative_15m["cci"] = ta.CCI(informative_15m, source="hlc3", timeperiod=20)
 
     # CRSI (3, 2, 100)
-    crsi_closechange = informative_15m["close"] / informative_15m["close"].shift(1)
-    crsi_updown = np.where(crsi_closechange.gt(1), 1.0, np.where(crsi_closechange.lt(1), -1.0, 0.0))
-    informative_15m["crsi"] = (
-      ta.RSI(informative_15m["close"], timeperiod=3)
-      + ta.RSI(crsi_updown, timeperiod=2)
-      + ta.ROC(informative_15m["close"], 100)
-    ) / 3
+    if indicators_needed(needed, "crsi"):
+      crsi_closechange = informative_15m["close"] / informative_15m["close"].shift(1)
+      crsi_updown = np.where(crsi_closechange.gt(1), 1.0, np.where(crsi_closechange.lt(1), -1.0, 0.0))
+      informative_15m["crsi"] = (
+        rsi_3
+        + ta.RSI(crsi_updown, timeperiod=2)
+        + ta.ROC(informative_15m["close"], 100)
+      ) / 3
 
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] informative_1h_indicators took: {tok - tik:0.4f} seconds.")
@@ -27515,188 +27850,259 @@ class NostalgiaForInfinityX(IStrategy):
   def normal_tf_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
     tik = time.perf_counter()
 
+    needed = self.needed_indicators(self.timeframe)
+    is_incremental = (
+      self.incremental_indicators_enabled
+      and needed is None
+      and self.config["runmode"].value in ("live", "dry_run")
+    )
+    if is_incremental:
+      incremental_indicators = self.incremental_indicators.get(metadata["pair"])
+      if incremental_indicators is not None:
+        indicators = incremental_indicators.update(dataframe, self.incremental_max_new_candles)
+        if indicators is not None:
+          dataframe = pd.concat([dataframe, indicators], axis=1)
+          tok = time.perf_counter()
+          log.debug(f"[{metadata['pair']}] normal_tf_indicators (incremental) took: {tok - tik:0.4f} seconds.")
+          return dataframe
+      input_columns = set(dataframe.columns)
+
+    # Shared rolling windows
+    extrema = RollingExtrema(dataframe)
+    close_sums = RollingSum(dataframe["close"])
+    volume_sums = RollingSum(dataframe["volume"])
+
     # RSI
-    dataframe["rsi_4"] = ta.RSI(dataframe, timeperiod=4)
-    dataframe["rsi_14"] = ta.RSI(dataframe, timeperiod=14)
-    dataframe["rsi_84"] = ta.RSI(dataframe, timeperiod=84)
-    dataframe["rsi_112"] = ta.RSI(dataframe, timeperiod=112)
+    if indicators_needed(needed, "rsi_4", "rsi_14", "rsi_84", "rsi_112"):
+      rsis = rsi_bank(dataframe["close"], [3, 4, 14, 84, 112])
+      dataframe["rsi_4"] = rsis[1]
+      dataframe["rsi_14"] = rsis[2]
+      dataframe["rsi_84"] = rsis[3]
+      dataframe["rsi_112"] = rsis[4]
 
     # EMAs
-    dataframe["ema_8"] = ta.EMA(dataframe, timeperiod=8)
-    dataframe["ema_12"] = ta.EMA(dataframe, timeperiod=12)
-    dataframe["ema_13"] = ta.EMA(dataframe, timeperiod=13)
-    dataframe["ema_16"] = ta.EMA(dataframe, timeperiod=16)
-    dataframe["ema_20"] = ta.EMA(dataframe, timeperiod=20)
-    dataframe["ema_25"] = ta.EMA(dataframe, timeperiod=25)
-    dataframe["ema_26"] = ta.EMA(dataframe, timeperiod=26)
-    dataframe["ema_50"] = ta.EMA(dataframe, timeperiod=50)
-    dataframe["ema_100"] = ta.EMA(dataframe, timeperiod=100)
-    dataframe["ema_200"] = ta.EMA(dataframe, timeperiod=200)
-
-    dataframe["ema_200_pct_change_144"] = (dataframe["ema_200"] - dataframe["ema_200"].shift(144)) / dataframe[
-      "ema_200"
-    ].shift(144)
-    dataframe["ema_200_pct_change_288"] = (dataframe["ema_200"] - dataframe["ema_200"].shift(288)) / dataframe[
-      "ema_200"
-    ].shift(288)
+    if indicators_needed(
+      needed,
+      "ema_8",
+      "ema_12",
+      "ema_13",
+      "ema_16",
+      "ema_20",
+      "ema_25",
+      "ema_26",
+      "ema_50",
+      "ema_100",
+      "ema_200",
+      "ema_200_pct_change_144",
+      "ema_200_pct_change_288",
+    ):
+      emas = ema_bank(dataframe["close"], [8, 12, 13, 16, 20, 25, 26, 50, 100, 200])
+      dataframe["ema_8"] = emas[0]
+      dataframe["ema_12"] = emas[1]
+      dataframe["ema_13"] = emas[2]
+      dataframe["ema_16"] = emas[3]
+      dataframe["ema_20"] = emas[4]
+      dataframe["ema_25"] = emas[5]
+      dataframe["ema_26"] = emas[6]
+      dataframe["ema_50"] = emas[7]
+      dataframe["ema_100"] = emas[8]
+      dataframe["ema_200"] = emas[9]
+
+      dataframe["ema_200_pct_change_144"] = (dataframe["ema_200"] - dataframe["ema_200"].shift(144)) / dataframe[
+        "ema_200"
+      ].shift(144)
+      dataframe["ema_200_pct_change_288"] = (dataframe["ema_200"] - dataframe["ema_200"].shift(288)) / dataframe[
+        "ema_200"
+      ].shift(288)
 
     # SMA
-    dataframe["sma_15"] = ta.SMA(dataframe, timeperiod=15)
-    dataframe["sma_28"] = ta.SMA(dataframe, timeperiod=28)
-    dataframe["sma_30"] = ta.SMA(dataframe, timeperiod=30)
-    dataframe["sma_75"] = ta.SMA(dataframe, timeperiod=75)
-    dataframe["sma_200"] = ta.SMA(dataframe, timeperiod=200)
+    if indicators_needed(needed, "sma_15", "sma_28", "sma_30", "sma_75", "sma_200", "sma_200_dec_20", "sma_200_dec_24"):
+      dataframe["sma_15"] = close_sums.mean(15)
+      dataframe["sma_28"] = close_sums.mean(28)
+      dataframe["sma_30"] = close_sums.mean(30)
+      dataframe["sma_75"] = close_sums.mean(75)
+      dataframe["sma_200"] = close_sums.mean(200)
 
-    dataframe["sma_200_dec_20"] = dataframe["sma_200"] < dataframe["sma_200"].shift(20)
-    dataframe["sma_200_dec_24"] = dataframe["sma_200"] < dataframe["sma_200"].shift(24)
+      dataframe["sma_200_dec_20"] = dataframe["sma_200"] < dataframe["sma_200"].shift(20)
+      dataframe["sma_200_dec_24"] = dataframe["sma_200"] < dataframe["sma_200"].shift(24)
 
     # BB 40 - STD2
-    bb_40_std2 = qtpylib.bollinger_bands(dataframe["close"], window=40, stds=2)
-    dataframe["bb40_2_low"] = bb_40_std2["lower"]
-    dataframe["bb40_2_mid"] = bb_40_std2["mid"]
-    dataframe["bb40_2_delta"] = (bb_40_std2["mid"] - dataframe["bb40_2_low"]).abs()
-    dataframe["closedelta"] = (dataframe["close"] - dataframe["close"].shift()).abs()
-    dataframe["tail"] = (dataframe["close"] - dataframe["bb40_2_low"]).abs()
+    if indicators_needed(needed, "bb40_2_low", "bb40_2_mid", "bb40_2_delta", "closedelta", "tail"):
+      bb_40_std2 = qtpylib.bollinger_bands(dataframe["close"], window=40, stds=2)
+      dataframe["bb40_2_low"] = bb_40_std2["lower"]
+      dataframe["bb40_2_mid"] = bb_40_std2["mid"]
+      dataframe["bb40_2_delta"] = (bb_40_std2["mid"] - dataframe["bb40_2_low"]).abs()
+      dataframe["closedelta"] = (dataframe["close"] - dataframe["close"].shift()).abs()
+      dataframe["tail"] = (dataframe["close"] - dataframe["bb40_2_low"]).abs()
 
     # BB 20 - STD2
-    bb_20_std2 = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=20, stds=2)
-    dataframe["bb20_2_low"] = bb_20_std2["lower"]
-    dataframe["bb20_2_mid"] = bb_20_std2["mid"]
-    dataframe["bb20_2_upp"] = bb_20_std2["upper"]
+    if indicators_needed(needed, "bb20_2_low", "bb20_2_mid", "bb20_2_upp"):
+      bb_20_std2 = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=20, stds=2)
+      dataframe["bb20_2_low"] = bb_20_std2["lower"]
+      dataframe["bb20_2_mid"] = bb_20_std2["mid"]
+      dataframe["bb20_2_upp"] = bb_20_std2["upper"]
 
     # BB 20 - STD3
-    bb_20_std3 = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=20, stds=3)
-    dataframe["bb20_3_low"] = bb_20_std3["lower"]
-    dataframe["bb20_3_mid"] = bb_20_std3["mid"]
-    dataframe["bb20_3_upp"] = bb_20_std3["upper"]
+    if indicators_needed(needed, "bb20_3_low", "bb20_3_mid", "bb20_3_upp", "bb20_width", "bb20_delta"):
+      bb_20_std3 = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=20, stds=3)
+      dataframe["bb20_3_low"] = bb_20_std3["lower"]
+      dataframe["bb20_3_mid"] = bb_20_std3["mid"]
+      dataframe["bb20_3_upp"] = bb_20_std3["upper"]
 
-    dataframe["bb20_width"] = (dataframe["bb20_2_upp"] - dataframe["bb20_2_low"]) / dataframe["bb20_2_mid"]
-    dataframe["bb20_delta"] = (dataframe["bb20_2_low"] - dataframe["bb20_3_low"]) / dataframe["bb20_2_low"]
+      dataframe["bb20_width"] = (dataframe["bb20_2_upp"] - dataframe["bb20_2_low"]) / dataframe["bb20_2_mid"]
+      dataframe["bb20_delta"] = (dataframe["bb20_2_low"] - dataframe["bb20_3_low"]) / dataframe["bb20_2_low"]
 
     # CMF
-    dataframe["cmf"] = chaikin_money_flow(dataframe, 20)
+    if indicators_needed(needed, "cmf"):
+      dataframe["cmf"] = chaikin_money_flow(dataframe, 20)
 
     # Williams %R
-    dataframe["r_14"] = williams_r(dataframe, period=14)
-    dataframe["r_24"] = williams_r(dataframe, period=24)
-    dataframe["r_32"] = williams_r(dataframe, period=32)
-    dataframe["r_64"] = williams_r(dataframe, period=64)
-    dataframe["r_96"] = williams_r(dataframe, period=96)
-    dataframe["r_480"] = williams_r(dataframe, period=480)
+    if indicators_needed(needed, "r_14", "r_24", "r_32", "r_64", "r_96", "r_480"):
+      dataframe["r_14"] = williams_r(dataframe, period=14, extrema=extrema)
+      dataframe["r_24"] = williams_r(dataframe, period=24, extrema=extrema)
+      dataframe["r_32"] = williams_r(dataframe, period=32, extrema=extrema)
+      dataframe["r_64"] = williams_r(dataframe, period=64, extrema=extrema)
+      dataframe["r_96"] = williams_r(dataframe, period=96, extrema=extrema)
+      dataframe["r_480"] = williams_r(dataframe, period=480, extrema=extrema)
 
     # CTI
-    dataframe["cti"] = pta.cti(dataframe["close"], length=20)
+    if indicators_needed(needed, "cti"):
+      dataframe["cti"] = pta.cti(dataframe["close"], length=20)
 
     # CRSI (3, 2, 100)
-    crsi_closechange = dataframe["close"] / dataframe["close"].shift(1)
-    crsi_updown = np.where(crsi_closechange.gt(1), 1.0, np.where(crsi_closechange.lt(1), -1.0, 0.0))
-    dataframe["crsi"] = (
-      ta.RSI(dataframe["close"], timeperiod=3) + ta.RSI(crsi_updown, timeperiod=2) + ta.ROC(dataframe["close"], 100)
-    ) / 3
+    if indicators_needed(needed, "crsi"):
+      crsi_closechange = dataframe["close"] / dataframe["close"].shift(1)
+      crsi_updown = np.where(crsi_closechange.gt(1), 1.0, np.where(crsi_closechange.lt(1), -1.0, 0.0))
+      dataframe["crsi"] = (
+        rsis[0] + ta.RSI(crsi_updown, timeperiod=2) + ta.ROC(dataframe["close"], 100)
+      ) / 3
 
     # EMA of VWMA Oscillator
-    dataframe["ema_vwma_osc_32"] = ema_vwma_osc(dataframe, 32)
-    dataframe["ema_vwma_osc_64"] = ema_vwma_osc(dataframe, 64)
-    dataframe["ema_vwma_osc_96"] = ema_vwma_osc(dataframe, 96)
+    if indicators_needed(needed, "ema_vwma_osc_32", "ema_vwma_osc_64", "ema_vwma_osc_96"):
+      dataframe["ema_vwma_osc_32"] = ema_vwma_osc(dataframe, 32)
+      dataframe["ema_vwma_osc_64"] = ema_vwma_osc(dataframe, 64)
+      dataframe["ema_vwma_osc_96"] = ema_vwma_osc(dataframe, 96)
 
     # EWO
-    dataframe["ewo"] = ewo(dataframe, 50, 200)
+    if indicators_needed(needed, "ewo"):
+      dataframe["ewo"] = ewo(dataframe, 50, 200)
 
     # CCI
-    dataframe["cci"] = ta.CCI(dataframe, source="hlc3", timeperiod=20)
-    dataframe["cci_25"] = ta.CCI(dataframe, source="hlc3", timeperiod=25)
+    if indicators_needed(needed, "cci", "cci_25"):
+      dataframe["cci"] = ta.CCI(dataframe, source="hlc3", timeperiod=20)
+      dataframe["cci_25"] = ta.CCI(dataframe, source="hlc3", timeperiod=25)
 
     # MFI
-    dataframe["mfi"] = ta.MFI(dataframe)
+    if indicators_needed(needed, "mfi"):
+      dataframe["mfi"] = ta.MFI(dataframe)
 
     # RMI
-    dataframe["rmi_17"] = RMI(dataframe, length=17, mom=4)
+    if indicators_needed(needed, "rmi_17"):
+      dataframe["rmi_17"] = RMI(dataframe, length=17, mom=4)
 
     # Stochastic fast
-    stoch_fast = ta.STOCHF(dataframe, 5, 3, 0, 3, 0)
-    dataframe["fastd"] = stoch_fast["fastd"]
-    dataframe["fastk"] = stoch_fast["fastk"]
+    if indicators_needed(needed, "fastd", "fastk"):
+      stoch_fast = ta.STOCHF(dataframe, 5, 3, 0, 3, 0)
+      dataframe["fastd"] = stoch_fast["fastd"]
+      dataframe["fastk"] = stoch_fast["fastk"]
 
     # ADX
-    dataframe["adx"] = ta.ADX(dataframe)
+    if indicators_needed(needed, "adx"):
+      dataframe["adx"] = ta.ADX(dataframe)
 
     # STOCHRSI
-    stoch = ta.STOCHRSI(dataframe, 15, 20, 2, 2)
-    dataframe["srsi_fk"] = stoch["fastk"]
-    dataframe["srsi_fd"] = stoch["fastd"]
+    if indicators_needed(needed, "srsi_fk", "srsi_fd"):
+      stoch = ta.STOCHRSI(dataframe, 15, 20, 2, 2)
+      dataframe["srsi_fk"] = stoch["fastk"]
+      dataframe["srsi_fd"] = stoch["fastd"]
 
     # Close delta
-    dataframe["close_delta"] = (dataframe["close"] - dataframe["close"].shift(1)).abs()
+    if indicators_needed(needed, "close_delta"):
+      dataframe["close_delta"] = (dataframe["close"] - dataframe["close"].shift(1)).abs()
 
     # T3 Average
-    dataframe["t3_avg"] = t3_average(dataframe)
+    if indicators_needed(needed, "t3_avg"):
+      dataframe["t3_avg"] = t3_average(dataframe)
 
     # Heiken Ashi
-    heikinashi = qtpylib.heikinashi(dataframe)
-    dataframe["ha_open"] = heikinashi["open"]
-    dataframe["ha_close"] = heikinashi["close"]
-    dataframe["ha_high"] = heikinashi["high"]
-    dataframe["ha_low"] = heikinashi["low"]
+    if indicators_needed(needed, "ha_open", "ha_close", "ha_high", "ha_low", "ha_closedelta", "ha_tail"):
+      heikinashi = qtpylib.heikinashi(dataframe)
+      dataframe["ha_open"] = heikinashi["open"]
+      dataframe["ha_close"] = heikinashi["close"]
+      dataframe["ha_high"] = heikinashi["high"]
+      dataframe["ha_low"] = heikinashi["low"]
 
-    dataframe["ha_closedelta"] = (dataframe["ha_close"] - dataframe["ha_close"].shift()).abs()
-    dataframe["ha_tail"] = (dataframe["ha_close"] - dataframe["ha_low"]).abs()
+      dataframe["ha_closedelta"] = (dataframe["ha_close"] - dataframe["ha_close"].shift()).abs()
+      dataframe["ha_tail"] = (dataframe["ha_close"] - dataframe["ha_low"]).abs()
 
     # True range
-    dataframe["trange"] = ta.TRANGE(dataframe)
+    if indicators_needed(needed, "trange"):
+      dataframe["trange"] = ta.TRANGE(dataframe)
 
     # KC
-    dataframe["range_ma_28"] = ta.SMA(dataframe["trange"], 28)
-    dataframe["kc_upperband_28_1"] = dataframe["sma_28"] + dataframe["range_ma_28"]
-    dataframe["kc_lowerband_28_1"] = dataframe["sma_28"] - dataframe["range_ma_28"]
+    if indicators_needed(needed, "range_ma_28", "kc_upperband_28_1", "kc_lowerband_28_1"):
+      dataframe["range_ma_28"] = RollingSum(dataframe["trange"]).mean(28)
+      dataframe["kc_upperband_28_1"] = dataframe["sma_28"] + dataframe["range_ma_28"]
+      dataframe["kc_lowerband_28_1"] = dataframe["sma_28"] - dataframe["range_ma_28"]
 
     # Linreg
-    dataframe["hh_20"] = ta.MAX(dataframe["high"], 20)
-    dataframe["ll_20"] = ta.MIN(dataframe["low"], 20)
-    dataframe["avg_hh_ll_20"] = (dataframe["hh_20"] + dataframe["ll_20"]) / 2.0
-    dataframe["avg_close_20"] = ta.SMA(dataframe["close"], 20)
-    dataframe["avg_val_20"] = (dataframe["avg_hh_ll_20"] + dataframe["avg_close_20"]) / 2.0
-    dataframe["linreg_val_20"] = ta.LINEARREG(dataframe["close"] - dataframe["avg_val_20"], 20, 0)
+    if indicators_needed(needed, "hh_20", "ll_20", "avg_hh_ll_20", "avg_close_20", "avg_val_20", "linreg_val_20"):
+      dataframe["hh_20"] = extrema.max("high", 20)
+      dataframe["ll_20"] = extrema.min("low", 20)
+      dataframe["avg_hh_ll_20"] = (dataframe["hh_20"] + dataframe["ll_20"]) / 2.0
+      dataframe["avg_close_20"] = close_sums.mean(20)
+      dataframe["avg_val_20"] = (dataframe["avg_hh_ll_20"] + dataframe["avg_close_20"]) / 2.0
+      dataframe["linreg_val_20"] = ta.LINEARREG(dataframe["close"] - dataframe["avg_val_20"], 20, 0)
 
     # MAMA, FAMA, KAMA
-    dataframe["hl2"] = (dataframe["high"] + dataframe["low"]) / 2.0
-    dataframe["mama"], dataframe["fama"] = ta.MAMA(dataframe["hl2"], 0.25, 0.025)
-    dataframe["mama_diff"] = (dataframe["mama"] - dataframe["fama"]) / dataframe["hl2"]
-    dataframe["kama"] = ta.KAMA(dataframe["close"], 84)
+    if indicators_needed(needed, "hl2", "mama", "fama", "mama_diff", "kama"):
+      dataframe["hl2"] = (dataframe["high"] + dataframe["low"]) / 2.0
+      dataframe["mama"], dataframe["fama"] = ta.MAMA(dataframe["hl2"], 0.25, 0.025)
+      dataframe["mama_diff"] = (dataframe["mama"] - dataframe["fama"]) / dataframe["hl2"]
+      dataframe["kama"] = ta.KAMA(dataframe["close"], 84)
 
     # Close max
-    dataframe["close_max_48"] = dataframe["close"].rolling(48).max()
-    dataframe["close_max_288"] = dataframe["close"].rolling(288).max()
+    if indicators_needed(needed, "close_max_48", "close_max_288"):
+      dataframe["close_max_48"] = extrema.max("close", 48)
+      dataframe["close_max_288"] = extrema.max("close", 288)
 
     # VWAP
-    vwap_low, vwap, vwap_high = vwap_bands(dataframe, 20, 1)
-    dataframe["vwap_upperband"] = vwap_high
-    dataframe["vwap_middleband"] = vwap
-    dataframe["vwap_lowerband"] = vwap_low
-    dataframe["vwap_width"] = (
-      (dataframe["vwap_upperband"] - dataframe["vwap_lowerband"]) / dataframe["vwap_middleband"]
-    ) * 100
+    if indicators_needed(needed, "vwap_upperband", "vwap_middleband", "vwap_lowerband", "vwap_width"):
+      vwap_low, vwap, vwap_high = vwap_bands(dataframe, 20, 1)
+      dataframe["vwap_upperband"] = vwap_high
+      dataframe["vwap_middleband"] = vwap
+      dataframe["vwap_lowerband"] = vwap_low
+      dataframe["vwap_width"] = (
+        (dataframe["vwap_upperband"] - dataframe["vwap_lowerband"]) / dataframe["vwap_middleband"]
+      ) * 100
 
     # ATR
-    dataframe["atr"] = ta.ATR(dataframe, timeperiod=14)
+    if indicators_needed(needed, "atr"):
+      dataframe["atr"] = ta.ATR(dataframe, timeperiod=14)
 
     # For sell checks
-    dataframe["crossed_below_ema_12_26"] = qtpylib.crossed_below(dataframe["ema_12"], dataframe["ema_26"])
+    if indicators_needed(needed, "crossed_below_ema_12_26"):
+      dataframe["crossed_below_ema_12_26"] = qtpylib.crossed_below(dataframe["ema_12"], dataframe["ema_26"])
 
     # Volume
-    dataframe["vma_10"] = ta.SMA(dataframe["volume"], timeperiod=10)
-    dataframe["vma_20"] = ta.SMA(dataframe["volume"], timeperiod=20)
-    dataframe["vol_osc"] = (dataframe["vma_10"] - dataframe["vma_20"]) / dataframe["vma_20"] * 100
-    dataframe["volume_mean_4"] = dataframe["volume"].rolling(4).mean().shift(1)
-    dataframe["volume_mean_12"] = dataframe["volume"].rolling(12).mean().shift(1)
-    dataframe["volume_mean_24"] = dataframe["volume"].rolling(24).mean().shift(1)
+    if indicators_needed(needed, "vma_10", "vma_20", "vol_osc", "volume_mean_4", "volume_mean_12", "volume_mean_24"):
+      dataframe["vma_10"] = volume_sums.mean(10)
+      dataframe["vma_20"] = volume_sums.mean(20)
+      dataframe["vol_osc"] = (dataframe["vma_10"] - dataframe["vma_20"]) / dataframe["vma_20"] * 100
+      dataframe["volume_mean_4"] = volume_sums.mean(4).shift(1)
+      dataframe["volume_mean_12"] = volume_sums.mean(12).shift(1)
+      dataframe["volume_mean_24"] = volume_sums.mean(24).shift(1)
 
     # Dip protection
-    dataframe["tpct_change_0"] = self.top_percent_change(dataframe, 0)
-    dataframe["tpct_change_2"] = self.top_percent_change(dataframe, 2)
-    dataframe["tpct_change_12"] = self.top_percent_change(dataframe, 12)
-    dataframe["tpct_change_144"] = self.top_percent_change(dataframe, 144)
+    if indicators_needed(needed, "tpct_change_0", "tpct_change_2", "tpct_change_12", "tpct_change_144"):
+      dataframe["tpct_change_0"] = self.top_percent_change(dataframe, 0)
+      dataframe["tpct_change_2"] = self.top_percent_change(dataframe, 2, extrema)
+      dataframe["tpct_change_12"] = self.top_percent_change(dataframe, 12, extrema)
+      dataframe["tpct_change_144"] = self.top_percent_change(dataframe, 144, extrema)
+
     # 3 hours, protect against wicks
-    dataframe["hl_pct_change_36"] = self.range_percent_change(dataframe, "HL", 36)
+    if indicators_needed(needed, "hl_pct_change_36"):
+      dataframe["hl_pct_change_36"] = self.range_percent_change(dataframe, "HL", 36, extrema)
 
     if not self.config["runmode"].value in ("live", "dry_run"):
       # Backtest age filter
@@ -27706,6 +28112,17 @@ class NostalgiaForInfinityX(IStrategy):
       # Exchange downtime protection
       dataframe["live_data_ok"] = dataframe["volume"].rolling(window=72, min_periods=72).min() > 0
 
+    if is_incremental:
+      if len(dataframe) >= self.incremental_min_candles:
+        self.incremental_indicators[metadata["pair"]] = IncrementalIndicators(
+          dataframe,
+          [column for column in dataframe.columns if column not in input_columns],
+          self.timeframe,
+          self.incremental_min_candles,
+        )
+      else:
+        self.incremental_indicators.pop(metadata["pair"], None)
+
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] normal_tf_indicators took: {tok - tik:0.4f} seconds.")
 
@@ -27724,11 +28141,12 @@ class NostalgiaForInfinityX(IStrategy):
     # -----------------------------------------------------------------------------------------
 
     # Dip protection
-    dataframe["tpct_change_144"] = self.top_percent_change(dataframe, 144)
+    extrema = RollingExtrema(dataframe)
+    dataframe["tpct_change_144"] = self.top_percent_change(dataframe, 144, extrema)
 
     # Close max
-    dataframe["close_max_24"] = dataframe["close"].rolling(24).max()
-    dataframe["close_max_72"] = dataframe["close"].rolling(72).max()
+    dataframe["close_max_24"] = extrema.max("close", 24)
+    dataframe["close_max_72"] = extrema.max("close", 72)
 
     dataframe["pct_close_max_24"] = dataframe["close_max_24"] / dataframe["close"]
     dataframe["pct_close_max_72"] = dataframe["close_max_72"] / dataframe["close"]
@@ -27784,49 +28202,131 @@ class NostalgiaForInfinityX(IStrategy):
 
     return dataframe
 
+  def btc_informative(self, btc_info_pair: str, timeframe: str, populate_func, metadata: dict) -> DataFrame:
+    """
+    BTC informative dataframe, with the BTC indicators (prefixed) for the timeframe.
+
+    The result is the same for every pair, so it's computed once per BTC candle and shared across the pairs.
+    """
+    btc_dataframe = self.dp.get_pair_dataframe(btc_info_pair, timeframe)
+    if len(btc_dataframe) == 0:
+      return populate_func(btc_dataframe, metadata)
+    cache_key = (btc_info_pair, timeframe)
+    candle_key = (btc_dataframe["date"].iloc[0], btc_dataframe["date"].iloc[-1], len(btc_dataframe))
+    cached = self.btc_informative_cache.get(cache_key)
+    if cached is None or cached[0] != candle_key:
+      cached = (candle_key, populate_func(btc_dataframe, metadata))
+      self.btc_informative_cache[cache_key] = cached
+    else:
+      log.debug(f"[{metadata['pair']}] Using the cached {btc_info_pair} {timeframe} informative.")
+    return cached[1]
+
+  def needed_indicators(self, timeframe: str) -> Optional[set]:
+    """
+    The indicator columns to compute for the timeframe, None when every indicator has to be computed.
+
+    Resolved once from the strategy source (see IndicatorRegistry), for the enabled buy conditions and sell families.
+    """
+    if not self.lazy_indicators_enabled:
+      return None
+    if not self.needed_indicators_cache:
+      tik = time.perf_counter()
+      self.needed_indicators_cache = IndicatorRegistry(type(self)).needed_columns(self)
+      tok = time.perf_counter()
+      log.info(
+        "Lazy indicators: %s (resolved in %0.4f seconds)",
+        ", ".join(f"{tf}: {len(columns)} columns" for tf, columns in self.needed_indicators_cache.items()),
+        tok - tik,
+      )
+    return self.needed_indicators_cache.get(timeframe, set())
+
+  def indicator_cache_key(self, dataframe: DataFrame, metadata: dict, btc_info_pair: str) -> str:
+    """
+    Indicator cache key, from the pair, the timeframe, the strategy source & settings, and the content (so the
+    timerange as well) of the pair candles and of the informative candles it's merged with.
+    """
+    if self.indicator_cache_strategy_hash is None:
+      strategy_hash = hashlib.blake2b(digest_size=16)
+      for cls in type(self).__mro__:
+        if cls is IStrategy:
+          break
+        strategy_hash.update(pathlib.Path(inspect.getsourcefile(cls)).read_bytes())
+      settings = {
+        "versions": [np.__version__, pd.__version__],
+        "runmode": self.config["runmode"].value,
+        "stake_currency": self.config["stake_currency"],
+        "timeframes": [
+          self.timeframe,
+          self.res_timeframe,
+          self.info_timeframe_1d,
+          self.info_timeframe_1h,
+          self.info_timeframe_15m,
+        ],
+        "btc_timeframes": [self.has_BTC_base_tf, self.has_BTC_info_tf, self.has_BTC_daily_tf],
+        "coin_metrics": [self.coin_metrics["top_traded_enabled"], self.coin_metrics["top_grossing_enabled"]],
+        "bt_agefilter": [self.has_bt_agefilter, self.bt_min_age_days],
+        "has_downtime_protection": self.has_downtime_protection,
+        "insanity_dump_checks": self.insanity_dump_checks,
+        "half_mode_min_free_slots": self.half_mode_min_free_slots,
+        "lazy_indicators_enabled": self.lazy_indicators_enabled,
+        "sell_families_enabled": self.sell_families_enabled,
+        "buy_params": self.buy_params,
+        "buy_protection_params": self.buy_protection_params,
+      }
+      strategy_hash.update(rapidjson.dumps(settings, sort_keys=True, default=str).encode())
+      self.indicator_cache_strategy_hash = strategy_hash.hexdigest()
+
+    informative_pairs = []
+    if self.has_BTC_daily_tf:
+      informative_pairs.append((btc_info_pair, "1d"))
+    if self.has_BTC_info_tf:
+      informative_pairs.append((btc_info_pair, self.info_timeframe_1h))
+    if self.has_BTC_base_tf:
+      informative_pairs.append((btc_info_pair, self.timeframe))
+    for info_timeframe in (self.info_timeframe_1d, self.info_timeframe_1h, self.info_timeframe_15m):
+      if info_timeframe != "none":
+        informative_pairs.append((metadata["pair"], info_timeframe))
+
+    key = hashlib.blake2b(self.indicator_cache_strategy_hash.encode(), digest_size=16)
+    frames = [dataframe] + [self.dp.get_pair_dataframe(pair, timeframe) for pair, timeframe in informative_pairs]
+    for frame in frames:
+      key.update(frame["date"].to_numpy(dtype="datetime64[ns]").view(np.int64).tobytes())
+      for column in ["open", "high", "low", "close", "volume"]:
+        key.update(np.ascontiguousarray(frame[column].to_numpy(dtype=np.float64)).tobytes())
+    pair = re.sub(r"[^\w.-]", "_", metadata["pair"])
+    return f"{pair}-{self.timeframe}-{key.hexdigest()}"
+
   def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
     tik = time.perf_counter()
     """
         --> BTC informative (5m/1h)
         ___________________________________________________________________________________________
         """
-    if self.config["stake_currency"] in [
-      "USDT",
-      "BUSD",
-      "USDC",
-      "DAI",
-      "TUSD",
-      "PAX",
-      "USD",
-      "EUR",
-      "GBP",
-      "TRY",
-      "BRL",
-    ]:
-      btc_info_pair = f"BTC/{self.config['stake_currency']}"
-    else:
-      btc_info_pair = "BTC/USDT"
-
+    btc_info_pair = self.btc_info_pair
+
+    cache_key = None
+    if self.indicator_cache is not None and len(dataframe) > 0:
+      cache_key = self.indicator_cache_key(dataframe, metadata, btc_info_pair)
+      self.indicator_cache_keys[metadata["pair"]] = cache_key
+      cached = self.indicator_cache.get(cache_key)
+      if cached is not None:
+        cached.index = dataframe.index
+        tok = time.perf_counter()
+        log.debug(f"[{metadata['pair']}] Populate indicators loaded from the cache in: {tok - tik:0.4f} seconds.")
+        return cached
+
+    informatives = []
     if self.has_BTC_daily_tf:
-      btc_daily_tf = self.dp.get_pair_dataframe(btc_info_pair, "1d")
-      btc_daily_tf = self.daily_tf_btc_indicators(btc_daily_tf, metadata)
-      dataframe = merge_informative_pair(dataframe, btc_daily_tf, self.timeframe, "1d", ffill=True)
-      drop_columns = [f"{s}_1d" for s in ["date", "open", "high", "low", "close", "volume"]]
-      dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
+      btc_daily_tf = self.btc_informative(btc_info_pair, "1d", self.daily_tf_btc_indicators, metadata)
+      informatives.append((btc_daily_tf, "1d", ["date", "open", "high", "low", "close", "volume"]))
 
     if self.has_BTC_info_tf:
-      btc_info_tf = self.dp.get_pair_dataframe(btc_info_pair, self.info_timeframe_1h)
-      btc_info_tf = self.info_tf_btc_indicators(btc_info_tf, metadata)
-      dataframe = merge_informative_pair(dataframe, btc_info_tf, self.timeframe, self.info_timeframe_1h, ffill=True)
-      drop_columns = [f"{s}_{self.info_timeframe_1h}" for s in ["date", "open", "high", "low", "close", "volume"]]
-      dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
+      btc_info_tf = self.btc_informative(btc_info_pair, self.info_timeframe_1h, self.info_tf_btc_indicators, metadata)
+      informatives.append((btc_info_tf, self.info_timeframe_1h, ["date", "open", "high", "low", "close", "volume"]))
 
     if self.has_BTC_base_tf:
-      btc_base_tf = self.dp.get_pair_dataframe(btc_info_pair, self.timeframe)
-      btc_base_tf = self.base_tf_btc_indicators(btc_base_tf, metadata)
-      dataframe = merge_informative_pair(dataframe, btc_base_tf, self.timeframe, self.timeframe, ffill=True)
-      drop_columns = [f"{s}_{self.timeframe}" for s in ["date", "open", "high", "low", "close", "volume"]]
-      dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
+      btc_base_tf = self.btc_informative(btc_info_pair, self.timeframe, self.base_tf_btc_indicators, metadata)
+      informatives.append((btc_base_tf, self.timeframe, ["date", "open", "high", "low", "close", "volume"]))
 
     """
         --> Informative timeframe
@@ -27834,23 +28334,20 @@ class NostalgiaForInfinityX(IStrategy):
         """
     if self.info_timeframe_1d != "none":
       informative_1d = self.informative_1d_indicators(dataframe, metadata)
-      dataframe = merge_informative_pair(dataframe, informative_1d, self.timeframe, self.info_timeframe_1d, ffill=True)
-      drop_columns = [f"{s}_{self.info_timeframe_1d}" for s in ["date", "open", "high", "low", "close", "volume"]]
-      dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
+      informatives.append(
+        (informative_1d, self.info_timeframe_1d, ["date", "open", "high", "low", "close", "volume"])
+      )
 
     if self.info_timeframe_1h != "none":
       informative_1h = self.informative_1h_indicators(dataframe, metadata)
-      dataframe = merge_informative_pair(dataframe, informative_1h, self.timeframe, self.info_timeframe_1h, ffill=True)
-      drop_columns = [f"{s}_{self.info_timeframe_1h}" for s in ["date"]]
-      dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
+      informatives.append((informative_1h, self.info_timeframe_1h, ["date"]))
 
     if self.info_timeframe_15m != "none":
       informative_15m = self.informative_15m_indicators(dataframe, metadata)
-      dataframe = merge_informative_pair(
-        dataframe, informative_15m, self.timeframe, self.info_timeframe_15m, ffill=True
-      )
-      drop_columns = [f"{s}_{self.info_timeframe_15m}" for s in ["date"]]
-      dataframe.drop(columns=dataframe.columns.intersection(drop_columns), inplace=True)
+      informatives.append((informative_15m, self.info_timeframe_15m, ["date"]))
+
+    # All the informative columns aligned in one pass
+    dataframe = merge_informative_pairs(dataframe, self.timeframe, informatives)
 
     """
         --> Resampled to another timeframe
@@ -27874,114 +28371,378 @@ class NostalgiaForInfinityX(IStrategy):
         """
     dataframe = self.normal_tf_indicators(dataframe, metadata)
 
+    if cache_key is not None:
+      self.indicator_cache.set(cache_key, dataframe)
+
     tok = time.perf_counter()
     log.debug(f"[{metadata['pair']}] Populate indicators took a total of: {tok - tik:0.4f} seconds.")
 
     return dataframe
 
+  def get_buy_conditions_executor(self) -> ThreadPoolExecutor:
+    if self.buy_conditions_executor is None:
+      self.buy_conditions_executor = ThreadPoolExecutor(
+        max_workers=self.parallel_buy_conditions_threads or os.cpu_count(), thread_name_prefix="nfi-buy-conditions"
+      )
+    return self.buy_conditions_executor
+
+  def load_sell_decision_tables(self):
+    # The compiled sell methods replace the Python ones, on this instance
+    if not self.sell_decision_tables_enabled or self.sell_decision_tables is not None:
+      return
+    tik = time.perf_counter()
+    try:
+      self.sell_decision_tables = SellDecisionTables(type(self), self.sell_decision_tables_methods)
+    except Exception as exc:
+      log.warning("Failed to compile the sell decision tables, using the Python code: %s", exc)
+      self.sell_decision_tables_enabled = False
+      return
+    for name, function in self.sell_decision_tables.functions.items():
+      setattr(self, name, function.__get__(self))
+    tok = time.perf_counter()
+    log.info("Compiled %s sell profit band chains in %0.4f seconds.", self.sell_decision_tables.chains, tok - tik)
+
+  def get_exit_signal_tables(self) -> Optional["ExitSignalTables"]:
+    if self.config["runmode"].value in ("backtest", "hyperopt"):
+      enabled = self.exit_signal_tables_enabled
+    else:
+      enabled = self.exit_signal_memo_enabled
+    if not enabled:
+      return None
+    if self.exit_signal_tables is None:
+      tik = time.perf_counter()
+      try:
+        self.exit_signal_tables = ExitSignalTables(type(self), self.exit_signal_tables_methods)
+      except Exception as exc:
+        log.warning("Failed to build the exit signal tables, calling the sell methods: %s", exc)
+        self.exit_signal_tables_enabled = False
+        self.exit_signal_memo_enabled = False
+        return None
+      tok = time.perf_counter()
+      log.info("Tabled %s sell methods in %0.4f seconds.", len(self.exit_signal_tables.methods), tok - tik)
+    return self.exit_signal_tables
+
+  def exit_table_signal(self, pair: str, name: str, current_profit: float, last_candle, method, *args) -> tuple:
+    # The return of a tabled sell method: precomputed for the candle (backtest), memoized per candle & profit region
+    # (live), else "method(*args)"
+    codes = self.exit_signal_codes.get(pair)
+    if codes is not None and name in codes["methods"] and current_profit == current_profit:
+      date = last_candle["date"].value
+      if codes["date"] != date:
+        row = int(np.searchsorted(codes["dates"], date))
+        codes["date"], codes["row"] = date, row if row < len(codes["dates"]) and codes["dates"][row] == date else None
+      if codes["row"] is not None:
+        _, edges, outcomes = self.exit_signal_tables.methods[name]
+        code = codes["methods"][name].item(ExitSignalTables.region(edges, current_profit), codes["row"])
+        if code != 0:
+          return outcomes[code]
+    elif self.exit_signal_memo_enabled and current_profit == current_profit:
+      exit_signal_tables = self.exit_signal_tables or self.get_exit_signal_tables()
+      table = exit_signal_tables.methods.get(name) if exit_signal_tables is not None else None
+      if table is not None:
+        # The snapshot candles are rebuilt on every new analysis, the memo lives as long as the candle dict
+        memo = self.exit_signal_memo.get(pair)
+        if memo is None or memo[0] is not last_candle:
+          memo = self.exit_signal_memo[pair] = (last_candle, {})
+        key = (name, ExitSignalTables.region(table[1], current_profit))
+        result = memo[1].get(key)
+        if result is None:
+          result = memo[1][key] = method(*args)
+        return result
+    return method(*args)
+
+  def get_buy_conditions_plan(self) -> Optional["BuyConditionsPlan"]:
+    if not self.compiled_buy_conditions_enabled:
+      return None
+    if self.buy_conditions_plan is None:
+      tik = time.perf_counter()
+      try:
+        self.buy_conditions_plan = BuyConditionsPlan(type(self), env_names=("current_free_slots",))
+      except Exception as exc:
+        log.warning("Failed to compile the buy conditions, using the Python code: %s", exc)
+        self.compiled_buy_conditions_enabled = False
+        return None
+      tok = time.perf_counter()
+      log.info(
+        "Compiled %s buy conditions in %0.4f seconds.", len(self.buy_conditions_plan.conditions), tok - tik
+      )
+    return self.buy_conditions_plan
+
+  def get_entry_signals_lookback(self) -> Optional[int]:
+    """
+    The number of previous candles an entry signal depends on: the largest "shift()" / "rolling()" window of
+    "populate_entry_trend()" and "buy_protection()" (plus one, for the crossings). The windows from the protection
+    params are resolved from them, None if any other window isn't a constant.
+    """
+    if self.entry_signals_lookback is None:
+      methods = strategy_source_methods(type(self))
+      lookback = 0
+      nodes = [node for name in ("populate_entry_trend", "buy_protection") for node in ast.walk(methods[name][0])]
+      for node in nodes:
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)):
+          continue
+        if node.func.attr not in ("shift", "rolling"):
+          continue
+        if not node.args:
+          window = 1
+        elif isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, int):
+          window = node.args[0].value
+        elif (
+          isinstance(node.args[0], ast.Call)
+          and isinstance(node.args[0].func, ast.Name)
+          and node.args[0].func.id == "int"
+          and isinstance(node.args[0].args[0], ast.Subscript)
+          and isinstance(node.args[0].args[0].value, ast.Name)
+          and node.args[0].args[0].value.id == "global_buy_protection_params"
+          and isinstance(node.args[0].args[0].slice, ast.Constant)
+        ):
+          key = node.args[0].args[0].slice.value
+          window = max(int(params[key]) for params in self.buy_protection_params.values())
+        else:
+          log.warning("Tail entry signals disabled, unknown window: %s", ast.unparse(node))
+          self.entry_signals_lookback = -1
+          return None
+        lookback = max(lookback, window)
+      self.entry_signals_lookback = lookback + 1
+    return self.entry_signals_lookback if self.entry_signals_lookback >= 0 else None
+
+  def tail_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    """
+    The entry signals, evaluated only for the new candles (on the candles they look back at) when the other candles
+    were analyzed by the previous run.
+    """
+    tik = time.perf_counter()
+    tail_metadata = {**metadata, "tail_entry_trend": True}
+    dates = dataframe["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    lookback = self.get_entry_signals_lookback()
+    previous = self.entry_signals.get(metadata["pair"])
+    new_candles = None
+    if lookback is not None and previous is not None and len(previous[0]) > 0:
+      previous_dates, previous_signals = previous
+      positions = np.minimum(np.searchsorted(previous_dates, dates), len(previous_dates) - 1)
+      known = previous_dates[positions] == dates
+      new_candles = len(dates) - int(known.sum())
+      if (
+        not known[: len(dates) - new_candles].all()
+        or new_candles > self.tail_entry_max_new_candles
+        or len(dataframe) <= lookback + new_candles
+      ):
+        new_candles = None
+
+    if new_candles is None:
+      dataframe = self.populate_entry_trend(dataframe, tail_metadata)
+    else:
+      known_positions = positions[: len(dates) - new_candles]
+      if new_candles > 0:
+        tail = self.populate_entry_trend(dataframe.iloc[-(lookback + new_candles) :].copy(), tail_metadata)
+      for column, previous_values in previous_signals.items():
+        values = previous_values.iloc[known_positions]
+        if new_candles > 0:
+          values = pd.concat([values, tail[column].iloc[-new_candles:]])
+        values.index = dataframe.index
+        dataframe[column] = values
+
+    self.entry_signals[metadata["pair"]] = (
+      dates,
+      {column: dataframe[column] for column in ["enter_tag", "enter_long"] if column in dataframe.columns},
+    )
+    tok = time.perf_counter()
+    log.debug(
+      f"[{metadata['pair']}] tail_entry_trend ({'full' if new_candles is None else new_candles}) took: "
+      f"{tok - tik:0.4f} seconds."
+    )
+    return dataframe
+
+  def buy_protection(self, dataframe: DataFrame, global_buy_protection_params: dict, protection_masks: dict):
+    """
+    The standard protections of a buy condition, ANDed. The masks are cached in "protection_masks" (one per
+    "populate_entry_trend()" call) by protection and params, and shared by the conditions using the same ones.
+    """
+    protections = []
+
+    def protection(key: tuple, mask):
+      if key not in protection_masks:
+        protection_masks[key] = mask()
+      protections.append(key)
+
+    if global_buy_protection_params["ema_fast"]:
+      protection(
+        ("ema_fast", global_buy_protection_params["ema_fast_len"]),
+        lambda: dataframe[f"ema_{global_buy_protection_params['ema_fast_len']}"] > dataframe["ema_200"],
+      )
+    if global_buy_protection_params["ema_slow"]:
+      protection(
+        ("ema_slow", global_buy_protection_params["ema_slow_len"]),
+        lambda: dataframe[f"ema_{global_buy_protection_params['ema_slow_len']}_1h"] > dataframe["ema_200_1h"],
+      )
+    if global_buy_protection_params["close_above_ema_fast"]:
+      protection(
+        ("close_above_ema_fast", global_buy_protection_params["close_above_ema_fast_len"]),
+        lambda: dataframe["close"] > dataframe[f"ema_{global_buy_protection_params['close_above_ema_fast_len']}"],
+      )
+    if global_buy_protection_params["close_above_ema_slow"]:
+      protection(
+        ("close_above_ema_slow", global_buy_protection_params["close_above_ema_slow_len"]),
+        lambda: dataframe["close"] > dataframe[f"ema_{global_buy_protection_params['close_above_ema_slow_len']}_1h"],
+      )
+    if global_buy_protection_params["sma200_rising"]:
+      protection(
+        ("sma200_rising", int(global_buy_protection_params["sma200_rising_val"])),
+        lambda: dataframe["sma_200"]
+        > dataframe["sma_200"].shift(int(global_buy_protection_params["sma200_rising_val"])),
+      )
+    if global_buy_protection_params["sma200_1h_rising"]:
+      protection(
+        ("sma200_1h_rising", int(global_buy_protection_params["sma200_1h_rising_val"])),
+        lambda: dataframe["sma_200_1h"]
+        > dataframe["sma_200_1h"].shift(int(global_buy_protection_params["sma200_1h_rising_val"])),
+      )
+    for period in (0, 2, 12, 144):
+      threshold = global_buy_protection_params[f"safe_dips_threshold_{period}"]
+      if threshold is not None:
+        protection(
+          ("safe_dips_threshold", period, threshold),
+          lambda: dataframe[f"tpct_change_{period}"] < threshold,
+        )
+    for hours in (6, 12, 24, 36, 48):
+      threshold = global_buy_protection_params[f"safe_pump_{hours}h_threshold"]
+      if threshold is not None:
+        protection(
+          ("safe_pump_threshold", hours, threshold),
+          lambda: dataframe[f"hl_pct_change_{hours}_1h"] < threshold,
+        )
+    if global_buy_protection_params["btc_1h_not_downtrend"]:
+      protection(("btc_1h_not_downtrend",), lambda: dataframe["btc_not_downtrend_1h"])
+    if global_buy_protection_params["close_over_pivot_type"] != "none":
+      protection(
+        (
+          "close_over_pivot",
+          global_buy_protection_params["close_over_pivot_type"],
+          global_buy_protection_params["close_over_pivot_offset"],
+        ),
+        lambda: dataframe["close"]
+        > dataframe[f"{global_buy_protection_params['close_over_pivot_type']}_1d"]
+        * global_buy_protection_params["close_over_pivot_offset"],
+      )
+    if global_buy_protection_params["close_under_pivot_type"] != "none":
+      protection(
+        (
+          "close_under_pivot",
+          global_buy_protection_params["close_under_pivot_type"],
+          global_buy_protection_params["close_under_pivot_offset"],
+        ),
+        lambda: dataframe["close"]
+        < dataframe[f"{global_buy_protection_params['close_under_pivot_type']}_1d"]
+        * global_buy_protection_params["close_under_pivot_offset"],
+      )
+    if not self.config["runmode"].value in ("live", "dry_run"):
+      if self.has_bt_agefilter:
+        protection(("bt_agefilter_ok",), lambda: dataframe["bt_agefilter_ok"])
+    else:
+      if self.has_downtime_protection:
+        protection(("live_data_ok",), lambda: dataframe["live_data_ok"])
+
+    # The conditions with the same protections share the ANDed mask too
+    protections = tuple(protections)
+    if protections not in protection_masks:
+      protection_masks[protections] = reduce(
+        lambda x, y: x & y, [True] + [protection_masks[key] for key in protections]
+      )
+    return protection_masks[protections]
+
+  def buy_common_logic(self, dataframe: DataFrame, metadata: dict) -> list:
+    # The checks ANDed to every buy condition
+    item_buy_logic = []
+    item_buy_logic.append(dataframe["volume"] > 0)
+    # for leveraged long pairs
+    is_leverage_long = self.get_pair_metadata(metadata["pair"]).is_leverage_long
+    item_buy_logic.append((dataframe["btc_pct_close_max_72_5m"] < 1.01) | (not is_leverage_long))
+    # Extra dump check
+    if self.insanity_dump_checks:
+      item_buy_logic.append((dataframe["btc_pct_close_max_24_5m"] < 1.025))
+      item_buy_logic.append(dataframe["hl_pct_change_36"] < 0.3)
+      item_buy_logic.append(dataframe["ema_200_pct_change_288"] < 0.3)
+      item_buy_logic.append(dataframe["ema_200_pct_change_144"] < 0.25)
+      item_buy_logic.append(dataframe["hl_pct_change_48_1h"] < 0.75)
+    return item_buy_logic
+
   def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-    conditions = []
+    if (
+      self.tail_entry_signals_enabled
+      and self.config["runmode"].value in ("live", "dry_run")
+      and not metadata.get("tail_entry_trend")
+    ):
+      return self.tail_entry_trend(dataframe, metadata)
+
     dataframe.loc[:, "enter_tag"] = ""
 
     # the number of free slots
     current_free_slots = self.config["max_open_trades"] - len(LocalTrade.get_trades_proxy(is_open=True))
 
+    # The signals of an indicator cache entry (the dataframe can be a trimmed part of it)
+    cache_key = None
+    if self.indicator_cache is not None and metadata["pair"] in self.indicator_cache_keys and len(dataframe) > 0:
+      cache_key = (
+        f"{self.indicator_cache_keys[metadata['pair']]}-signals-"
+        f"{dataframe['date'].iloc[0].value}-{dataframe['date'].iloc[-1].value}-{len(dataframe)}-{current_free_slots}"
+      )
+      cached = self.indicator_cache.get(cache_key)
+      if cached is not None:
+        for column in cached.columns:
+          dataframe.loc[:, column] = cached[column].to_numpy()
+        return dataframe
+
+    # Shared sub expressions of the compiled buy conditions, for this dataframe
+    buy_conditions_plan = self.get_buy_conditions_plan()
+    buy_conditions_cache = {}
+    # The standard protection masks, shared by the buy conditions
+    protection_masks = {}
+    entry_profiler = self.entry_profiler
+    # The compiled buy conditions, evaluated on the thread pool
+    buy_conditions_results = {}
+    if buy_conditions_plan is not None and self.parallel_buy_conditions_enabled:
+      buy_conditions_results = buy_conditions_plan.evaluate_all(
+        [
+          index
+          for index in self.buy_protection_params
+          if self.buy_params[f"buy_condition_{index}_enable"] and index in buy_conditions_plan.conditions
+        ],
+        dataframe,
+        self,
+        self.get_buy_conditions_executor(),
+        current_free_slots=current_free_slots,
+      )
+    # The checks common to every buy condition
+    common_buy_logic = self.buy_common_logic(dataframe, metadata)
+    # The conditions that fired, per candle
+    fired_conditions = np.zeros((len(dataframe), enter_tag_words(max(self.buy_protection_params))), dtype=np.uint64)
+    any_condition = False
+
     for index in self.buy_protection_params:
-      item_buy_protection_list = [True]
       global_buy_protection_params = self.buy_protection_params[index]
 
       if self.buy_params[f"buy_condition_{index}_enable"]:
-        # Standard protections - Common to every condition
-        # -----------------------------------------------------------------------------------------
-        if global_buy_protection_params["ema_fast"]:
-          item_buy_protection_list.append(
-            dataframe[f"ema_{global_buy_protection_params['ema_fast_len']}"] > dataframe["ema_200"]
-          )
-        if global_buy_protection_params["ema_slow"]:
-          item_buy_protection_list.append(
-            dataframe[f"ema_{global_buy_protection_params['ema_slow_len']}_1h"] > dataframe["ema_200_1h"]
-          )
-        if global_buy_protection_params["close_above_ema_fast"]:
-          item_buy_protection_list.append(
-            dataframe["close"] > dataframe[f"ema_{global_buy_protection_params['close_above_ema_fast_len']}"]
-          )
-        if global_buy_protection_params["close_above_ema_slow"]:
-          item_buy_protection_list.append(
-            dataframe["close"] > dataframe[f"ema_{global_buy_protection_params['close_above_ema_slow_len']}_1h"]
-          )
-        if global_buy_protection_params["sma200_rising"]:
-          item_buy_protection_list.append(
-            dataframe["sma_200"] > dataframe["sma_200"].shift(int(global_buy_protection_params["sma200_rising_val"]))
-          )
-        if global_buy_protection_params["sma200_1h_rising"]:
-          item_buy_protection_list.append(
-            dataframe["sma_200_1h"]
-            > dataframe["sma_200_1h"].shift(int(global_buy_protection_params["sma200_1h_rising_val"]))
-          )
-        if global_buy_protection_params["safe_dips_threshold_0"] is not None:
-          item_buy_protection_list.append(
-            dataframe["tpct_change_0"] < global_buy_protection_params["safe_dips_threshold_0"]
-          )
-        if global_buy_protection_params["safe_dips_threshold_2"] is not None:
-          item_buy_protection_list.append(
-            dataframe["tpct_change_2"] < global_buy_protection_params["safe_dips_threshold_2"]
-          )
-        if global_buy_protection_params["safe_dips_threshold_12"] is not None:
-          item_buy_protection_list.append(
-            dataframe["tpct_change_12"] < global_buy_protection_params["safe_dips_threshold_12"]
-          )
-        if global_buy_protection_params["safe_dips_threshold_144"] is not None:
-          item_buy_protection_list.append(
-            dataframe["tpct_change_144"] < global_buy_protection_params["safe_dips_threshold_144"]
-          )
-        if global_buy_protection_params["safe_pump_6h_threshold"] is not None:
-          item_buy_protection_list.append(
-            dataframe["hl_pct_change_6_1h"] < global_buy_protection_params["safe_pump_6h_threshold"]
-          )
-        if global_buy_protection_params["safe_pump_12h_threshold"] is not None:
-          item_buy_protection_list.append(
-            dataframe["hl_pct_change_12_1h"] < global_buy_protection_params["safe_pump_12h_threshold"]
-          )
-        if global_buy_protection_params["safe_pump_24h_threshold"] is not None:
-          item_buy_protection_list.append(
-            dataframe["hl_pct_change_24_1h"] < global_buy_protection_params["safe_pump_24h_threshold"]
-          )
-        if global_buy_protection_params["safe_pump_36h_threshold"] is not None:
-          item_buy_protection_list.append(
-            dataframe["hl_pct_change_36_1h"] < global_buy_protection_params["safe_pump_36h_threshold"]
-          )
-        if global_buy_protection_params["safe_pump_48h_threshold"] is not None:
-          item_buy_protection_list.append(
-            dataframe["hl_pct_change_48_1h"] < global_buy_protection_params["safe_pump_48h_threshold"]
-          )
-        if global_buy_protection_params["btc_1h_not_downtrend"]:
-          item_buy_protection_list.append(dataframe["btc_not_downtrend_1h"])
-        if global_buy_protection_params["close_over_pivot_type"] != "none":
-          item_buy_protection_list.append(
-            dataframe["close"]
-            > dataframe[f"{global_buy_protection_params['close_over_pivot_type']}_1d"]
-            * global_buy_protection_params["close_over_pivot_offset"]
-          )
-        if global_buy_protection_params["close_under_pivot_type"] != "none":
-          item_buy_protection_list.append(
-            dataframe["close"]
-            < dataframe[f"{global_buy_protection_params['close_under_pivot_type']}_1d"]
-            * global_buy_protection_params["close_under_pivot_offset"]
-          )
-        if not self.config["runmode"].value in ("live", "dry_run"):
-          if self.has_bt_agefilter:
-            item_buy_protection_list.append(dataframe["bt_agefilter_ok"])
-        else:
-          if self.has_downtime_protection:
-            item_buy_protection_list.append(dataframe["live_data_ok"])
-
         # Buy conditions
         # -----------------------------------------------------------------------------------------
         item_buy_logic = []
-        item_buy_logic.append(reduce(lambda x, y: x & y, item_buy_protection_list))
+        if entry_profiler is not None:
+          profile = entry_profiler.start()
+        item_buy_logic.append(self.buy_protection(dataframe, global_buy_protection_params, protection_masks))
+        if entry_profiler is not None:
+          profile = entry_profiler.record(profile, metadata["pair"], index, "protection")
+
+        if index in buy_conditions_results:
+          item_buy_logic.append(buy_conditions_results.pop(index))
+
+        elif buy_conditions_plan is not None and index in buy_conditions_plan.conditions:
+          item_buy_logic.append(
+            buy_conditions_plan.evaluate(
+              index, dataframe, buy_conditions_cache, self, current_free_slots=current_free_slots
+            )
+          )
 
         # Condition #1 - Semi swing mode. Increase in the last candles & relative local dip.
-        if index == 1:
+        elif index == 1:
           # Non-Standard protections
 
           # Logic
@@ -38404,28 +39165,38 @@ class NostalgiaForInfinityX(IStrategy):
             | ((dataframe["cti_15m"] < -0.9) & (dataframe["not_downtrend_1h"]))
           )
 
-        item_buy_logic.append(dataframe["volume"] > 0)
-        # for leveraged long pairs
-        is_leverage_long = bool(re.match(leverage_pattern_long, metadata["pair"]))
-        item_buy_logic.append((dataframe["btc_pct_close_max_72_5m"] < 1.01) | (not is_leverage_long))
-        # Extra dump check
-        if self.insanity_dump_checks:
-          item_buy_logic.append((dataframe["btc_pct_close_max_24_5m"] < 1.025))
-          item_buy_logic.append(dataframe["hl_pct_change_36"] < 0.3)
-          item_buy_logic.append(dataframe["ema_200_pct_change_288"] < 0.3)
-          item_buy_logic.append(dataframe["ema_200_pct_change_144"] < 0.25)
-          item_buy_logic.append(dataframe["hl_pct_change_48_1h"] < 0.75)
+        item_buy_logic.extend(common_buy_logic)
         item_buy = reduce(lambda x, y: x & y, item_buy_logic)
-        dataframe.loc[item_buy, "enter_tag"] += f"{index} "
-        conditions.append(item_buy)
-        dataframe.loc[:, "enter_long"] = item_buy
+        if entry_profiler is not None:
+          entry_profiler.record(profile, metadata["pair"], index, "logic", len(dataframe), item_buy)
+        set_enter_tag_bit(fired_conditions, item_buy, index)
+        any_condition = True
+
+    if any_condition:
+      dataframe.loc[:, "enter_tag"] = decode_enter_tags(fired_conditions)
+      dataframe.loc[:, "enter_long"] = fired_conditions.any(axis=1)
 
-    if conditions:
-      dataframe.loc[:, "enter_long"] = reduce(lambda x, y: x | y, conditions)
+    if cache_key is not None:
+      self.indicator_cache.set(cache_key, dataframe[dataframe.columns.intersection(["enter_long", "enter_tag"])])
+
+    if entry_profiler is not None:
+      entry_profiler.report()
 
     return dataframe
 
   def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    exit_signal_tables = self.get_exit_signal_tables()
+    if exit_signal_tables is not None and self.config["runmode"].value in ("backtest", "hyperopt"):
+      tik = time.perf_counter()
+      self.exit_signal_codes[metadata["pair"]] = {
+        "dates": dataframe["date"].to_numpy(dtype="datetime64[ns]").view(np.int64),
+        "methods": exit_signal_tables.evaluate(dataframe),
+        "date": None,
+        "row": None,
+      }
+      tok = time.perf_counter()
+      log.debug(f"[{metadata['pair']}] Exit signal tables took: {tok - tik:0.4f} seconds.")
+
     dataframe.loc[:, "exit_long"] = 0
     dataframe.loc[:, "exit_short"] = 0
 
@@ -38447,15 +39218,15 @@ class NostalgiaForInfinityX(IStrategy):
     if entry_tag == "force_entry":
       return True
 
-    dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+    snapshot = self.get_candle_snapshot(pair)
 
-    if len(dataframe) < 1:
+    if snapshot.length < 1:
       return True
 
-    dataframe = dataframe.iloc[-1].squeeze()
+    last_candle = snapshot.candles[0]
 
-    if rate > dataframe["close"]:
-      slippage = (rate / dataframe["close"]) - 1.0
+    if rate > last_candle["close"]:
+      slippage = (rate / last_candle["close"]) - 1.0
 
       if slippage < 0.0075:
         return True
@@ -38491,6 +39262,7 @@ class NostalgiaForInfinityX(IStrategy):
           return False
 
     self._remove_profit_target(pair)
+    self.trade_states.pop(trade.id, None)
 
     return True
 
@@ -38517,9 +39289,7 @@ class NostalgiaForInfinityX(IStrategy):
     if not self.holdSupportEnabled:
       return False
 
-    # Just to be sure our hold data is loaded, should be a no-op call after the first bot loop
-    self.load_hold_trades_config()
-
+    # The hold data is loaded by the bot loop and reloaded by its watcher, no file access here
     if not self.hold_trades_cache:
       # Cache hasn't been setup, likely because the corresponding file does not exist, sell
       return False
@@ -38594,12 +39364,131 @@ class NostalgiaForInfinityX(IStrategy):
 
 # Elliot Wave Oscillator
 def ewo(dataframe, sma1_length=5, sma2_length=35):
-  sma1 = ta.EMA(dataframe, timeperiod=sma1_length)
-  sma2 = ta.EMA(dataframe, timeperiod=sma2_length)
+  sma1, sma2 = ema_bank(dataframe["close"], [sma1_length, sma2_length])
   smadif = (sma1 - sma2) / dataframe["close"] * 100
   return smadif
 
 
+# EMA/RSI banks (TA-Lib compatible), all the periods in one pass over the data
+def _ema_bank_kernel(values, periods):
+  num_rows = values.shape[0]
+  out = np.full((periods.shape[0], num_rows), np.nan)
+  sums = np.zeros(periods.shape[0])
+  start = 0
+  while start < num_rows and np.isnan(values[start]):
+    start += 1
+  for i in range(start, num_rows):
+    value = values[i]
+    count = i - start + 1
+    for j in range(periods.shape[0]):
+      period = periods[j]
+      if count < period:
+        sums[j] += value
+      elif count == period:
+        sums[j] = (sums[j] + value) / period
+        out[j, i] = sums[j]
+      else:
+        sums[j] = ((value - sums[j]) * (2.0 / (period + 1))) + sums[j]
+        out[j, i] = sums[j]
+  return out
+
+
+def _rsi_bank_kernel(values, periods):
+  num_rows = values.shape[0]
+  out = np.full((periods.shape[0], num_rows), np.nan)
+  gains = np.zeros(periods.shape[0])
+  losses = np.zeros(periods.shape[0])
+  start = 0
+  while start < num_rows and np.isnan(values[start]):
+    start += 1
+  for i in range(start + 1, num_rows):
+    diff = values[i] - values[i - 1]
+    count = i - start
+    for j in range(periods.shape[0]):
+      period = periods[j]
+      if count < period:
+        if diff < 0:
+          losses[j] -= diff
+        else:
+          gains[j] += diff
+        continue
+      if count > period:
+        gains[j] *= period - 1
+        losses[j] *= period - 1
+      if diff < 0:
+        losses[j] -= diff
+      else:
+        gains[j] += diff
+      gains[j] /= period
+      losses[j] /= period
+      total = gains[j] + losses[j]
+      out[j, i] = 100.0 * (gains[j] / total) if (total <= -0.00000001 or total >= 0.00000001) else 0.0
+  return out
+
+
+if numba is not None:
+  _ema_bank_kernel = numba.njit(cache=True)(_ema_bank_kernel)
+  _rsi_bank_kernel = numba.njit(cache=True)(_rsi_bank_kernel)
+
+
+def ema_bank(series, periods: list) -> np.ndarray:
+  """
+  EMA of the series for several periods, one row per period.
+  Uses the numba kernel when available, otherwise TA-Lib on the same input buffer.
+  """
+  values = np.ascontiguousarray(series, dtype=np.float64)
+  if numba is not None:
+    return _ema_bank_kernel(values, np.asarray(periods, dtype=np.int64))
+  return np.array([ta.EMA(values, timeperiod=period) for period in periods]).reshape(len(periods), len(values))
+
+
+def rsi_bank(series, periods: list) -> np.ndarray:
+  """
+  RSI of the series for several periods, one row per period.
+  Uses the numba kernel when available, otherwise TA-Lib on the same input buffer.
+  """
+  values = np.ascontiguousarray(series, dtype=np.float64)
+  if numba is not None:
+    return _rsi_bank_kernel(values, np.asarray(periods, dtype=np.int64))
+  return np.array([ta.RSI(values, timeperiod=period) for period in periods]).reshape(len(periods), len(values))
+
+
+# Compensated prefix sum, returns the running sum and its compensation (the exact sum is their sum)
+def _prefix_sum_kernel(values):
+  prefix = np.zeros(values.shape[0] + 1)
+  compensation = np.zeros(values.shape[0] + 1)
+  total = 0.0
+  error = 0.0
+  for i in range(values.shape[0]):
+    value = values[i]
+    new_total = total + value
+    if abs(total) >= abs(value):
+      error += (total - new_total) + value
+    else:
+      error += (value - new_total) + total
+    total = new_total
+    prefix[i + 1] = total
+    compensation[i + 1] = error
+  return prefix, compensation
+
+
+if numba is not None:
+  _prefix_sum_kernel = numba.njit(cache=True)(_prefix_sum_kernel)
+
+
+def prefix_sum(values: np.ndarray) -> tuple:
+  """
+  Compensated prefix sum of the values (with a leading 0).
+  Uses the numba kernel when available, otherwise an extended precision cumulative sum.
+  """
+  values = np.ascontiguousarray(values, dtype=np.float64)
+  if numba is not None:
+    return _prefix_sum_kernel(values)
+  extended = np.concatenate(([0], np.cumsum(values, dtype=np.longdouble)))
+  prefix = extended.astype(np.float64)
+  return prefix, (extended - prefix).astype(np.float64)
+
+
 # Chaikin Money Flow
 def chaikin_money_flow(dataframe, n=20, fillna=False) -> Series:
   """Chaikin Money Flow (CMF)
@@ -38617,14 +39506,14 @@ def chaikin_money_flow(dataframe, n=20, fillna=False) -> Series:
   )
   mfv = mfv.fillna(0.0)  # float division by zero
   mfv *= dataframe["volume"]
-  cmf = mfv.rolling(n, min_periods=0).sum() / dataframe["volume"].rolling(n, min_periods=0).sum()
+  cmf = RollingSum(mfv).sum(n, min_periods=0) / RollingSum(dataframe["volume"]).sum(n, min_periods=0)
   if fillna:
     cmf = cmf.replace([np.inf, -np.inf], np.nan).fillna(0)
   return Series(cmf, name="cmf")
 
 
 # Williams %R
-def williams_r(dataframe: DataFrame, period: int = 14) -> Series:
+def williams_r(dataframe: DataFrame, period: int = 14, extrema=None) -> Series:
   """Williams %R, or just %R, is a technical analysis oscillator showing the current closing price in relation to the high and low
   of the past N days (for a given N). It was developed by a publisher and promoter of trading materials, Larry Williams.
   Its purpose is to tell whether a stock or commodity market is trading near the high or the low, or somewhere in between,
@@ -38632,8 +39521,10 @@ def williams_r(dataframe: DataFrame, period: int = 14) -> Series:
   The oscillator is on a negative scale, from −100 (lowest) up to 0 (highest).
   """
 
-  highest_high = dataframe["high"].rolling(center=False, window=period).max()
-  lowest_low = dataframe["low"].rolling(center=False, window=period).min()
+  if extrema is None:
+    extrema = RollingExtrema(dataframe)
+  highest_high = extrema.max("high", period)
+  lowest_low = extrema.min("low", period)
 
   WR = Series(
     (highest_high - dataframe["close"]) / (highest_high - lowest_low),
@@ -38643,14 +39534,20 @@ def williams_r(dataframe: DataFrame, period: int = 14) -> Series:
   return WR * -100
 
 
+# NaN to 0, on an array
+def fill_nan(values: np.ndarray, value: float = 0.0) -> np.ndarray:
+  return np.where(np.isnan(values), value, values)
+
+
 # Volume Weighted Moving Average
 def vwma(dataframe: DataFrame, length: int = 10):
   """Indicator: Volume Weighted Moving Average (VWMA)"""
   # Calculate Result
-  pv = dataframe["close"] * dataframe["volume"]
-  vwma = Series(ta.SMA(pv, timeperiod=length) / ta.SMA(dataframe["volume"], timeperiod=length))
-  vwma = vwma.fillna(0, inplace=True)
-  return vwma
+  volume = dataframe["volume"].to_numpy(dtype=np.float64)
+  pv = dataframe["close"].to_numpy(dtype=np.float64) * volume
+  with np.errstate(divide="ignore", invalid="ignore"):
+    vwma = ta.SMA(pv, timeperiod=length) / ta.SMA(volume, timeperiod=length)
+  return Series(fill_nan(vwma), index=dataframe.index)
 
 
 # Exponential moving average of a volume weighted simple moving average
@@ -38661,12 +39558,13 @@ def ema_vwma_osc(dataframe, len_slow_ma):
 
 # VWAP bands
 def vwap_bands(dataframe, window_size=20, num_of_std=1):
-  df = dataframe.copy()
-  df["vwap"] = qtpylib.rolling_vwap(df, window=window_size)
-  rolling_std = df["vwap"].rolling(window=window_size).std()
-  df["vwap_low"] = df["vwap"] - (rolling_std * num_of_std)
-  df["vwap_high"] = df["vwap"] + (rolling_std * num_of_std)
-  return df["vwap_low"], df["vwap"], df["vwap_high"]
+  # Same as qtpylib.rolling_vwap(), on the columns only
+  volume = dataframe["volume"]
+  typical = (dataframe["high"] + dataframe["low"] + dataframe["close"]) / 3
+  vwap = (volume * typical).rolling(window=window_size).sum() / volume.rolling(window=window_size).sum()
+  vwap = vwap.replace([np.inf, -np.inf], np.nan).ffill()
+  rolling_std = vwap.rolling(window=window_size).std()
+  return vwap - (rolling_std * num_of_std), vwap, vwap + (rolling_std * num_of_std)
 
 
 def t3_average(dataframe, length=5):
@@ -38674,28 +39572,20 @@ def t3_average(dataframe, length=5):
   T3 Average by HPotter on Tradingview
   https://www.tradingview.com/script/qzoC9H1I-T3-Average/
   """
-  df = dataframe.copy()
-
-  df["xe1"] = ta.EMA(df["close"], timeperiod=length)
-  df["xe1"].fillna(0, inplace=True)
-  df["xe2"] = ta.EMA(df["xe1"], timeperiod=length)
-  df["xe2"].fillna(0, inplace=True)
-  df["xe3"] = ta.EMA(df["xe2"], timeperiod=length)
-  df["xe3"].fillna(0, inplace=True)
-  df["xe4"] = ta.EMA(df["xe3"], timeperiod=length)
-  df["xe4"].fillna(0, inplace=True)
-  df["xe5"] = ta.EMA(df["xe4"], timeperiod=length)
-  df["xe5"].fillna(0, inplace=True)
-  df["xe6"] = ta.EMA(df["xe5"], timeperiod=length)
-  df["xe6"].fillna(0, inplace=True)
+  # EMA of EMA ... (6 times), the warmup NaNs carry over (TA-Lib starts after them)
+  xe1 = ta.EMA(dataframe["close"].to_numpy(dtype=np.float64), timeperiod=length)
+  xe2 = ta.EMA(xe1, timeperiod=length)
+  xe3 = ta.EMA(xe2, timeperiod=length)
+  xe4 = ta.EMA(xe3, timeperiod=length)
+  xe5 = ta.EMA(xe4, timeperiod=length)
+  xe6 = ta.EMA(xe5, timeperiod=length)
   b = 0.7
   c1 = -b * b * b
   c2 = 3 * b * b + 3 * b * b * b
   c3 = -6 * b * b - 3 * b - 3 * b * b * b
   c4 = 1 + 3 * b + b * b * b + 3 * b * b
-  df["T3Average"] = c1 * df["xe6"] + c2 * df["xe5"] + c3 * df["xe4"] + c4 * df["xe3"]
 
-  return df["T3Average"]
+  return Series(c1 * xe6 + c2 * xe5 + c3 * xe4 + c4 * xe3, index=dataframe.index)
 
 
 def pivot_points(dataframe: DataFrame, mode="fibonacci") -> Series:
@@ -38734,37 +39624,39 @@ def pivot_points(dataframe: DataFrame, mode="fibonacci") -> Series:
 
 
 def heikin_ashi(dataframe, smooth_inputs=False, smooth_outputs=False, length=10):
-  df = dataframe[["open", "close", "high", "low"]].copy().fillna(0)
+  open_ = fill_nan(dataframe["open"].to_numpy(dtype=np.float64))
+  high = fill_nan(dataframe["high"].to_numpy(dtype=np.float64))
+  low = fill_nan(dataframe["low"].to_numpy(dtype=np.float64))
+  close = fill_nan(dataframe["close"].to_numpy(dtype=np.float64))
+  # NOTE: "length" isn't used by TA-Lib (it's not the "timeperiod"), the EMAs are the default 30 periods ones
   if smooth_inputs:
-    df["open_s"] = ta.EMA(df["open"], timeframe=length)
-    df["high_s"] = ta.EMA(df["high"], timeframe=length)
-    df["low_s"] = ta.EMA(df["low"], timeframe=length)
-    df["close_s"] = ta.EMA(df["close"], timeframe=length)
-
-    open_ha = (df["open_s"].shift(1) + df["close_s"].shift(1)) / 2
-    high_ha = df.loc[:, ["high_s", "open_s", "close_s"]].max(axis=1)
-    low_ha = df.loc[:, ["low_s", "open_s", "close_s"]].min(axis=1)
-    close_ha = (df["open_s"] + df["high_s"] + df["low_s"] + df["close_s"]) / 4
-  else:
-    open_ha = (df["open"].shift(1) + df["close"].shift(1)) / 2
-    high_ha = df.loc[:, ["high", "open", "close"]].max(axis=1)
-    low_ha = df.loc[:, ["low", "open", "close"]].min(axis=1)
-    close_ha = (df["open"] + df["high"] + df["low"] + df["close"]) / 4
-
-  open_ha = open_ha.fillna(0)
-  high_ha = high_ha.fillna(0)
-  low_ha = low_ha.fillna(0)
-  close_ha = close_ha.fillna(0)
+    open_ = ta.EMA(open_)
+    high = ta.EMA(high)
+    low = ta.EMA(low)
+    close = ta.EMA(close)
+
+  open_ha = np.full_like(open_, np.nan)
+  open_ha[1:] = (open_[:-1] + close[:-1]) / 2
+  # The max/min skip the NaNs, like the DataFrame ones
+  high_ha = np.fmax(np.fmax(high, open_), close)
+  low_ha = np.fmin(np.fmin(low, open_), close)
+  close_ha = (open_ + high + low + close) / 4
+
+  open_ha = fill_nan(open_ha)
+  high_ha = fill_nan(high_ha)
+  low_ha = fill_nan(low_ha)
+  close_ha = fill_nan(close_ha)
 
   if smooth_outputs:
-    open_sha = ta.EMA(open_ha, timeframe=length)
-    high_sha = ta.EMA(high_ha, timeframe=length)
-    low_sha = ta.EMA(low_ha, timeframe=length)
-    close_sha = ta.EMA(close_ha, timeframe=length)
-
-    return open_sha, close_sha, low_sha
-  else:
-    return open_ha, close_ha, low_ha
+    open_ha = ta.EMA(open_ha)
+    close_ha = ta.EMA(close_ha)
+    low_ha = ta.EMA(low_ha)
+
+  return (
+    Series(open_ha, index=dataframe.index),
+    Series(close_ha, index=dataframe.index),
+    Series(low_ha, index=dataframe.index),
+  )
 
 
 # Range midpoint acts as Support
@@ -38791,6 +39683,1536 @@ def is_resistance(row_data) -> bool:
   return result
 
 
+# Support/Resistance on the window ending at each row
+def rolling_support_resistance(series: Series, window: int = 5, resistance: bool = True) -> np.ndarray:
+  """
+  Vectorized version of series.rolling(window, center=True).apply(is_resistance/is_support).shift(window // 2).
+  The window must be odd. Rows without a full window, or with NaN in the window, are True (the rolling apply
+  leaves them NaN, which np.where treats as True).
+  """
+  if window < 3 or window % 2 == 0:
+    raise ValueError(f"The S/R window must be odd and at least 3, got {window}")
+  values = series.to_numpy(dtype=np.float64)
+  result = np.ones(len(values), dtype=bool)
+  if len(values) < window:
+    return result
+  half = window // 2
+  windows = sliding_window_view(values, window)
+  first_half = windows[:, : half + 1]
+  second_half = windows[:, half:]
+  if resistance:
+    is_level = (first_half[:, :-1] < first_half[:, 1:]).all(axis=1) & (second_half[:, :-1] > second_half[:, 1:]).all(
+      axis=1
+    )
+  else:
+    is_level = (first_half[:, :-1] > first_half[:, 1:]).all(axis=1) & (second_half[:, :-1] < second_half[:, 1:]).all(
+      axis=1
+    )
+  result[window - 1 :] = is_level | np.isnan(windows).any(axis=1)
+  return result
+
+
+def rolling_support(series: Series, window: int = 5) -> np.ndarray:
+  return rolling_support_resistance(series, window, resistance=False)
+
+
+def rolling_resistance(series: Series, window: int = 5) -> np.ndarray:
+  return rolling_support_resistance(series, window, resistance=True)
+
+
+# Informative alignment
+def merge_informative_pairs(dataframe: DataFrame, timeframe: str, informatives: list) -> DataFrame:
+  """
+  Merge the informative dataframes (informative, timeframe_inf, drop_columns) in one pass, the columns are suffixed
+  with the informative timeframe like "merge_informative_pair()" (with ffill) does.
+
+  Every row gets the last informative candle closed at its date: one searchsorted per informative on the integer
+  timestamps, then all the columns are gathered and concatenated at once, instead of a full merge of the growing
+  dataframe per informative.
+  """
+  minutes = timeframe_to_minutes(timeframe)
+  dates = dataframe["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+  aligned = [dataframe]
+  for informative, timeframe_inf, drop_columns in informatives:
+    minutes_inf = timeframe_to_minutes(timeframe_inf)
+    if minutes_inf < minutes:
+      raise ValueError(
+        "Tried to merge a faster timeframe to a slower timeframe."
+        "This would create new rows, and can throw off your regular indicators."
+      )
+    # The informative candle is usable from its close, minus a candle so the merge isn't delayed by one candle
+    merge_dates = informative["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    merge_dates = merge_dates + (minutes_inf - minutes) * 60_000_000_000
+    indexer = np.searchsorted(merge_dates, dates, side="right") - 1
+    columns = informative.columns.difference(drop_columns, sort=False)
+    # No previous informative candle (-1) gives a NaN row
+    informative_aligned = informative[columns].reset_index(drop=True).reindex(indexer)
+    informative_aligned.index = dataframe.index
+    informative_aligned.columns = [f"{column}_{timeframe_inf}" for column in columns]
+    aligned.append(informative_aligned)
+  return pd.concat(aligned, axis=1)
+
+
+# Enter tag bits, a bit per buy condition (bit 0 is the "empty" tag), in 64 bit words per candle
+def enter_tag_words(conditions: int) -> int:
+  return conditions // 64 + 1
+
+
+def set_enter_tag_bit(bits: np.ndarray, mask, index: int):
+  bits[np.asarray(mask, dtype=bool), index // 64] |= np.uint64(1 << (index % 64))
+
+
+# The enter_tag strings of the candles with a signal ("" for the others)
+def decode_enter_tags(bits: np.ndarray) -> np.ndarray:
+  tags = np.full(len(bits), "", dtype=object)
+  for row in np.flatnonzero(bits.any(axis=1)):
+    words = bits[row]
+    tags[row] = "".join(
+      f"{word_index * 64 + bit} "
+      for word_index in range(len(words))
+      for bit in range(64)
+      if (int(words[word_index]) >> bit) & 1
+    )
+  return tags
+
+
+# The enter tag of a trade as an int bitmask, any unknown tag sets all the bits
+@lru_cache(maxsize=1024)
+def enter_tag_bits(enter_tag: str) -> int:
+  bits = 0
+  for tag in enter_tag.split():
+    if tag == "empty":
+      bits |= 1
+    elif tag.isdigit():
+      bits |= 1 << int(tag)
+    else:
+      return -1
+  return bits
+
+
+# All the tags of the trade are in the mode
+def is_enter_tag_mode(bits: int, mode_bits: int) -> bool:
+  return (bits & ~mode_bits) == 0
+
+
+# Strategy source
+def strategy_source_methods(strategy_class) -> dict:
+  """
+  The parsed (ast) methods of the strategy class, with the module defining them: {name: (FunctionDef, module)}.
+
+  Only the most derived definition of each method, up to IStrategy. Parsing the modules is much faster than
+  "inspect.getsource()" per method.
+  """
+  methods = {}
+  modules = {}
+  for cls in strategy_class.__mro__:
+    if cls is IStrategy or cls is object:
+      break
+    module = inspect.getmodule(cls)
+    if module not in modules:
+      modules[module] = ast.parse(inspect.getsource(module))
+    for node in modules[module].body:
+      if isinstance(node, ast.ClassDef) and node.name == cls.__name__:
+        for func in node.body:
+          if isinstance(func, ast.FunctionDef) and func.name not in methods:
+            methods[func.name] = (func, module)
+  return methods
+
+
+# Lazy indicators guard
+def indicators_needed(needed: Optional[set], *columns) -> bool:
+  return needed is None or not needed.isdisjoint(columns)
+
+
+# Parallel buy conditions benchmark, "populate_entry_trend()" on copies of an analyzed dataframe, serial then with 1
+# to N (default: the number of cores, doubling) threads, the signals must be the same as the serial ones
+def buy_conditions_benchmark(
+  strategy, dataframe: DataFrame, metadata: dict, threads: Optional[list] = None, repeat: int = 3
+) -> DataFrame:
+  if threads is None:
+    threads = [1]
+    while threads[-1] * 2 <= (os.cpu_count() or 1):
+      threads.append(threads[-1] * 2)
+  enabled, workers, executor = (
+    strategy.parallel_buy_conditions_enabled,
+    strategy.parallel_buy_conditions_threads,
+    strategy.buy_conditions_executor,
+  )
+  rows = []
+  expected = None
+  try:
+    for count in [0] + list(threads):
+      strategy.parallel_buy_conditions_enabled = count > 0
+      strategy.parallel_buy_conditions_threads = count
+      strategy.buy_conditions_executor = None
+      timings = []
+      for _ in range(repeat):
+        tik = time.perf_counter()
+        result = strategy.populate_entry_trend(dataframe.copy(), metadata)
+        timings.append(time.perf_counter() - tik)
+      if strategy.buy_conditions_executor is not None:
+        strategy.buy_conditions_executor.shutdown()
+      signals = result[["enter_tag", "enter_long"]]
+      if expected is None:
+        expected = signals
+      elif not signals.equals(expected):
+        raise RuntimeError(f"The signals with {count} threads differ from the serial ones")
+      rows.append({"threads": count, "seconds": min(timings)})
+  finally:
+    strategy.parallel_buy_conditions_enabled = enabled
+    strategy.parallel_buy_conditions_threads = workers
+    strategy.buy_conditions_executor = executor
+  report = DataFrame(rows)
+  report["speedup"] = report["seconds"].iloc[0] / report["seconds"]
+  return report
+
+
+class RollingSum:
+  """
+  Rolling sums/means of a series for any number of window lengths.
+
+  Built on one compensated (Neumaier) prefix sum of the values centered on their mean, every window length is
+  a single subtraction pass. Windows with NaN values are NaN, like rolling(window).sum(), unless min_periods=0
+  where NaN values are skipped and the incomplete windows at the start are summed.
+  """
+
+  def __init__(self, series: Series):
+    values = np.asarray(series, dtype=np.float64)
+    self.index = series.index
+    nan_mask = np.isnan(values)
+    self._center = values[~nan_mask].mean() if (~nan_mask).any() else 0.0
+    self._valid_count = np.concatenate(([0], np.cumsum(~nan_mask)))
+    self._prefix, self._compensation = prefix_sum(np.where(nan_mask, 0.0, values - self._center))
+
+  def _window_sum(self, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    centered = (self._prefix[end] - self._prefix[start]) + (self._compensation[end] - self._compensation[start])
+    return centered + self._center * (self._valid_count[end] - self._valid_count[start])
+
+  def sum(self, window: int, min_periods: Optional[int] = None) -> Series:
+    num_rows = len(self._prefix) - 1
+    result = np.full(num_rows, np.nan)
+    ends = np.arange(1, num_rows + 1)
+    if min_periods == 0:
+      head = min(window - 1, num_rows)
+      result[:head] = self._window_sum(np.zeros(head, dtype=np.int64), ends[:head])
+    if num_rows >= window:
+      result[window - 1 :] = self._window_sum(ends[window - 1 :] - window, ends[window - 1 :])
+      if min_periods != 0:
+        has_nan = (self._valid_count[window:] - self._valid_count[:-window]) < window
+        result[window - 1 :][has_nan] = np.nan
+    return Series(result, index=self.index)
+
+  def mean(self, window: int) -> Series:
+    return self.sum(window) / window
+
+
+class RollingExtrema:
+  """
+  Rolling max/min of the columns of a dataframe, for any number of window lengths.
+
+  Keeps a sparse table per column, the max/min over the power of two windows ending at each row, so every
+  window length is served from the same table with one extra pass. Same results as rolling(window).max()/min(),
+  including NaN for incomplete windows or windows with NaN values.
+  """
+
+  def __init__(self, dataframe: DataFrame):
+    self.dataframe = dataframe
+    self._tables = {}
+
+  def max(self, column: str, window: int) -> Series:
+    return self._rolling(column, window, np.maximum)
+
+  def min(self, column: str, window: int) -> Series:
+    return self._rolling(column, window, np.minimum)
+
+  def _table(self, column: str, func, level: int) -> list:
+    table = self._tables.get((column, func))
+    if table is None:
+      table = [self.dataframe[column].to_numpy(dtype=np.float64)]
+      self._tables[(column, func)] = table
+    while len(table) <= level:
+      previous = table[-1]
+      step = 1 << (len(table) - 1)
+      current = np.full_like(previous, np.nan)
+      current[step:] = func(previous[step:], previous[:-step])
+      table.append(current)
+    return table
+
+  def _rolling(self, column: str, window: int, func) -> Series:
+    level = window.bit_length() - 1
+    table = self._table(column, func, level)[level]
+    result = np.full_like(table, np.nan)
+    offset = window - (1 << level)
+    result[window - 1 :] = func(table[window - 1 :], table[window - 1 - offset : len(table) - offset])
+    return Series(result, index=self.dataframe.index)
+
+
+class IndicatorRegistry:
+  """
+  Static map of the indicator columns, parsed from the strategy source.
+
+  Records the columns read by each buy condition ("if index == N" blocks of "populate_entry_trend()"), by the common
+  entry logic and by every other method, plus the columns produced by each "indicators_needed()" guarded block of the
+  indicator methods and the columns (or the local variables of other blocks) that block depends on.
+  """
+
+  # Indicator methods, with the strategy attribute holding their timeframe
+  producers = {
+    "informative_1d_indicators": "info_timeframe_1d",
+    "informative_1h_indicators": "info_timeframe_1h",
+    "informative_15m_indicators": "info_timeframe_15m",
+    "normal_tf_indicators": "timeframe",
+  }
+  # Methods that only compute (not guarded) indicators or don't read any
+  ignored = {
+    "populate_indicators",
+    "populate_entry_trend",
+    "resampled_tf_indicators",
+    "base_tf_btc_indicators",
+    "info_tf_btc_indicators",
+    "daily_tf_btc_indicators",
+    "btc_informative",
+  }
+  # Variables holding a dataframe or a candle
+  frame_names = re.compile(r"^(dataframe|df|informative_\w+|last_candle|previous_candle_\d+)$")
+
+  def __init__(self, strategy_class):
+    self.methods = {name: func for name, (func, _) in strategy_source_methods(strategy_class).items()}
+
+    self.conditions = {}
+    self.entry_columns = set()
+    if "populate_entry_trend" in self.methods:
+      self._parse_entry(self.methods["populate_entry_trend"])
+    self.method_columns = {name: self.columns(func) for name, func in self.methods.items()}
+    self.calls = {name: self.self_calls(func) for name, func in self.methods.items()}
+    self.blocks = {name: self._parse_blocks(self.methods[name]) for name in self.producers if name in self.methods}
+
+  @classmethod
+  def column_refs(cls, node):
+    # The "frame["column"]" subscripts under the node
+    for child in ast.walk(node):
+      if (
+        isinstance(child, ast.Subscript)
+        and isinstance(child.value, ast.Name)
+        and cls.frame_names.match(child.value.id)
+        and isinstance(child.slice, ast.Constant)
+        and isinstance(child.slice.value, str)
+      ):
+        yield child
+
+  @classmethod
+  def columns(cls, node) -> set:
+    return {ref.slice.value for ref in cls.column_refs(node)}
+
+  def self_calls(self, node) -> set:
+    return {
+      child.func.attr
+      for child in ast.walk(node)
+      if isinstance(child, ast.Call)
+      and isinstance(child.func, ast.Attribute)
+      and isinstance(child.func.value, ast.Name)
+      and child.func.value.id == "self"
+      and child.func.attr in self.methods
+    }
+
+  @staticmethod
+  def condition_index(node) -> Optional[int]:
+    if (
+      isinstance(node, ast.If)
+      and isinstance(node.test, ast.Compare)
+      and isinstance(node.test.left, ast.Name)
+      and node.test.left.id == "index"
+      and len(node.test.ops) == 1
+      and isinstance(node.test.ops[0], ast.Eq)
+      and isinstance(node.test.comparators[0], ast.Constant)
+    ):
+      return node.test.comparators[0].value
+    return None
+
+  def _parse_entry(self, func):
+    condition_refs = set()
+    for node in ast.walk(func):
+      index = self.condition_index(node)
+      if index is not None:
+        refs = [ref for statement in node.body for ref in self.column_refs(statement)]
+        self.conditions[index] = {ref.slice.value for ref in refs}
+        condition_refs.update(map(id, refs))
+    self.entry_columns = {ref.slice.value for ref in self.column_refs(func) if id(ref) not in condition_refs}
+
+  def _parse_blocks(self, func) -> list:
+    # [(produced columns, dependencies)] of the guarded blocks
+    guarded = []
+    for node in ast.walk(func):
+      if (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Call)
+        and isinstance(node.test.func, ast.Name)
+        and node.test.func.id == "indicators_needed"
+      ):
+        produced = {arg.value for arg in node.test.args[1:] if isinstance(arg, ast.Constant)}
+        body = ast.Module(body=node.body, type_ignores=[])
+        names = [child for child in ast.walk(body) if isinstance(child, ast.Name)]
+        stored = {name.id for name in names if isinstance(name.ctx, ast.Store)}
+        loaded = {name.id for name in names if isinstance(name.ctx, ast.Load)} - stored
+        guarded.append((produced, self.columns(body), stored, loaded))
+
+    # Local variables computed in another block (eg. the RSI bank reused by the CRSI)
+    producers = {name: produced for produced, _, stored, _ in guarded for name in stored}
+    blocks = []
+    for produced, dependencies, _, loaded in guarded:
+      for name in loaded & producers.keys():
+        dependencies = dependencies | producers[name]
+      blocks.append((produced, dependencies))
+    return blocks
+
+  @staticmethod
+  def protection_columns(protection_params: dict) -> set:
+    # The columns built from the protection params in "populate_entry_trend()"
+    columns = set()
+    if protection_params["ema_fast"]:
+      columns.add(f"ema_{protection_params['ema_fast_len']}")
+    if protection_params["ema_slow"]:
+      columns.add(f"ema_{protection_params['ema_slow_len']}_1h")
+    if protection_params["close_above_ema_fast"]:
+      columns.add(f"ema_{protection_params['close_above_ema_fast_len']}")
+    if protection_params["close_above_ema_slow"]:
+      columns.add(f"ema_{protection_params['close_above_ema_slow_len']}_1h")
+    for pivot_type in ("close_over_pivot_type", "close_under_pivot_type"):
+      if protection_params[pivot_type] != "none":
+        columns.add(f"{protection_params[pivot_type]}_1d")
+    return columns
+
+  def consumed_columns(self, strategy) -> set:
+    # Columns read by the enabled buy conditions & protections
+    consumed = set()
+    for index, protection_params in strategy.buy_protection_params.items():
+      if strategy.buy_params[f"buy_condition_{index}_enable"]:
+        consumed |= self.entry_columns | self.conditions.get(index, set())
+        consumed |= self.protection_columns(protection_params)
+
+    # Columns read by the exits and the rest of the strategy, the disabled sell families are skipped when only called
+    # from "custom_exit()"
+    disabled = {name for name, enabled in strategy.sell_families_enabled.items() if not enabled}
+    pending = [
+      name for name in self.methods if name not in self.producers and name not in self.ignored and name not in disabled
+    ]
+    visited = set(pending)
+    while pending:
+      name = pending.pop()
+      consumed |= self.method_columns[name]
+      for callee in self.calls[name]:
+        if callee in visited or callee in self.producers or (name == "custom_exit" and callee in disabled):
+          continue
+        visited.add(callee)
+        pending.append(callee)
+    return consumed
+
+  def needed_columns(self, strategy) -> dict:
+    """
+    The needed columns per timeframe: the consumed ones (split by their informative suffix) and, transitively, the
+    columns of the blocks producing them and their dependencies.
+    """
+    timeframes = {name: getattr(strategy, attr) for name, attr in self.producers.items()}
+    suffixes = {
+      f"_{timeframe}": timeframe for name, timeframe in timeframes.items() if name != "normal_tf_indicators"
+    }
+    needed = {timeframe: set() for timeframe in timeframes.values()}
+    for column in self.consumed_columns(strategy):
+      for suffix, timeframe in suffixes.items():
+        if column.endswith(suffix):
+          needed[timeframe].add(column[: -len(suffix)])
+          break
+      else:
+        needed[strategy.timeframe].add(column)
+
+    for name, blocks in self.blocks.items():
+      columns = needed[timeframes[name]]
+      pending = list(columns)
+      while pending:
+        column = pending.pop()
+        for produced, dependencies in blocks:
+          if column in produced:
+            for dependency in produced | dependencies:
+              if dependency not in columns:
+                columns.add(dependency)
+                pending.append(dependency)
+    return needed
+
+
+class BuyConditionsPlan:
+  """
+  Compiled buy conditions: the "item_buy_logic.append()" expressions of the "if index == N" blocks of
+  "populate_entry_trend()" turned into one evaluation plan over the column arrays.
+
+  The sub expressions used more than once (in a condition or across conditions) are evaluated once per dataframe, the
+  chains of "&" / "|" are accumulated in place. The comparisons, the arithmetic and the boolean logic on numeric and
+  boolean arrays run on numpy, everything else (methods like "shift()" or "rolling()", functions, object columns) on
+  the pandas objects, so the result is bit identical to the pandas expressions. A condition with anything else (any
+  other statement, unknown names) isn't compiled and runs the Python code.
+  """
+
+  compare_ops = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+  }
+  compare_methods = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "eq": operator.eq,
+    "ne": operator.ne,
+  }
+  arithmetic_ops = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+  logical_ops = {ast.BitAnd: operator.and_, ast.BitOr: operator.or_}
+  inplace_ops = {operator.and_: np.bitwise_and, operator.or_: np.bitwise_or}
+
+  class Unsupported(Exception):
+    pass
+
+  class Node:
+    __slots__ = ("kind", "key", "args", "shared")
+
+    def __init__(self, kind: str, key: str, *args):
+      self.kind = kind
+      self.key = key
+      self.args = args
+      self.shared = False
+
+  def __init__(self, strategy_class, env_names: tuple = ()):
+    func, module = strategy_source_methods(strategy_class)["populate_entry_trend"]
+    self.globals = vars(module)
+    self.env_names = set(env_names)
+    self.local_names = {arg.arg for arg in func.args.args} | {
+      node.id for node in ast.walk(func) if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store)
+    }
+    self.conditions = {}
+    uses = {}
+    for node in ast.walk(func):
+      index = IndicatorRegistry.condition_index(node)
+      if index is None:
+        continue
+      try:
+        self.conditions[index] = [self.compile(self.appended_expression(statement)) for statement in node.body]
+      except self.Unsupported as exc:
+        log.debug("Buy condition %s isn't compiled: %s", index, exc)
+        continue
+      for item in self.conditions[index]:
+        self.count_uses(item, uses)
+    for item in self.nodes():
+      item.shared = uses.get(item.key, 0) > 1
+
+    # The shared values are released after the last condition using them (in the source order)
+    last_uses = {}
+    for index, items in self.conditions.items():
+      for item in self.nodes(items):
+        if item.shared:
+          last_uses[item.key] = index
+    self.releases = {}
+    for key, index in last_uses.items():
+      self.releases.setdefault(index, []).append(key)
+    self.shared_keys = {
+      index: list(dict.fromkeys(item.key for item in self.nodes(items) if item.shared))
+      for index, items in self.conditions.items()
+    }
+
+  def nodes(self, items: Optional[list] = None):
+    pending = list(items) if items is not None else [item for items in self.conditions.values() for item in items]
+    while pending:
+      item = pending.pop()
+      yield item
+      pending.extend(arg for arg in self.children(item))
+
+  @classmethod
+  def children(cls, item) -> list:
+    children = []
+    for arg in item.args:
+      if isinstance(arg, cls.Node):
+        children.append(arg)
+      elif isinstance(arg, (list, tuple)):
+        children.extend(child for child in arg if isinstance(child, cls.Node))
+      elif isinstance(arg, dict):
+        children.extend(child for child in arg.values() if isinstance(child, cls.Node))
+    return children
+
+  def count_uses(self, item, uses: dict):
+    uses[item.key] = uses.get(item.key, 0) + 1
+    if uses[item.key] == 1:
+      for child in self.children(item):
+        self.count_uses(child, uses)
+
+  def appended_expression(self, statement):
+    if (
+      isinstance(statement, ast.Expr)
+      and isinstance(statement.value, ast.Call)
+      and isinstance(statement.value.func, ast.Attribute)
+      and statement.value.func.attr == "append"
+      and isinstance(statement.value.func.value, ast.Name)
+      and statement.value.func.value.id == "item_buy_logic"
+      and len(statement.value.args) == 1
+      and not statement.value.keywords
+    ):
+      return statement.value.args[0]
+    raise self.Unsupported(ast.unparse(statement)[:80])
+
+  def compile(self, node):
+    key = ast.dump(node)
+    if isinstance(node, ast.Constant):
+      return self.Node("constant", key, node.value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+      if isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, (int, float)):
+        return self.Node("constant", key, -node.operand.value)
+      return self.Node("unary", key, operator.neg, self.compile(node.operand))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Invert):
+      return self.Node("unary", key, operator.invert, self.compile(node.operand))
+    if isinstance(node, ast.Subscript):
+      if (
+        isinstance(node.value, ast.Name)
+        and node.value.id == "dataframe"
+        and isinstance(node.slice, ast.Constant)
+        and isinstance(node.slice.value, str)
+      ):
+        return self.Node("column", key, node.slice.value)
+      raise self.Unsupported(ast.unparse(node)[:80])
+    if isinstance(node, ast.Name):
+      if node.id in self.env_names:
+        return self.Node("env", key, node.id)
+      if node.id in self.globals and node.id not in self.local_names:
+        return self.Node("constant", key, self.globals[node.id])
+      raise self.Unsupported(node.id)
+    if isinstance(node, ast.Attribute):
+      if isinstance(node.value, ast.Name) and node.value.id == "self":
+        return self.Node("attribute", key, node.attr)
+      receiver = self.compile(node.value)
+      if receiver.kind == "constant":
+        return self.Node("constant", key, getattr(receiver.args[0], node.attr))
+      raise self.Unsupported(ast.unparse(node)[:80])
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in self.compare_ops:
+      return self.Node(
+        "compare", key, self.compare_ops[type(node.ops[0])], self.compile(node.left), self.compile(node.comparators[0])
+      )
+    if isinstance(node, ast.BinOp) and type(node.op) in self.arithmetic_ops:
+      return self.Node(
+        "arithmetic", key, self.arithmetic_ops[type(node.op)], self.compile(node.left), self.compile(node.right)
+      )
+    if isinstance(node, ast.BinOp) and type(node.op) in self.logical_ops:
+      # Flatten the (left associative) chain of the same operator
+      operands = [node.right]
+      left = node.left
+      while isinstance(left, ast.BinOp) and type(left.op) is type(node.op):
+        operands.append(left.right)
+        left = left.left
+      operands.append(left)
+      return self.Node(
+        "logical", key, self.logical_ops[type(node.op)], [self.compile(operand) for operand in reversed(operands)]
+      )
+    if isinstance(node, ast.Call) and not any(keyword.arg is None for keyword in node.keywords):
+      args = [self.compile(arg) for arg in node.args]
+      kwargs = {keyword.arg: self.compile(keyword.value) for keyword in node.keywords}
+      if isinstance(node.func, ast.Attribute):
+        receiver = self.compile(node.func.value) if not isinstance(node.func.value, ast.Name) else None
+        if receiver is None:
+          function = self.compile(node.func)
+          if function.kind == "constant":
+            return self.Node("call", key, function.args[0], args, kwargs)
+          raise self.Unsupported(ast.unparse(node)[:80])
+        if node.func.attr in self.compare_methods and len(args) == 1 and not kwargs:
+          return self.Node("compare", key, self.compare_methods[node.func.attr], receiver, args[0])
+        return self.Node("method", key, node.func.attr, receiver, args, kwargs)
+      function = self.compile(node.func)
+      if function.kind == "constant":
+        return self.Node("call", key, function.args[0], args, kwargs)
+    raise self.Unsupported(ast.unparse(node)[:80])
+
+  def evaluate(self, index: int, dataframe: DataFrame, cache: dict, strategy, release: bool = True, **env) -> Series:
+    """
+    The "&" of the condition expressions, "self" being the strategy and the env the needed local variables. The cache
+    holds the shared values for the dataframe, it must be a new one per dataframe.
+    """
+    context = (dataframe, cache, strategy, env)
+    result = np.ones(len(dataframe), dtype=bool)
+    for item in self.conditions[index]:
+      result = self.accumulate(operator.and_, result, self.value(item, context), dataframe)
+    if release:
+      for key in self.releases.get(index, []):
+        cache.pop(key, None)
+    return Series(result, index=dataframe.index)
+
+  def evaluate_all(self, indexes: list, dataframe: DataFrame, strategy, executor, **env) -> dict:
+    """
+    "evaluate()" of the conditions, on the executor threads. The shared values are cached for all the threads (two
+    threads computing the same one get the same value) and released once the conditions using them are done.
+    """
+    cache = {}
+    remaining = {}
+    for index in indexes:
+      for key in self.shared_keys[index]:
+        remaining[key] = remaining.get(key, 0) + 1
+    lock = threading.Lock()
+
+    def evaluate(index: int) -> Series:
+      result = self.evaluate(index, dataframe, cache, strategy, release=False, **env)
+      with lock:
+        for key in self.shared_keys[index]:
+          remaining[key] -= 1
+          if remaining[key] == 0:
+            cache.pop(key, None)
+      return result
+
+    return dict(zip(indexes, executor.map(evaluate, indexes)))
+
+  @staticmethod
+  def is_numeric(value, kinds: str = "iuf") -> bool:
+    if isinstance(value, np.ndarray):
+      return value.dtype.kind in kinds
+    return isinstance(value, (int, float, np.number, np.bool_)) and (
+      "b" in kinds or not isinstance(value, (bool, np.bool_))
+    )
+
+  @staticmethod
+  def to_pandas(value, dataframe: DataFrame):
+    if isinstance(value, np.ndarray):
+      return Series(value, index=dataframe.index, copy=False)
+    return value
+
+  @staticmethod
+  def to_numpy(value):
+    if isinstance(value, Series):
+      return value.to_numpy()
+    return value
+
+  def accumulate(self, op, accumulator: np.ndarray, value, dataframe: DataFrame) -> np.ndarray:
+    # In place "&" / "|" on a boolean accumulator owned by the plan
+    if isinstance(value, np.ndarray) and value.dtype.kind == "b":
+      return self.inplace_ops[op](accumulator, value, out=accumulator)
+    if isinstance(value, (bool, np.bool_)):
+      accumulator[:] = op(accumulator, value)
+      return accumulator
+    return np.array(op(self.to_pandas(accumulator, dataframe), self.to_pandas(value, dataframe)), dtype=bool)
+
+  def value(self, item, context):
+    dataframe, cache, strategy, env = context
+    if item.shared and item.key in cache:
+      return cache[item.key]
+    kind = item.kind
+    if kind == "constant":
+      return item.args[0]
+    if kind == "column":
+      value = dataframe[item.args[0]].to_numpy()
+    elif kind == "env":
+      value = env[item.args[0]]
+    elif kind == "attribute":
+      value = getattr(strategy, item.args[0])
+    elif kind in ("compare", "arithmetic"):
+      op, left, right = item.args
+      left = self.value(left, context)
+      right = self.value(right, context)
+      kinds = "iuf" if kind == "arithmetic" else "biuf"
+      if self.is_numeric(left, kinds) and self.is_numeric(right, kinds):
+        with np.errstate(all="ignore"):
+          value = op(left, right)
+      else:
+        value = self.to_numpy(op(self.to_pandas(left, dataframe), self.to_pandas(right, dataframe)))
+    elif kind == "unary":
+      op, operand = item.args
+      operand = self.value(operand, context)
+      if self.is_numeric(operand, "b" if op is operator.invert else "iuf") and isinstance(operand, np.ndarray):
+        value = np.logical_not(operand) if op is operator.invert else op(operand)
+      else:
+        value = self.to_numpy(op(self.to_pandas(operand, dataframe)))
+    elif kind == "logical":
+      op, operands = item.args
+      first = self.value(operands[0], context)
+      second = self.value(operands[1], context)
+      if self.is_numeric(first, "b") and self.is_numeric(second, "b"):
+        value = op(first, second)
+      else:
+        value = self.to_numpy(op(self.to_pandas(first, dataframe), self.to_pandas(second, dataframe)))
+      if isinstance(value, np.ndarray):
+        # A new array (a pandas result can be a read only view), so the rest of the chain is done in place
+        value = np.array(value, dtype=bool)
+      for operand in operands[2:]:
+        operand = self.value(operand, context)
+        if isinstance(value, np.ndarray):
+          value = self.accumulate(op, value, operand, dataframe)
+        else:
+          value = self.to_numpy(op(self.to_pandas(value, dataframe), self.to_pandas(operand, dataframe)))
+    elif kind == "method":
+      name, receiver, args, kwargs = item.args
+      receiver = self.value(receiver, context)
+      args = [self.value(arg, context) for arg in args]
+      kwargs = {name: self.value(arg, context) for name, arg in kwargs.items()}
+      if (
+        name == "shift"
+        and isinstance(receiver, np.ndarray)
+        and receiver.dtype.kind == "f"
+        and len(args) == 1
+        and not kwargs
+        and isinstance(args[0], int)
+        and 0 <= args[0] <= len(receiver)
+      ):
+        value = np.empty_like(receiver)
+        value[: args[0]] = np.nan
+        value[args[0] :] = receiver[: len(receiver) - args[0]]
+      else:
+        value = self.to_numpy(getattr(self.to_pandas(receiver, dataframe), name)(*args, **kwargs))
+    elif kind == "call":
+      function, args, kwargs = item.args
+      args = [self.to_pandas(self.value(arg, context), dataframe) for arg in args]
+      kwargs = {name: self.to_pandas(self.value(arg, context), dataframe) for name, arg in kwargs.items()}
+      value = self.to_numpy(function(*args, **kwargs))
+    if item.shared:
+      cache[item.key] = value
+    return value
+
+
+class SellDecisionTables:
+  """
+  The "sell_*" methods with their "current_profit" band chains ("if 0.02 > current_profit >= 0.01: ... elif ...")
+  compiled into decision tables: a binary search on the band edges leads to the branches whose band holds the profit,
+  with only their remaining (non band) predicates checked in order. Same first matching branch as the chain.
+
+  A chain is compiled when every test has a band part (comparisons of "current_profit" with constants, alone or in an
+  "and"), the rest of a test can't have calls. Everything else is left as is (the nested chains are compiled too).
+  """
+
+  band_ops = {ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge}
+
+  def __init__(self, strategy_class, names: list, variable: str = "current_profit"):
+    self.variable = variable
+    self.chains = 0
+    self.functions = {}
+    methods = strategy_source_methods(strategy_class)
+    for name in names:
+      func, module = methods[name]
+      func = copy.deepcopy(func)
+      chains = self.chains
+      func.body = self.transform(func.body)
+      if self.chains == chains:
+        continue
+      func.decorator_list = []
+      code = compile(ast.fix_missing_locations(ast.Module(body=[func], type_ignores=[])), module.__file__, "exec")
+      namespace = {}
+      exec(code, vars(module), namespace)
+      self.functions[name] = namespace[name]
+
+  def constant(self, node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+      return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+      value = self.constant(node.operand)
+      return -value if value is not None else None
+    return None
+
+  def band(self, node) -> Optional[list]:
+    # The (op, left, right) comparisons of a band test, None for anything else ("variable" stands for the profit)
+    if not isinstance(node, ast.Compare) or not all(type(op) in self.band_ops for op in node.ops):
+      return None
+    comparisons = []
+    operands = [node.left] + node.comparators
+    for op, left, right in zip(node.ops, operands, operands[1:]):
+      sides = []
+      for operand in (left, right):
+        if isinstance(operand, ast.Name) and operand.id == self.variable:
+          sides.append(self.variable)
+        else:
+          sides.append(self.constant(operand))
+      if sides.count(self.variable) != 1 or None in sides:
+        return None
+      comparisons.append((self.band_ops[type(op)], sides[0], sides[1]))
+    return comparisons
+
+  def split_test(self, test) -> Optional[tuple]:
+    # (band comparisons, the rest of the test or None), None if the test has no band part or a call
+    if any(isinstance(node, (ast.Call, ast.NamedExpr, ast.Await, ast.Yield)) for node in ast.walk(test)):
+      return None
+    values = test.values if isinstance(test, ast.BoolOp) and isinstance(test.op, ast.And) else [test]
+    bands = []
+    rest = []
+    for value in values:
+      band = self.band(value)
+      if band is None:
+        rest.append(value)
+      else:
+        bands.extend(band)
+    if not bands:
+      return None
+    if not rest:
+      return bands, None
+    return bands, rest[0] if len(rest) == 1 else ast.BoolOp(op=ast.And(), values=rest)
+
+  def transform(self, statements: list) -> list:
+    transformed = []
+    for statement in statements:
+      if isinstance(statement, ast.If):
+        transformed.extend(self.transform_if(statement))
+      else:
+        for field in ("body", "orelse", "finalbody"):
+          if isinstance(getattr(statement, field, None), list):
+            setattr(statement, field, self.transform(getattr(statement, field)))
+        transformed.append(statement)
+    return transformed
+
+  def transform_if(self, statement) -> list:
+    # The chain: the tests & bodies of the "if" and its "elif"s, then the "else" body
+    tests = []
+    bodies = []
+    node = statement
+    while True:
+      tests.append(node.test)
+      bodies.append(self.transform(node.body))
+      if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+        node = node.orelse[0]
+        continue
+      orelse = self.transform(node.orelse)
+      break
+    branches = [self.split_test(test) for test in tests]
+    if len(branches) < 2 or any(branch is None for branch in branches):
+      # Rebuild the chain with the transformed bodies
+      chain = orelse
+      for test, body in reversed(list(zip(tests, bodies))):
+        chain = [ast.If(test=test, body=body, orelse=chain)]
+      return [ast.copy_location(chain[0], statement)]
+    self.chains += 1
+    return [ast.copy_location(node, statement) for node in self.decision_table(branches, bodies, orelse)]
+
+  def decision_table(self, branches: list, bodies: list, orelse: list) -> list:
+    edges = {side for bands, _ in branches for _, left, right in bands for side in (left, right)}
+    edges = sorted(edges - {self.variable})
+    # The regions: below the first edge, each edge, between two edges, above the last edge
+    points = [edges[0] - 1.0]
+    for edge, next_edge in zip(edges, edges[1:] + [None]):
+      points.append(edge)
+      points.append((edge + next_edge) / 2.0 if next_edge is not None else edge + 1.0)
+
+    def holds(bands, point):
+      return all(
+        op(point if left == self.variable else left, point if right == self.variable else right)
+        for op, left, right in bands
+      )
+
+    candidates = [tuple(index for index, (bands, _) in enumerate(branches) if holds(bands, point)) for point in points]
+    # The runs of regions with the same candidates, split by "<" (the edge goes up) or "<=" (the edge goes down)
+    groups = [(candidates[0], None)]
+    for region in range(1, len(points)):
+      if candidates[region] != groups[-1][0]:
+        edge = edges[(region - 1) // 2]
+        groups.append((candidates[region], ast.LtE() if region % 2 == 0 else ast.Lt(), edge))
+
+    def leaf(indexes):
+      chain = copy.deepcopy(orelse)
+      for index in reversed(indexes):
+        rest = branches[index][1]
+        if rest is None:
+          chain = copy.deepcopy(bodies[index])
+        else:
+          chain = [ast.If(test=copy.deepcopy(rest), body=copy.deepcopy(bodies[index]), orelse=chain)]
+      return chain or [ast.Pass()]
+
+    def tree(groups):
+      if len(groups) == 1:
+        return leaf(groups[0][0])
+      middle = len(groups) // 2
+      _, op, edge = groups[middle]
+      test = ast.Compare(left=ast.Name(id=self.variable, ctx=ast.Load()), ops=[op], comparators=[ast.Constant(edge)])
+      above = [(groups[middle][0], None)] + groups[middle + 1 :]
+      return [ast.If(test=test, body=tree(groups[:middle]), orelse=tree(above))]
+
+    body = tree(groups)
+    if candidates[-1]:
+      # NaN isn't in any band, but goes above the last edge
+      test = ast.Compare(
+        left=ast.Name(id=self.variable, ctx=ast.Load()),
+        ops=[ast.NotEq()],
+        comparators=[ast.Name(id=self.variable, ctx=ast.Load())],
+      )
+      body = [ast.If(test=test, body=copy.deepcopy(orelse) or [ast.Pass()], orelse=body)]
+    return body
+
+
+class ExitSignalTables:
+  """
+  The sell methods that only depend on the profit and the last candle ("current_profit" compared with constants,
+  "last_candle" columns), evaluated for all the candles of a dataframe at once: for each profit region (below, on and
+  between the profit edges of the method) the outcome code of every candle, its "return" value.
+
+  The methods are interpreted on the column arrays, a row going down a branch when the test holds for it, with the
+  Python truth values. A method with anything else isn't tabled.
+  """
+
+  compare_ops = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+  }
+  arithmetic_ops = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+
+  class Unsupported(Exception):
+    pass
+
+  def __init__(self, strategy_class, names: list):
+    self.methods = {}
+    methods = strategy_source_methods(strategy_class)
+    for name in names:
+      func, _ = methods[name]
+      try:
+        self.methods[name] = self.parse(func)
+      except self.Unsupported as exc:
+        log.debug("Sell method %s isn't tabled: %s", name, exc)
+
+  def parse(self, func) -> tuple:
+    # The profit edges & the "return" values (code 0 is for no "return") of the method
+    arguments = [arg.arg for arg in func.args.args]
+    if arguments[:1] != ["self"] or "current_profit" not in arguments or "last_candle" not in arguments:
+      raise self.Unsupported("arguments")
+    edges = set()
+    outcomes = [None]
+    self.check(func.body)
+    for node in (node for statement in func.body for node in ast.walk(statement)):
+      if isinstance(node, ast.Compare):
+        operands = [node.left] + node.comparators
+        for left, right in zip(operands, operands[1:]):
+          for operand, other in ((left, right), (right, left)):
+            if isinstance(operand, ast.Name) and operand.id == "current_profit":
+              edge = ast.literal_eval(other) if isinstance(other, (ast.Constant, ast.UnaryOp)) else None
+              if isinstance(edge, bool) or not isinstance(edge, (int, float)):
+                raise self.Unsupported(ast.unparse(node)[:80])
+              edges.add(edge)
+      if isinstance(node, ast.Return):
+        outcome = ast.literal_eval(node.value) if node.value is not None else None
+        if outcome not in outcomes:
+          outcomes.append(outcome)
+    return func, sorted(edges), outcomes
+
+  expression_nodes = (
+    ast.Constant,
+    ast.Name,
+    ast.Subscript,
+    ast.UnaryOp,
+    ast.BinOp,
+    ast.Compare,
+    ast.BoolOp,
+    ast.USub,
+    ast.Not,
+    ast.And,
+    ast.Or,
+    ast.Load,
+    *arithmetic_ops,
+    *compare_ops,
+  )
+
+  def check(self, statements: list):
+    for statement in statements:
+      if isinstance(statement, ast.If):
+        for node in ast.walk(statement.test):
+          if (
+            not isinstance(node, self.expression_nodes)
+            or (isinstance(node, ast.Name) and node.id not in ("current_profit", "last_candle"))
+            or (
+              isinstance(node, ast.Subscript)
+              and not (
+                isinstance(node.value, ast.Name)
+                and node.value.id == "last_candle"
+                and isinstance(node.slice, ast.Constant)
+                and isinstance(node.slice.value, str)
+              )
+            )
+          ):
+            raise self.Unsupported(ast.unparse(statement.test)[:80])
+        self.check(statement.body)
+        self.check(statement.orelse)
+      elif isinstance(statement, ast.Return):
+        ast.literal_eval(statement.value) if statement.value is not None else None
+      elif not isinstance(statement, ast.Pass) and not (
+        isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant)
+      ):
+        raise self.Unsupported(ast.unparse(statement)[:80])
+
+  @staticmethod
+  def region(edges: list, profit: float) -> int:
+    # Below the first edge (0), on an edge (odd) or above it (even)
+    position = bisect.bisect_left(edges, profit)
+    if position < len(edges) and edges[position] == profit:
+      return 2 * position + 1
+    return 2 * position
+
+  @staticmethod
+  def points(edges: list) -> list:
+    # A profit per region
+    if not edges:
+      return [0.0]
+    points = [edges[0] - 1.0]
+    for edge, next_edge in zip(edges, edges[1:] + [None]):
+      points.append(edge)
+      points.append((edge + next_edge) / 2.0 if next_edge is not None else edge + 1.0)
+    return points
+
+  def evaluate(self, dataframe: DataFrame) -> dict:
+    """
+    {name: the outcome codes, a (regions, rows) array}.
+    """
+    columns = {}
+    codes = {}
+    for name, (func, edges, outcomes) in self.methods.items():
+      dtype = np.int16 if len(outcomes) < np.iinfo(np.int16).max else np.int32
+      points = self.points(edges)
+      codes[name] = np.zeros((len(points), len(dataframe)), dtype=dtype)
+      for region, profit in enumerate(points):
+        context = (dataframe, columns, profit, outcomes, codes[name][region])
+        self.execute(func.body, np.ones(len(dataframe), dtype=bool), context)
+    return codes
+
+  def execute(self, statements: list, active: np.ndarray, context: tuple) -> np.ndarray:
+    # The rows of "active" that returned
+    returned = np.zeros_like(active)
+    for statement in statements:
+      if not active.any():
+        break
+      if isinstance(statement, ast.If):
+        test = self.value(statement.test, context)
+        if isinstance(test, np.ndarray):
+          test = self.truth(test)
+          returned |= self.execute(statement.body, active & test, context)
+          returned |= self.execute(statement.orelse, active & ~test, context)
+        else:
+          returned |= self.execute(statement.body if test else statement.orelse, active, context)
+      elif isinstance(statement, ast.Return):
+        _, _, _, outcomes, result = context
+        value = ast.literal_eval(statement.value) if statement.value is not None else None
+        result[active] = outcomes.index(value)
+        returned |= active
+      active = active & ~returned
+    return returned
+
+  @staticmethod
+  def truth(value: np.ndarray) -> np.ndarray:
+    # Python truth value, per row
+    if value.dtype.kind == "b":
+      return value
+    if value.dtype.kind in "iuf":
+      return value != 0
+    return np.array([bool(item) for item in value], dtype=bool)
+
+  def value(self, node, context):
+    dataframe, columns, profit, _, _ = context
+    if isinstance(node, ast.Constant):
+      return node.value
+    if isinstance(node, ast.Name) and node.id == "current_profit":
+      return profit
+    if (
+      isinstance(node, ast.Subscript)
+      and isinstance(node.value, ast.Name)
+      and node.value.id == "last_candle"
+      and isinstance(node.slice, ast.Constant)
+    ):
+      if node.slice.value not in columns:
+        columns[node.slice.value] = dataframe[node.slice.value].to_numpy()
+      return columns[node.slice.value]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+      return -self.value(node.operand, context)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+      value = self.value(node.operand, context)
+      return ~self.truth(value) if isinstance(value, np.ndarray) else not value
+    if isinstance(node, ast.BinOp) and type(node.op) in self.arithmetic_ops:
+      with np.errstate(all="ignore"):
+        return self.arithmetic_ops[type(node.op)](self.value(node.left, context), self.value(node.right, context))
+    if isinstance(node, ast.Compare) and all(type(op) in self.compare_ops for op in node.ops):
+      operands = [self.value(operand, context) for operand in [node.left] + node.comparators]
+      result = True
+      for op, left, right in zip(node.ops, operands, operands[1:]):
+        with np.errstate(all="ignore"):
+          compared = self.compare_ops[type(op)](left, right)
+        if isinstance(compared, np.ndarray):
+          result = np.logical_and(result, self.truth(compared))
+        else:
+          result = result and compared
+      return result
+    if isinstance(node, ast.BoolOp):
+      truths = [self.value(value, context) for value in node.values]
+      truths = [self.truth(value) if isinstance(value, np.ndarray) else bool(value) for value in truths]
+      return reduce(np.logical_and if isinstance(node.op, ast.And) else np.logical_or, truths)
+    raise self.Unsupported(ast.unparse(node)[:80])
+
+
+class ThresholdIndex:
+  """
+  Sorted index over the columns of a (pair) dataframe: the candles with "column <op> threshold" are a slice of the
+  column order, found by a binary search for any threshold. NaN never satisfies a comparison, as with pandas.
+  """
+
+  sides = {"<": ("left", True), "<=": ("right", True), ">": ("right", False), ">=": ("left", False)}
+
+  def __init__(self, dataframe: DataFrame):
+    self.dataframe = dataframe
+    self.index = {}
+
+  def column(self, column: str) -> tuple:
+    # The candle positions in the order of the values & the sorted values, built on first use
+    if column not in self.index:
+      values = self.dataframe[column].to_numpy(dtype=np.float64)
+      positions = np.flatnonzero(~np.isnan(values))
+      order = positions[np.argsort(values[positions], kind="stable")]
+      self.index[column] = (order, values[order])
+    return self.index[column]
+
+  def bounds(self, column: str, op: str, threshold: float) -> tuple:
+    _, values = self.column(column)
+    side, below = self.sides[op]
+    position = int(np.searchsorted(values, threshold, side=side))
+    return (0, position) if below else (position, len(values))
+
+  def count(self, column: str, op: str, threshold: float) -> int:
+    start, stop = self.bounds(column, op, threshold)
+    return stop - start
+
+  def candles(self, column: str, op: str, threshold: float) -> np.ndarray:
+    order, _ = self.column(column)
+    start, stop = self.bounds(column, op, threshold)
+    return np.sort(order[start:stop])
+
+  def prefix_counts(self, column: str, mask: np.ndarray) -> np.ndarray:
+    # Running count of a candle mask in the column order, for the counts of "mask & (column <op> threshold)"
+    order, _ = self.column(column)
+    return np.concatenate(([0], np.cumsum(mask[order])))
+
+  def masked_count(self, column: str, op: str, threshold: float, prefix_counts: np.ndarray) -> int:
+    start, stop = self.bounds(column, op, threshold)
+    return int(prefix_counts[stop] - prefix_counts[start])
+
+
+class ThresholdSweep:
+  """
+  Threshold sensitivity of the buy conditions on an analyzed (pair) dataframe. The terms of a condition that compare
+  a column with a constant (and its dips / pumps protection thresholds) are swept on a threshold index: the rest of
+  the condition is evaluated once, the signals for a threshold are then the candles of the term in the rest. The
+  overlap is with the other (compiled and enabled) conditions.
+
+    sweep = ThresholdSweep(strategy, dataframe, {"pair": "ETH/USDT"})
+    sweep.sweep(1).to_csv("condition_1.csv")
+  """
+
+  operators = {operator.lt: "<", operator.le: "<=", operator.gt: ">", operator.ge: ">="}
+  flipped = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+  def __init__(self, strategy, dataframe: DataFrame, metadata: dict, current_free_slots: Optional[int] = None):
+    self.strategy = strategy
+    self.dataframe = dataframe
+    self.plan = strategy.get_buy_conditions_plan()
+    if self.plan is None:
+      self.plan = BuyConditionsPlan(type(strategy), env_names=("current_free_slots",))
+    if current_free_slots is None:
+      current_free_slots = strategy.config["max_open_trades"]
+    self.context = (dataframe, {}, strategy, {"current_free_slots": current_free_slots})
+    self.index = ThresholdIndex(dataframe)
+    self.protection_masks = {}
+    self.common = self.logic_mask(strategy.buy_common_logic(dataframe, metadata))
+    self.signals = {
+      index: self.condition_mask(index)
+      for index in strategy.buy_protection_params
+      if strategy.buy_params[f"buy_condition_{index}_enable"] and index in self.plan.conditions
+    }
+
+  def logic_mask(self, values: list, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    # The "&" of the values, same as the entry logic
+    if mask is None:
+      mask = np.ones(len(self.dataframe), dtype=bool)
+    for value in values:
+      mask = self.plan.accumulate(operator.and_, mask, self.plan.to_numpy(value), self.dataframe)
+    return mask
+
+  def condition_mask(self, index: int, skip=None, protection_params: Optional[dict] = None) -> np.ndarray:
+    # The condition signals, without the "skip" term of the logic
+    if protection_params is None:
+      protection_params = self.strategy.buy_protection_params[index]
+    values = [self.strategy.buy_protection(self.dataframe, protection_params, self.protection_masks)]
+    values += [self.plan.value(item, self.context) for item in self.plan.conditions[index] if item is not skip]
+    return self.logic_mask(values, self.common.copy())
+
+  def terms(self, index: int) -> list:
+    """
+    The (label, column, op, threshold, rest of the condition) of the swept terms of the condition.
+    """
+    terms = []
+    for item in self.plan.conditions[index]:
+      if item.kind != "compare" or item.args[0] not in self.operators:
+        continue
+      op, left, right = item.args
+      op = self.operators[op]
+      if left.kind == "constant" and right.kind == "column":
+        left, right, op = right, left, self.flipped[op]
+      if not (left.kind == "column" and right.kind == "constant"):
+        continue
+      column, threshold = left.args[0], right.args[0]
+      if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or column not in self.dataframe:
+        continue
+      terms.append((f"{column} {op} {threshold}", column, op, threshold, self.condition_mask(index, skip=item)))
+
+    protection_params = self.strategy.buy_protection_params[index]
+    thresholds = [(f"safe_dips_threshold_{period}", f"tpct_change_{period}") for period in (0, 2, 12, 144)]
+    thresholds += [(f"safe_pump_{hours}h_threshold", f"hl_pct_change_{hours}_1h") for hours in (6, 12, 24, 36, 48)]
+    for param, column in thresholds:
+      threshold = protection_params[param]
+      if threshold is None or column not in self.dataframe:
+        continue
+      rest = self.condition_mask(index, protection_params={**protection_params, param: None})
+      terms.append((param, column, "<", threshold, rest))
+    return terms
+
+  def sweep(self, index: int, thresholds: Optional[dict] = None, steps: int = 9, span: float = 0.2) -> DataFrame:
+    """
+    The signals of the condition for each threshold of each term: the given ones (per term label) or "steps" values
+    within +/- "span" (relative) of the current threshold. "overlap" are the signals of other conditions too,
+    "unique" the others, and "overlap_N" the signals shared with condition N.
+    """
+    if index not in self.plan.conditions:
+      raise ValueError(f"Buy condition {index} isn't compiled, it can't be swept")
+    others = {other: mask for other, mask in self.signals.items() if other != index}
+    any_other = reduce(np.logical_or, others.values(), np.zeros(len(self.dataframe), dtype=bool))
+    rows = []
+    for label, column, op, threshold, rest in self.terms(index):
+      prefix_counts = self.index.prefix_counts(column, rest)
+      overlap_counts = self.index.prefix_counts(column, rest & any_other)
+      other_counts = {
+        other: self.index.prefix_counts(column, rest & mask) for other, mask in others.items() if (rest & mask).any()
+      }
+      values = (thresholds or {}).get(label)
+      if values is None:
+        values = threshold + abs(threshold or 1.0) * np.linspace(-span, span, steps)
+      for value in values:
+        signals = self.index.masked_count(column, op, value, prefix_counts)
+        overlap = self.index.masked_count(column, op, value, overlap_counts)
+        rows.append(
+          {
+            "condition": index,
+            "term": label,
+            "column": column,
+            "op": op,
+            "current": threshold,
+            "threshold": float(value),
+            "signals": signals,
+            "overlap": overlap,
+            "unique": signals - overlap,
+            **{
+              f"overlap_{other}": self.index.masked_count(column, op, value, counts)
+              for other, counts in other_counts.items()
+            },
+          }
+        )
+    report = DataFrame(rows)
+    columns = [column for column in report.columns if column.startswith("overlap_")]
+    report[columns] = report[columns].fillna(0).astype(int)
+    return report
+
+
+class EntryProfiler:
+  """
+  Wall time, allocated bytes (the peak traced by "tracemalloc" over the block) and hits of the buy conditions, per
+  condition & pair, split between the standard protections and the condition logic.
+
+  The report is sorted by total time and written to "<path>.json" and "<path>.csv", at most every interval seconds.
+  """
+
+  columns = [
+    "condition",
+    "pair",
+    "calls",
+    "candles",
+    "hits",
+    "protection_time",
+    "logic_time",
+    "total_time",
+    "protection_bytes",
+    "logic_bytes",
+  ]
+
+  def __init__(self, path: pathlib.Path, interval: float):
+    self.path = path
+    self.interval = interval
+    self.stats = {}
+    self.reported = time.perf_counter()
+    if not tracemalloc.is_tracing():
+      tracemalloc.start()
+
+  def start(self) -> tuple:
+    tracemalloc.reset_peak()
+    return time.perf_counter(), tracemalloc.get_traced_memory()[0]
+
+  def record(self, profile: tuple, pair: str, index: int, part: str, candles: int = 0, item_buy=None) -> tuple:
+    # Records the block started at "profile", returns the start of the next block
+    tok = time.perf_counter()
+    allocated = tracemalloc.get_traced_memory()[1] - profile[1]
+    stats = self.stats.get((index, pair))
+    if stats is None:
+      stats = self.stats[(index, pair)] = dict.fromkeys(self.columns[2:], 0)
+    stats[f"{part}_time"] += tok - profile[0]
+    stats[f"{part}_bytes"] += allocated
+    if part == "logic":
+      stats["calls"] += 1
+      stats["candles"] += candles
+      stats["hits"] += int(np.count_nonzero(np.asarray(item_buy, dtype=bool)))
+    return self.start()
+
+  def report(self, force: bool = False):
+    if not force and (time.perf_counter() - self.reported) < self.interval:
+      return
+    self.reported = time.perf_counter()
+    rows = [
+      {"condition": index, "pair": pair, **stats, "total_time": stats["protection_time"] + stats["logic_time"]}
+      for (index, pair), stats in self.stats.items()
+    ]
+    rows.sort(key=lambda row: row["total_time"], reverse=True)
+    try:
+      with self.path.with_name(f"{self.path.name}.json").open("w") as wfh:
+        rapidjson.dump(rows, wfh, indent=2, number_mode=rapidjson.NM_NATIVE)
+      with self.path.with_name(f"{self.path.name}.csv").open("w", newline="") as wfh:
+        writer = csv.DictWriter(wfh, fieldnames=self.columns)
+        writer.writeheader()
+        writer.writerows([{column: row[column] for column in self.columns} for row in rows])
+    except Exception as exc:
+      log.warning("Failed to save the entry profile %s: %s", self.path, exc)
+
+
+class IndicatorCache:
+  """
+  On-disk cache of dataframes, one uncompressed (memory mapped on read) feather file per key.
+
+  The least recently used files (by modification time, touched on every hit) are evicted when the cache grows above
+  the maximum size (MB).
+  """
+
+  def __init__(self, path: pathlib.Path, max_size: float):
+    self.path = path
+    self.max_size = max_size * 1024 * 1024
+    self.path.mkdir(parents=True, exist_ok=True)
+
+  def get(self, key: str) -> Optional[DataFrame]:
+    cache_file = self.path / f"{key}.feather"
+    try:
+      dataframe = feather.read_table(cache_file, memory_map=True).to_pandas()
+    except FileNotFoundError:
+      return None
+    except Exception as exc:
+      log.warning("Failed to load the indicator cache file %s: %s", cache_file, exc)
+      cache_file.unlink(missing_ok=True)
+      return None
+    cache_file.touch()
+    # The missing values of the object columns are loaded as None
+    columns = dataframe.columns[dataframe.dtypes == object]
+    if len(columns) > 0:
+      dataframe[columns] = dataframe[columns].where(dataframe[columns].notna(), np.nan)
+    return dataframe
+
+  def set(self, key: str, dataframe: DataFrame):
+    cache_file = self.path / f"{key}.feather"
+    tmp_file = self.path / f"{key}.tmp"
+    try:
+      dataframe.reset_index(drop=True).to_feather(tmp_file, compression="uncompressed")
+      tmp_file.replace(cache_file)
+    except Exception as exc:
+      log.warning("Failed to save the indicator cache file %s: %s", cache_file, exc)
+      tmp_file.unlink(missing_ok=True)
+      return
+    self.evict()
+
+  def evict(self):
+    cache_files = []
+    for cache_file in self.path.glob("*.feather"):
+      try:
+        stat = cache_file.stat()
+      except FileNotFoundError:
+        continue
+      cache_files.append((stat.st_mtime, stat.st_size, cache_file))
+    size = sum(cache_size for _, cache_size, _ in cache_files)
+    for _, cache_size, cache_file in sorted(cache_files):
+      if size <= self.max_size:
+        break
+      cache_file.unlink(missing_ok=True)
+      size -= cache_size
+      log.debug("Evicted the indicator cache file %s", cache_file)
+
+
+class CandleSnapshot:
+  """
+  The last candles of an analyzed dataframe (the last one first, up to the five previous ones) as dicts of the column
+  values, the same values as the rows ("dataframe.iloc[-k]") with a plain dict lookup per column.
+  """
+
+  __slots__ = ("key", "length", "candles")
+
+  size = 6
+
+  def __init__(self, key: tuple, dataframe: DataFrame):
+    self.key = key
+    self.length = len(dataframe)
+    columns = dataframe.columns
+    self.candles = [
+      dict(zip(columns, dataframe.iloc[-position].to_numpy())) for position in range(1, min(self.size, self.length) + 1)
+    ]
+
+
+class PairMetadata:
+  """
+  The static facts of a pair read by the callbacks & the buy conditions: its leverage token tests (any & long ones).
+  """
+
+  __slots__ = ("pair", "is_leverage", "is_leverage_long")
+
+  def __init__(self, pair: str):
+    self.pair = pair
+    self.is_leverage = bool(re.match(leverage_pattern, pair))
+    self.is_leverage_long = bool(re.match(leverage_pattern_long, pair))
+
+
+class TradeState:
+  """
+  The facts of a trade the callbacks derive from its tag & filled orders: the enter tag (and its bits), the number of
+  filled entries & buys, the cost of the initial entry and its average (the max profit/loss basis once rebought). Keyed
+  on the trade, its amount & its number of orders, so a fill or a new order rebuilds it.
+  """
+
+  __slots__ = (
+    "key",
+    "enter_tag",
+    "enter_bits",
+    "count_of_entries",
+    "count_of_buys",
+    "initial_entry_cost",
+    "initial_entry_average",
+  )
+
+  def __init__(self, key: tuple, trade: "Trade"):
+    self.key = key
+    self.enter_tag = "empty"
+    if hasattr(trade, "enter_tag") and trade.enter_tag is not None:
+      self.enter_tag = trade.enter_tag
+    self.enter_bits = enter_tag_bits(self.enter_tag)
+    filled_entries = []
+    self.count_of_entries = 0
+    self.count_of_buys = 1
+    if hasattr(trade, "select_filled_orders"):
+      filled_buys = trade.select_filled_orders("buy")
+      self.count_of_buys = len(filled_buys)
+      if hasattr(trade, "enter_side"):
+        filled_entries = trade.select_filled_orders(trade.enter_side)
+        self.count_of_entries = trade.nr_of_successful_entries
+      else:
+        filled_entries = filled_buys
+        self.count_of_entries = len(filled_buys)
+    self.initial_entry_cost = filled_entries[0].cost if filled_entries else None
+    self.initial_entry_average = None
+    if self.count_of_entries > 1:
+      initial_entry = filled_entries[0]
+      if initial_entry is not None and initial_entry.average is not None:
+        self.initial_entry_average = initial_entry.average
+
+
 class Cache:
   def __init__(self, path):
     self.path = path
@@ -38841,6 +41263,55 @@ class Cache:
 
 
 class HoldsCache(Cache):
+  """
+  The hold trades config, loaded once on the bot loop then watched: a background thread reloads it when the file
+  changes (inotify, or a stat every "poll_interval" seconds without it), so the hold checks only read "data", the
+  trade ids and the pairs to hold.
+  """
+
+  # Seconds between two checks of the file when inotify isn't available
+  poll_interval = 5.0
+
+  def __init__(self, path):
+    self._watcher = None
+    super().__init__(path)
+
+  def load(self):
+    # Once watched the file is only reloaded by the watcher, off the bot loop
+    if self._watcher is None:
+      super().load()
+      self._watcher = threading.Thread(target=self._watch, name="nfi-holds-watcher", daemon=True)
+      self._watcher.start()
+
+  def _watch(self):
+    if inotify_simple is not None:
+      try:
+        self._watch_inotify()
+      except Exception as exc:
+        log.warning("Failed to watch %s with inotify, polling it: %s", self.path, exc)
+      else:
+        return
+    while True:
+      time.sleep(self.poll_interval)
+      self._reload()
+
+  def _watch_inotify(self):
+    # The directory is watched, editors replace the file rather than writing it
+    inotify = inotify_simple.INotify()
+    flags = inotify_simple.flags
+    inotify.add_watch(self.path.parent, flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE)
+    while True:
+      if any(event.name == self.path.name for event in inotify.read(read_delay=100)):
+        self._reload()
+
+  def _reload(self):
+    try:
+      super().load()
+    except FileNotFoundError:
+      pass
+    except Exception as exc:
+      log.warning("Failed to reload the hold trades config from %s: %s", self.path, exc)
+
   @staticmethod
   def rapidjson_load_kwargs():
     return {
@@ -38974,3 +41445,583 @@ class HoldsCache(Cache):
         pass
       _data[key] = value
     return _data
+
+
+class ProfitTargetStore(Cache):
+  """
+  The profit maximizer targets, written behind the bot loop: "save()" only marks the data as updated, a background
+  thread writes it once no update came for "delay" seconds (at most "max_delay" seconds after the first unsaved
+  update) and "flush()" writes it on exit. The JSON file is replaced atomically (temporary file & rename).
+
+  With the "sqlite" backend the target of a pair is kept in the custom data of its open trade (tradesv3.sqlite)
+  instead, loaded by "load_custom_data()" once the database is up.
+  """
+
+  custom_data_key = "nfi_profit_target"
+
+  def __init__(self, path, backend="json", delay=1.0, max_delay=10.0):
+    self.backend = backend
+    self.delay = delay
+    self.max_delay = max_delay
+    self._lock = threading.Lock()
+    self._updated = threading.Condition(self._lock)
+    self._write_lock = threading.Lock()
+    self._first_update = None
+    self._last_update = None
+    self._thread = None
+    super().__init__(path)
+    atexit.register(self.flush)
+
+  def load(self):
+    # The "sqlite" backend is loaded from the open trades, the database isn't up when the strategy is created
+    if self.backend == "json":
+      super().load()
+
+  def load_custom_data(self):
+    data = {}
+    for trade in Trade.get_trades_proxy(is_open=True):
+      target = trade.get_custom_data(self.custom_data_key)
+      if target is not None:
+        data[trade.pair] = target
+    self.data = data
+    self._previous_data = dict(data)
+
+  def save(self):
+    now = time.monotonic()
+    with self._lock:
+      if self._first_update is None:
+        self._first_update = now
+      self._last_update = now
+      if self._thread is None:
+        self._thread = threading.Thread(target=self._run, name="nfi-profit-targets", daemon=True)
+        self._thread.start()
+      self._updated.notify()
+
+  def flush(self):
+    with self._lock:
+      self._first_update = None
+    self._write()
+
+  def _run(self):
+    while True:
+      with self._lock:
+        while self._first_update is None:
+          self._updated.wait()
+        while self._first_update is not None:
+          wait = min(self._last_update + self.delay, self._first_update + self.max_delay) - time.monotonic()
+          if wait <= 0:
+            break
+          self._updated.wait(wait)
+        if self._first_update is None:
+          # Flushed meanwhile
+          continue
+        self._first_update = None
+      self._write()
+
+  def _write(self):
+    with self._write_lock:
+      # The targets are replaced, never changed in place, a shallow copy (atomic under the GIL) is a snapshot
+      data = dict(self.data)
+      if data == self._previous_data:
+        return
+      try:
+        if self.backend == "sqlite":
+          self._save_custom_data(data)
+        else:
+          self._save_file(data)
+      except Exception as exc:
+        log.warning("Failed to save the profit targets to %s: %s", self.path, exc)
+        return
+      self._previous_data = data
+
+  def _save_file(self, data):
+    path = self.path.with_name(self.path.name + ".tmp")
+    with path.open("w") as wfh:
+      rapidjson.dump(data, wfh, **self.rapidjson_dump_kwargs())
+    os.replace(path, self.path)
+    self._mtime = self.path.stat().st_mtime_ns
+
+  def _save_custom_data(self, data):
+    for pair in self._previous_data.keys() | data.keys():
+      target = data.get(pair)
+      if target == self._previous_data.get(pair):
+        continue
+      for trade in Trade.get_trades_proxy(pair=pair, is_open=True):
+        if target is None:
+          trade.delete_custom_data(self.custom_data_key)
+        else:
+          trade.set_custom_data(self.custom_data_key, target)
+
+
+class IncrementalIndicators:
+  """
+  Per pair state of the normal timeframe indicators.
+
+  Holds the indicator columns of the last full analysis, along with the hidden state of the recursive
+  indicators (EMA/RSI/ADX/KAMA accumulators), so that on a new candle only the new row(s) are computed. The
+  formulas mirror the ones used in normal_tf_indicators (TA-Lib, qtpylib, pandas_ta & the helpers below).
+  """
+
+  rsi_periods = {"rsi_4": 4, "rsi_14": 14, "rsi_84": 84, "rsi_112": 112, "crsi_3": 3, "srsi_15": 15}
+  ema_periods = {
+    "ema_8": 8,
+    "ema_12": 12,
+    "ema_13": 13,
+    "ema_16": 16,
+    "ema_20": 20,
+    "ema_25": 25,
+    "ema_26": 26,
+    "ema_50": 50,
+    "ema_100": 100,
+    "ema_200": 200,
+  }
+  sma_periods = {"sma_15": 15, "sma_28": 28, "sma_30": 30, "sma_75": 75, "sma_200": 200}
+  williams_r_periods = {"r_14": 14, "r_24": 24, "r_32": 32, "r_64": 64, "r_96": 96, "r_480": 480}
+  ema_vwma_osc_periods = {"ema_vwma_osc_32": 32, "ema_vwma_osc_64": 64, "ema_vwma_osc_96": 96}
+  adx_period = 14
+  kama_period = 84
+  t3_length = 5
+  rmi_length = 17
+  rmi_mom = 4
+  srsi_fastk_period = 20
+
+  def __init__(self, dataframe: DataFrame, columns: list, timeframe: str, min_candles: int):
+    self.columns = columns
+    self.min_candles = min_candles
+    self.timeframe_ns = timeframe_to_minutes(timeframe) * 60 * 1_000_000_000
+    self.dates = self._dates(dataframe)
+    self.ohlcv = self._ohlcv(dataframe)
+    self.values = {column: dataframe[column].to_numpy(copy=True) for column in columns}
+
+    close = self.ohlcv["close"]
+    self.rsi = {}
+    for column, period in self.rsi_periods.items():
+      self.rsi[column] = self._rsi_state(close, period)
+    self.rsi["crsi_2"] = self._rsi_state(self._updown(close), 2)
+    self.srsi = deque(ta.RSI(close, timeperiod=15)[-self.srsi_fastk_period :], maxlen=self.srsi_fastk_period)
+    self.adx = self._adx_state(self.ohlcv["high"], self.ohlcv["low"], close, self.adx_period)
+    self.kama_sum_roc1 = self._kama_state(close, self.kama_period)
+
+    xe = close
+    self.t3 = []
+    for _ in range(6):
+      xe = np.nan_to_num(ta.EMA(xe, timeperiod=self.t3_length))
+      self.t3.append(xe[-1])
+
+    self.ema_vwma = {}
+    for column, period in self.ema_vwma_osc_periods.items():
+      self.ema_vwma[column] = np.asarray(ta.EMA(vwma(dataframe, period), period))[-1]
+
+    close_mom = np.full_like(close, np.nan)
+    close_mom[self.rmi_mom :] = close[: -self.rmi_mom]
+    self.rmi_inc = ta.EMA(np.nan_to_num(np.clip(close - close_mom, 0, None)), timeperiod=self.rmi_length)[-1]
+    self.rmi_dec = ta.EMA(np.nan_to_num(np.clip(close_mom - close, 0, None)), timeperiod=self.rmi_length)[-1]
+
+  @staticmethod
+  def _dates(dataframe: DataFrame) -> np.ndarray:
+    return dataframe["date"].to_numpy(dtype="datetime64[ns]").view("int64")
+
+  @staticmethod
+  def _ohlcv(dataframe: DataFrame) -> dict:
+    return {column: dataframe[column].to_numpy(dtype=np.float64) for column in ["open", "high", "low", "close", "volume"]}
+
+  @staticmethod
+  def _updown(close: np.ndarray) -> np.ndarray:
+    closechange = np.full_like(close, np.nan)
+    closechange[1:] = close[1:] / close[:-1]
+    return np.where(closechange > 1, 1.0, np.where(closechange < 1, -1.0, 0.0))
+
+  @staticmethod
+  def _true_range(high: float, low: float, prev_close: float) -> float:
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+  @staticmethod
+  def _rsi_state(values: np.ndarray, period: int) -> list:
+    # Replays TA-Lib RSI, returns the [gain, loss] averages at the last row
+    gain = loss = 0.0
+    for i in range(1, period + 1):
+      diff = values[i] - values[i - 1]
+      if diff < 0:
+        loss -= diff
+      else:
+        gain += diff
+    gain /= period
+    loss /= period
+    state = [gain, loss]
+    for i in range(period + 1, len(values)):
+      IncrementalIndicators._rsi_step(state, values[i] - values[i - 1], period)
+    return state
+
+  @staticmethod
+  def _rsi_step(state: list, diff: float, period: int) -> float:
+    gain = state[0] * (period - 1)
+    loss = state[1] * (period - 1)
+    if diff < 0:
+      loss -= diff
+    else:
+      gain += diff
+    gain /= period
+    loss /= period
+    state[0] = gain
+    state[1] = loss
+    total = gain + loss
+    if -1e-8 < total < 1e-8:
+      return 0.0
+    return 100.0 * (gain / total)
+
+  @staticmethod
+  def _adx_state(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> list:
+    # Replays TA-Lib ADX, returns the smoothed [minus_dm, plus_dm, true_range] at the last row
+    state = [0.0, 0.0, 0.0]
+    for i in range(1, len(close)):
+      IncrementalIndicators._adx_step(state, high, low, close, i, period, i >= period)
+    return state
+
+  @staticmethod
+  def _adx_step(state: list, high, low, close, i: int, period: int, smooth: bool = True) -> Optional[float]:
+    minus_dm, plus_dm, true_range = state
+    diff_p = high[i] - high[i - 1]
+    diff_m = low[i - 1] - low[i]
+    if smooth:
+      minus_dm -= minus_dm / period
+      plus_dm -= plus_dm / period
+    if diff_m > 0 and diff_p < diff_m:
+      minus_dm += diff_m
+    elif diff_p > 0 and diff_p > diff_m:
+      plus_dm += diff_p
+    tr = IncrementalIndicators._true_range(high[i], low[i], close[i - 1])
+    true_range = (true_range - (true_range / period) + tr) if smooth else (true_range + tr)
+    state[0] = minus_dm
+    state[1] = plus_dm
+    state[2] = true_range
+    if -1e-8 < true_range < 1e-8:
+      return None
+    minus_di = 100.0 * (minus_dm / true_range)
+    plus_di = 100.0 * (plus_dm / true_range)
+    total = minus_di + plus_di
+    if -1e-8 < total < 1e-8:
+      return None
+    return 100.0 * (abs(minus_di - plus_di) / total)
+
+  @staticmethod
+  def _kama_state(close: np.ndarray, period: int) -> float:
+    # Replays TA-Lib KAMA, returns the running sum of the absolute 1 period changes
+    sum_roc1 = 0.0
+    for i in range(period):
+      sum_roc1 += abs(close[i] - close[i + 1])
+    for i in range(period + 1, len(close)):
+      sum_roc1 -= abs(close[i - period - 1] - close[i - period])
+      sum_roc1 += abs(close[i] - close[i - 1])
+    return sum_roc1
+
+  def update(self, dataframe: DataFrame, max_new_candles: int) -> Optional[DataFrame]:
+    """
+    Compute the indicators of the new candle(s) on top of the current state.
+
+    Returns the indicator columns for the whole dataframe, or None if the dataframe can't be continued from
+    the current state (gap, changed history, too many new candles), in which case a full recompute is needed.
+    """
+    dates = self._dates(dataframe)
+    num_rows = len(dates)
+    if num_rows < self.min_candles:
+      return None
+    pos = int(np.searchsorted(dates, self.dates[-1]))
+    if pos >= num_rows or dates[pos] != self.dates[-1]:
+      return None
+    num_new = num_rows - 1 - pos
+    if num_new > max_new_candles or pos >= len(self.dates):
+      return None
+    overlap = slice(len(self.dates) - pos - 1, len(self.dates))
+    if not np.array_equal(dates[: pos + 1], self.dates[overlap]):
+      return None
+    if num_new > 0 and (np.diff(dates[pos:]) != self.timeframe_ns).any():
+      return None
+    ohlcv = self._ohlcv(dataframe)
+    for column, values in ohlcv.items():
+      if not np.array_equal(values[: pos + 1], self.ohlcv[column][overlap], equal_nan=True):
+        return None
+
+    values = {}
+    for column, stored in self.values.items():
+      values[column] = np.concatenate((stored[overlap], np.empty(num_new, dtype=stored.dtype)))
+    if num_new > 0:
+      with np.errstate(divide="ignore", invalid="ignore"):
+        self._compute(values, ohlcv, num_rows - num_new, num_rows)
+
+    self.dates = dates
+    self.ohlcv = ohlcv
+    self.values = values
+
+    return DataFrame({column: values[column] for column in self.columns}, index=dataframe.index)
+
+  def _compute(self, values: dict, ohlcv: dict, start: int, end: int):
+    new = slice(start, end)
+    prev = slice(start - 1, end - 1)
+    open_ = ohlcv["open"]
+    high = ohlcv["high"]
+    low = ohlcv["low"]
+    close = ohlcv["close"]
+    volume = ohlcv["volume"]
+
+    def windows(data, length, shift=0):
+      return sliding_window_view(data[start - length + 1 - shift : end - shift], length)
+
+    # RSI
+    for t in range(start, end):
+      diff = close[t] - close[t - 1]
+      for column in ["rsi_4", "rsi_14", "rsi_84", "rsi_112"]:
+        values[column][t] = self._rsi_step(self.rsi[column], diff, self.rsi_periods[column])
+
+    # EMAs
+    for column, period in self.ema_periods.items():
+      ema = values[column]
+      k = 2.0 / (period + 1)
+      for t in range(start, end):
+        ema[t] = ((close[t] - ema[t - 1]) * k) + ema[t - 1]
+
+    ema_200 = values["ema_200"]
+    for shift in [144, 288]:
+      values[f"ema_200_pct_change_{shift}"][new] = (ema_200[new] - ema_200[start - shift : end - shift]) / ema_200[
+        start - shift : end - shift
+      ]
+
+    # SMA
+    for column, period in self.sma_periods.items():
+      values[column][new] = windows(close, period).mean(axis=1)
+    sma_200 = values["sma_200"]
+    for shift in [20, 24]:
+      values[f"sma_200_dec_{shift}"][new] = sma_200[new] < sma_200[start - shift : end - shift]
+
+    # BB 40 - STD2
+    bb40_mid = windows(close, 40).mean(axis=1)
+    bb40_low = bb40_mid - windows(close, 40).std(axis=1, ddof=1) * 2
+    values["bb40_2_low"][new] = bb40_low
+    values["bb40_2_mid"][new] = bb40_mid
+    values["bb40_2_delta"][new] = np.abs(bb40_mid - bb40_low)
+    values["closedelta"][new] = np.abs(close[new] - close[prev])
+    values["tail"][new] = np.abs(close[new] - bb40_low)
+
+    # BB 20 - STD2 & STD3
+    typical = (high + low + close) / 3.0
+    bb20_mid = windows(typical, 20).mean(axis=1)
+    bb20_std = windows(typical, 20).std(axis=1, ddof=1)
+    for stds in [2, 3]:
+      values[f"bb20_{stds}_low"][new] = bb20_mid - bb20_std * stds
+      values[f"bb20_{stds}_mid"][new] = bb20_mid
+      values[f"bb20_{stds}_upp"][new] = bb20_mid + bb20_std * stds
+    values["bb20_width"][new] = (values["bb20_2_upp"][new] - values["bb20_2_low"][new]) / values["bb20_2_mid"][new]
+    values["bb20_delta"][new] = (values["bb20_2_low"][new] - values["bb20_3_low"][new]) / values["bb20_2_low"][new]
+
+    # CMF
+    mfv = np.nan_to_num(((close - low) - (high - close)) / (high - low), nan=0.0, posinf=np.inf, neginf=-np.inf)
+    mfv *= volume
+    values["cmf"][new] = windows(mfv, 20).sum(axis=1) / windows(volume, 20).sum(axis=1)
+
+    # Williams %R
+    for column, period in self.williams_r_periods.items():
+      highest_high = windows(high, period).max(axis=1)
+      lowest_low = windows(low, period).min(axis=1)
+      values[column][new] = ((highest_high - close[new]) / (highest_high - lowest_low)) * -100
+
+    # CTI
+    length = 20
+    x = np.arange(1, length + 1)
+    x_sum = 0.5 * length * (length + 1)
+    x2_sum = x_sum * (2 * length + 1) / 3
+    divisor = length * x2_sum - x_sum * x_sum
+    for t, series in zip(range(start, end), windows(close, length)):
+      y_sum = series.sum()
+      xy_sum = (x * series).sum()
+      y2_sum = (series * series).sum()
+      rn = length * xy_sum - x_sum * y_sum
+      rd = (divisor * (length * y2_sum - y_sum * y_sum)) ** 0.5
+      values["cti"][t] = rn / rd
+
+    # CRSI (3, 2, 100)
+    updown = self._updown(close[start - 2 : end])
+    for t in range(start, end):
+      rsi_3 = self._rsi_step(self.rsi["crsi_3"], close[t] - close[t - 1], 3)
+      rsi_2 = self._rsi_step(self.rsi["crsi_2"], updown[t - start + 2] - updown[t - start + 1], 2)
+      roc = ((close[t] / close[t - 100]) - 1.0) * 100.0 if close[t - 100] != 0.0 else 0.0
+      values["crsi"][t] = (rsi_3 + rsi_2 + roc) / 3
+
+    # EMA of VWMA Oscillator
+    pv = close * volume
+    for column, period in self.ema_vwma_osc_periods.items():
+      vwma_ = np.nan_to_num(windows(pv, period).mean(axis=1) / windows(volume, period).mean(axis=1), nan=0.0)
+      k = 2.0 / (period + 1)
+      for t, value in zip(range(start, end), vwma_):
+        prev_ema = self.ema_vwma[column]
+        self.ema_vwma[column] = ((value - prev_ema) * k) + prev_ema
+        values[column][t] = ((self.ema_vwma[column] - prev_ema) / prev_ema) * 100
+
+    # EWO
+    values["ewo"][new] = (values["ema_50"][new] - values["ema_200"][new]) / close[new] * 100
+
+    # CCI
+    for column, period in [("cci", 20), ("cci_25", 25)]:
+      for t, series in zip(range(start, end), windows(typical, period)):
+        average = series.sum() / period
+        mean_dev = np.abs(series - average).sum()
+        diff = typical[t] - average
+        values[column][t] = diff / (0.015 * (mean_dev / period)) if (diff != 0.0 and mean_dev != 0.0) else 0.0
+
+    # MFI
+    money_flow = typical * volume
+    typical_diff = np.zeros_like(typical)
+    typical_diff[1:] = typical[1:] - typical[:-1]
+    pos_mf = windows(np.where(typical_diff > 0, money_flow, 0.0), 14).sum(axis=1)
+    neg_mf = windows(np.where(typical_diff < 0, money_flow, 0.0), 14).sum(axis=1)
+    total_mf = pos_mf + neg_mf
+    values["mfi"][new] = np.where(total_mf < 1.0, 0.0, 100.0 * (pos_mf / total_mf))
+
+    # RMI
+    k = 2.0 / (self.rmi_length + 1)
+    for t in range(start, end):
+      momentum = close[t] - close[t - self.rmi_mom]
+      self.rmi_inc = ((max(momentum, 0.0) - self.rmi_inc) * k) + self.rmi_inc
+      self.rmi_dec = ((max(-momentum, 0.0) - self.rmi_dec) * k) + self.rmi_dec
+      values["rmi_17"][t] = 0 if self.rmi_dec == 0 else 100 - 100 / (1 + self.rmi_inc / self.rmi_dec)
+
+    # Stochastic fast
+    fastk = values["fastk"]
+    for t, lowest, highest in zip(
+      range(start, end), windows(low, 5).min(axis=1), windows(high, 5).max(axis=1)
+    ):
+      diff = (highest - lowest) / 100.0
+      fastk[t] = (close[t] - lowest) / diff if diff != 0.0 else 0.0
+    values["fastd"][new] = windows(fastk, 3).mean(axis=1)
+
+    # ADX
+    adx = values["adx"]
+    for t in range(start, end):
+      dx = self._adx_step(self.adx, high, low, close, t, self.adx_period)
+      adx[t] = adx[t - 1] if dx is None else ((adx[t - 1] * (self.adx_period - 1)) + dx) / self.adx_period
+
+    # STOCHRSI
+    for t in range(start, end):
+      self.srsi.append(self._rsi_step(self.rsi["srsi_15"], close[t] - close[t - 1], 15))
+      lowest = min(self.srsi)
+      diff = (max(self.srsi) - lowest) / 100.0
+      values["srsi_fk"][t] = (self.srsi[-1] - lowest) / diff if diff != 0.0 else 0.0
+      values["srsi_fd"][t] = (values["srsi_fk"][t - 1] + values["srsi_fk"][t] * 2) / 3
+
+    # Close delta
+    values["close_delta"][new] = np.abs(close[new] - close[prev])
+
+    # T3 Average
+    k = 2.0 / (self.t3_length + 1)
+    b = 0.7
+    c1 = -b * b * b
+    c2 = 3 * b * b + 3 * b * b * b
+    c3 = -6 * b * b - 3 * b - 3 * b * b * b
+    c4 = 1 + 3 * b + b * b * b + 3 * b * b
+    for t in range(start, end):
+      value = close[t]
+      for i in range(6):
+        self.t3[i] = ((value - self.t3[i]) * k) + self.t3[i]
+        value = self.t3[i]
+      values["t3_avg"][t] = c1 * self.t3[5] + c2 * self.t3[4] + c3 * self.t3[3] + c4 * self.t3[2]
+
+    # Heiken Ashi
+    ha_open = values["ha_open"]
+    ha_close = values["ha_close"]
+    ha_close[new] = (open_[new] + high[new] + low[new] + close[new]) / 4
+    for t in range(start, end):
+      ha_open[t] = (ha_open[t - 1] + ha_close[t - 1]) / 2
+    values["ha_high"][new] = np.maximum(np.maximum(high[new], ha_open[new]), ha_close[new])
+    values["ha_low"][new] = np.minimum(np.minimum(low[new], ha_open[new]), ha_close[new])
+    values["ha_closedelta"][new] = np.abs(ha_close[new] - ha_close[prev])
+    values["ha_tail"][new] = np.abs(ha_close[new] - values["ha_low"][new])
+
+    # True range
+    trange = values["trange"]
+    for t in range(start, end):
+      trange[t] = self._true_range(high[t], low[t], close[t - 1])
+
+    # KC
+    values["range_ma_28"][new] = windows(trange, 28).mean(axis=1)
+    values["kc_upperband_28_1"][new] = values["sma_28"][new] + values["range_ma_28"][new]
+    values["kc_lowerband_28_1"][new] = values["sma_28"][new] - values["range_ma_28"][new]
+
+    # Linreg
+    values["hh_20"][new] = windows(high, 20).max(axis=1)
+    values["ll_20"][new] = windows(low, 20).min(axis=1)
+    values["avg_hh_ll_20"][new] = (values["hh_20"][new] + values["ll_20"][new]) / 2.0
+    values["avg_close_20"][new] = windows(close, 20).mean(axis=1)
+    values["avg_val_20"][new] = (values["avg_hh_ll_20"][new] + values["avg_close_20"][new]) / 2.0
+    length = 20
+    sum_x = length * (length - 1) * 0.5
+    sum_x_sqr = length * (length - 1) * (length * 2 - 1) // 6
+    divisor = sum_x * sum_x - length * sum_x_sqr
+    x = np.arange(length - 1, -1, -1, dtype=np.float64)
+    for t, series in zip(range(start, end), windows(close - values["avg_val_20"], length)):
+      sum_y = series.sum()
+      m = (length * (x * series).sum() - sum_x * sum_y) / divisor
+      values["linreg_val_20"][t] = ((sum_y - m * sum_x) / length) + m * (length - 1)
+
+    # MAMA, FAMA, KAMA
+    hl2 = (high + low) / 2.0
+    values["hl2"][new] = hl2[new]
+    mama, fama = ta.MAMA(hl2, 0.25, 0.025)
+    values["mama"][new] = mama[new]
+    values["fama"][new] = fama[new]
+    values["mama_diff"][new] = (mama[new] - fama[new]) / hl2[new]
+    kama = values["kama"]
+    const_max = 2.0 / (30.0 + 1.0)
+    const_diff = 2.0 / (2.0 + 1.0) - const_max
+    for t in range(start, end):
+      period_roc = close[t] - close[t - self.kama_period]
+      self.kama_sum_roc1 -= abs(close[t - self.kama_period - 1] - close[t - self.kama_period])
+      self.kama_sum_roc1 += abs(close[t] - close[t - 1])
+      if (self.kama_sum_roc1 <= period_roc) or (-1e-8 < self.kama_sum_roc1 < 1e-8):
+        efficiency_ratio = 1.0
+      else:
+        efficiency_ratio = abs(period_roc / self.kama_sum_roc1)
+      smoothing = (efficiency_ratio * const_diff) + const_max
+      smoothing *= smoothing
+      kama[t] = ((close[t] - kama[t - 1]) * smoothing) + kama[t - 1]
+
+    # Close max
+    values["close_max_48"][new] = windows(close, 48).max(axis=1)
+    values["close_max_288"][new] = windows(close, 288).max(axis=1)
+
+    # VWAP
+    vwap = values["vwap_middleband"]
+    vwap[new] = windows(volume * typical, 20).sum(axis=1) / windows(volume, 20).sum(axis=1)
+    for t in range(start, end):
+      if not np.isfinite(vwap[t]):
+        vwap[t] = vwap[t - 1]
+    vwap_std = windows(vwap, 20).std(axis=1, ddof=1)
+    values["vwap_upperband"][new] = vwap[new] + (vwap_std * 1)
+    values["vwap_lowerband"][new] = vwap[new] - (vwap_std * 1)
+    values["vwap_width"][new] = (
+      (values["vwap_upperband"][new] - values["vwap_lowerband"][new]) / vwap[new]
+    ) * 100
+
+    # ATR
+    atr = values["atr"]
+    for t in range(start, end):
+      atr[t] = ((atr[t - 1] * (14 - 1)) + trange[t]) / 14
+
+    # For sell checks
+    ema_12 = values["ema_12"]
+    ema_26 = values["ema_26"]
+    values["crossed_below_ema_12_26"][new] = (ema_12[new] < ema_26[new]) & (ema_12[prev] >= ema_26[prev])
+
+    # Volume
+    values["vma_10"][new] = windows(volume, 10).mean(axis=1)
+    values["vma_20"][new] = windows(volume, 20).mean(axis=1)
+    values["vol_osc"][new] = (values["vma_10"][new] - values["vma_20"][new]) / values["vma_20"][new] * 100
+    for period in [4, 12, 24]:
+      values[f"volume_mean_{period}"][new] = windows(volume, period, shift=1).mean(axis=1)
+
+    # Dip protection
+    values["tpct_change_0"][new] = (open_[new] - close[new]) / close[new]
+    for period in [2, 12, 144]:
+      values[f"tpct_change_{period}"][new] = (windows(open_, period).max(axis=1) - close[new]) / close[new]
+    lowest_low = windows(low, 36).min(axis=1)
+    values["hl_pct_change_36"][new] = (windows(high, 36).max(axis=1) - lowest_low) / lowest_low
+
+    # Exchange downtime protection
+    values["live_data_ok"][new] = windows(volume, 72).min(axis=1) > 0